@@ -6,6 +6,7 @@ from sqlalchemy import engine_from_config, pool
 from app import repositories  # noqa: F401
 from app.core.config import settings
 from app.core.database import Base
+from app.repositories.equipment import EQUIPMENT_SEARCH_TABLE
 
 config = context.config
 
@@ -27,6 +28,16 @@ if config.config_file_name is not None:
 target_metadata = Base.metadata
 
 
+def include_object(object_, name, type_, reflected, compare_to) -> bool:
+    """Keep autogenerate away from the SQLite FTS5 search table and its shadow tables.
+
+    They are created by raw DDL in the search migration, not declared on the metadata.
+    """
+    if type_ == "table" and reflected and compare_to is None:
+        return not (name == EQUIPMENT_SEARCH_TABLE or name.startswith(f"{EQUIPMENT_SEARCH_TABLE}_"))
+    return True
+
+
 def run_migrations_offline() -> None:
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
@@ -34,6 +45,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -48,7 +60,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
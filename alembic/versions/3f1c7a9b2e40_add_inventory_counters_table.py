@@ -0,0 +1,59 @@
+"""add inventory counters table
+
+Revision ID: 3f1c7a9b2e40
+Revises: 6033edb7cf56
+Create Date: 2026-10-18 09:12:44.318205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c7a9b2e40'
+down_revision: Union[str, Sequence[str], None] = '6033edb7cf56'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('inventory_counters',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('resource', sa.String(length=40), nullable=False),
+    sa.Column('organization_id', sa.Integer(), nullable=False),
+    sa.Column('department_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=40), nullable=False),
+    sa.Column('count', sa.Integer(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('resource', 'organization_id', 'department_id', 'status', name='uq_inventory_counters_key')
+    )
+    op.create_index(op.f('ix_inventory_counters_organization_id'), 'inventory_counters', ['organization_id'], unique=False)
+
+    # Backfill from existing rows; enum columns store member names, counters store values.
+    op.execute(
+        """
+        INSERT INTO inventory_counters (resource, organization_id, department_id, status, count)
+        SELECT 'equipment', d.organization_id, e.department_id, lower(e.status), count(*)
+        FROM equipment e
+        JOIN departments d ON d.id = e.department_id
+        GROUP BY d.organization_id, e.department_id, lower(e.status)
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO inventory_counters (resource, organization_id, department_id, status, count)
+        SELECT 'equipment_request', r.organization_id, e.department_id, lower(r.status), count(*)
+        FROM equipment_requests r
+        JOIN equipment e ON e.id = r.equipment_id
+        GROUP BY r.organization_id, e.department_id, lower(r.status)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_inventory_counters_organization_id'), table_name='inventory_counters')
+    op.drop_table('inventory_counters')
@@ -0,0 +1,72 @@
+"""add equipment search index
+
+Revision ID: 5e1b9c7d3f20
+Revises: a7d3e5b28c14
+Create Date: 2026-10-18 15:40:26.884105
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e1b9c7d3f20'
+down_revision: Union[str, Sequence[str], None] = 'a7d3e5b28c14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of the FTS5 table and triggers as of this revision (see
+# app/repositories/equipment.py, which creates them for fresh test schemas).
+SQLITE_SEARCH_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS equipment_search USING fts5(
+        name, manufacturer, model_number,
+        content='equipment', content_rowid='id', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS equipment_search_ai AFTER INSERT ON equipment BEGIN
+        INSERT INTO equipment_search(rowid, name, manufacturer, model_number)
+        VALUES (new.id, new.name, new.manufacturer, new.model_number);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS equipment_search_ad AFTER DELETE ON equipment BEGIN
+        INSERT INTO equipment_search(equipment_search, rowid, name, manufacturer, model_number)
+        VALUES ('delete', old.id, old.name, old.manufacturer, old.model_number);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS equipment_search_au
+    AFTER UPDATE OF name, manufacturer, model_number ON equipment BEGIN
+        INSERT INTO equipment_search(equipment_search, rowid, name, manufacturer, model_number)
+        VALUES ('delete', old.id, old.name, old.manufacturer, old.model_number);
+        INSERT INTO equipment_search(rowid, name, manufacturer, model_number)
+        VALUES (new.id, new.name, new.manufacturer, new.model_number);
+    END""",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == 'sqlite':
+        for statement in SQLITE_SEARCH_DDL:
+            op.execute(statement)
+        # Index the rows that already exist; the triggers keep it current from here on.
+        op.execute("INSERT INTO equipment_search(equipment_search) VALUES ('rebuild')")
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_equipment_search_trgm',
+        'equipment',
+        [sa.text("lower(name || ' ' || manufacturer || ' ' || model_number) gin_trgm_ops")],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'sqlite':
+        for trigger in ('equipment_search_ai', 'equipment_search_ad', 'equipment_search_au'):
+            op.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+        op.execute('DROP TABLE IF EXISTS equipment_search')
+        return
+
+    op.drop_index('ix_equipment_search_trgm', table_name='equipment', postgresql_using='gin')
@@ -0,0 +1,37 @@
+"""add pending request unique index
+
+Revision ID: 8b2d4e6f1a93
+Revises: 3f1c7a9b2e40
+Create Date: 2026-10-18 10:02:17.540231
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2d4e6f1a93'
+down_revision: Union[str, Sequence[str], None] = '3f1c7a9b2e40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Enum columns store member names, hence 'PENDING'.
+    # Existing duplicate pending rows must be resolved before this index can be built.
+    op.create_index(
+        'uq_equipment_requests_pending_requester',
+        'equipment_requests',
+        ['equipment_id', 'organization_id', sa.text('lower(requested_by)')],
+        unique=True,
+        postgresql_where=sa.text("status = 'PENDING'"),
+        sqlite_where=sa.text("status = 'PENDING'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_equipment_requests_pending_requester', table_name='equipment_requests')
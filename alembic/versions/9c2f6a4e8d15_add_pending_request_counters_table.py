@@ -0,0 +1,46 @@
+"""add pending request counters table
+
+Revision ID: 9c2f6a4e8d15
+Revises: 5e1b9c7d3f20
+Create Date: 2026-10-18 16:21:09.417382
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c2f6a4e8d15'
+down_revision: Union[str, Sequence[str], None] = '5e1b9c7d3f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('pending_request_counters',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('organization_id', sa.Integer(), nullable=False),
+    sa.Column('priority', sa.Integer(), nullable=False),
+    sa.Column('count', sa.Integer(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('organization_id', 'priority', name='uq_pending_request_counters_key')
+    )
+
+    # Backfill from existing rows; enum columns store member names.
+    op.execute(
+        """
+        INSERT INTO pending_request_counters (organization_id, priority, count)
+        SELECT organization_id, priority, count(*)
+        FROM equipment_requests
+        WHERE status = 'PENDING'
+        GROUP BY organization_id, priority
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('pending_request_counters')
@@ -0,0 +1,46 @@
+"""add case insensitive unique indexes
+
+Revision ID: a7d3e5b28c14
+Revises: f2a8c3d91b47
+Create Date: 2026-10-18 14:58:04.117392
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d3e5b28c14'
+down_revision: Union[str, Sequence[str], None] = 'f2a8c3d91b47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing case-insensitive duplicates must be resolved before these indexes can be built.
+    op.create_index(
+        'uq_departments_organization_name',
+        'departments',
+        ['organization_id', sa.text('lower(name)')],
+        unique=True,
+    )
+    op.create_index(
+        'uq_equipment_department_identity',
+        'equipment',
+        [
+            'department_id',
+            sa.text('lower(name)'),
+            sa.text('lower(manufacturer)'),
+            sa.text('lower(model_number)'),
+        ],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_equipment_department_identity', table_name='equipment')
+    op.drop_index('uq_departments_organization_name', table_name='departments')
@@ -0,0 +1,43 @@
+"""add equipment request queue index and claims
+
+Revision ID: b5d1e7f3a926
+Revises: 9c2f6a4e8d15
+Create Date: 2026-10-18 17:02:51.630418
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d1e7f3a926'
+down_revision: Union[str, Sequence[str], None] = '9c2f6a4e8d15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'equipment_requests', sa.Column('claimed_by', sa.String(length=120), nullable=True)
+    )
+    op.add_column(
+        'equipment_requests', sa.Column('claimed_at', sa.DateTime(timezone=True), nullable=True)
+    )
+    op.create_index(
+        'ix_equipment_requests_queue',
+        'equipment_requests',
+        ['organization_id', 'status', 'priority', 'created_at', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_equipment_requests_queue', table_name='equipment_requests')
+    # Native DROP COLUMN (SQLite 3.35+): a batch table rebuild would lose the expression-based
+    # partial unique index on this table.
+    op.execute('ALTER TABLE equipment_requests DROP COLUMN claimed_at')
+    op.execute('ALTER TABLE equipment_requests DROP COLUMN claimed_by')
@@ -0,0 +1,36 @@
+"""add ai assessment cache table
+
+Revision ID: c4e9a1d07b56
+Revises: 8b2d4e6f1a93
+Create Date: 2026-10-18 10:41:53.912004
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e9a1d07b56'
+down_revision: Union[str, Sequence[str], None] = '8b2d4e6f1a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('ai_assessment_cache',
+    sa.Column('cache_key', sa.String(length=255), nullable=False),
+    sa.Column('equipment_id', sa.Integer(), nullable=False),
+    sa.Column('result', sa.Text(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('cache_key')
+    )
+    op.create_index(op.f('ix_ai_assessment_cache_equipment_id'), 'ai_assessment_cache', ['equipment_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_ai_assessment_cache_equipment_id'), table_name='ai_assessment_cache')
+    op.drop_table('ai_assessment_cache')
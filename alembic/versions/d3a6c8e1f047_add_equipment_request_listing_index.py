@@ -0,0 +1,33 @@
+"""add equipment request listing index
+
+Revision ID: d3a6c8e1f047
+Revises: b5d1e7f3a926
+Create Date: 2026-10-18 17:48:13.205771
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3a6c8e1f047'
+down_revision: Union[str, Sequence[str], None] = 'b5d1e7f3a926'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_equipment_requests_organization_created',
+        'equipment_requests',
+        ['organization_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_equipment_requests_organization_created', table_name='equipment_requests')
@@ -0,0 +1,39 @@
+"""add change log table
+
+Revision ID: e8b4f2c6a193
+Revises: d3a6c8e1f047
+Create Date: 2026-10-18 18:36:40.772913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b4f2c6a193'
+down_revision: Union[str, Sequence[str], None] = 'd3a6c8e1f047'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('change_log',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('organization_id', sa.Integer(), nullable=False),
+    sa.Column('resource', sa.String(length=40), nullable=False),
+    sa.Column('resource_id', sa.Integer(), nullable=False),
+    sa.Column('action', sa.String(length=20), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_change_log_organization_id_id', 'change_log', ['organization_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_change_log_organization_id_id', table_name='change_log')
+    op.drop_table('change_log')
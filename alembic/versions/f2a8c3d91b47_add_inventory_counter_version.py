@@ -0,0 +1,29 @@
+"""add inventory counter version
+
+Revision ID: f2a8c3d91b47
+Revises: c4e9a1d07b56
+Create Date: 2026-10-18 14:12:37.501843
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a8c3d91b47'
+down_revision: Union[str, Sequence[str], None] = 'c4e9a1d07b56'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('inventory_counters', sa.Column('version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('inventory_counters') as batch_op:
+        batch_op.drop_column('version')
@@ -0,0 +1,44 @@
+"""ETag helpers for conditional GET (`If-None-Match`) and PUT (`If-Match`)."""
+
+import hashlib
+from datetime import UTC, datetime
+
+from fastapi import Request, Response
+
+from app.api.exceptions import PreconditionFailedException
+
+
+def _parse(header: str | None) -> set[str]:
+    if not header:
+        return set()
+    return {tag.strip() for tag in header.split(",") if tag.strip()}
+
+
+def equipment_etag(equipment_id: int, updated_at: datetime) -> str:
+    """Strong ETag for one equipment row; changes whenever `updated_at` does."""
+    if updated_at.tzinfo is not None:
+        updated_at = updated_at.astimezone(UTC).replace(tzinfo=None)
+    return f'"equipment-{equipment_id}-{updated_at.isoformat()}"'
+
+
+def collection_etag(name: str, version: int, request: Request) -> str:
+    """Strong ETag for a list: collection version plus the query that shaped the page."""
+    query = hashlib.sha256(str(sorted(request.query_params.multi_items())).encode())
+    return f'"{name}-{version}-{query.hexdigest()[:16]}"'
+
+
+def if_none_match(request: Request, etag: str) -> bool:
+    """True when the client already holds `etag` (weak comparison, per RFC 9110)."""
+    tags = _parse(request.headers.get("if-none-match"))
+    return "*" in tags or etag in {tag.removeprefix("W/") for tag in tags}
+
+
+def check_if_match(if_match: str | None, etag: str) -> None:
+    """Raise 412 unless `If-Match` is absent, `*`, or strongly matches `etag`."""
+    tags = _parse(if_match)
+    if tags and "*" not in tags and etag not in tags:
+        raise PreconditionFailedException("Equipment was modified by another request")
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
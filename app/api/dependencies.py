@@ -5,7 +5,7 @@ from collections.abc import AsyncGenerator
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 
 
 async def get_db_session(
@@ -13,3 +13,10 @@ async def get_db_session(
 ) -> AsyncGenerator[AsyncSession, None]:
     """Typed wrapper dependency used by route modules."""
     yield session
+
+
+async def get_read_db_session(
+    session: AsyncSession = Depends(get_read_db),
+) -> AsyncGenerator[AsyncSession, None]:
+    """Session for read-only routes; never use it for writes."""
+    yield session
@@ -40,6 +40,21 @@ class ConflictException(APIException):
         super().__init__(409, message)
 
 
+class GoneException(APIException):
+    def __init__(self, message: str = "Gone") -> None:
+        super().__init__(410, message)
+
+
+class PreconditionFailedException(APIException):
+    def __init__(self, message: str = "Precondition failed") -> None:
+        super().__init__(412, message)
+
+
+class ServiceUnavailableException(APIException):
+    def __init__(self, message: str = "Service unavailable") -> None:
+        super().__init__(503, message)
+
+
 def register_exception_handlers(app: FastAPI) -> None:
     """Register global handlers once during app startup."""
 
@@ -0,0 +1,60 @@
+"""Streaming NDJSON/CSV export helpers."""
+
+import csv
+import io
+from collections.abc import AsyncIterator
+from enum import Enum
+from typing import Any
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+async def _ndjson_lines(rows: AsyncIterator[Any], schema: type[BaseModel]) -> AsyncIterator[str]:
+    async for row in rows:
+        yield schema.model_validate(row).model_dump_json() + "\n"
+
+
+async def _csv_lines(rows: AsyncIterator[Any], schema: type[BaseModel]) -> AsyncIterator[str]:
+    fields = list(schema.model_fields)
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields)
+
+    writer.writeheader()
+    yield buffer.getvalue()
+
+    async for row in rows:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow(schema.model_validate(row).model_dump(mode="json"))
+        yield buffer.getvalue()
+
+
+def export_response(
+    rows: AsyncIterator[Any],
+    schema: type[BaseModel],
+    export_format: ExportFormat,
+    filename: str,
+) -> StreamingResponse:
+    """Stream ORM rows serialized with `schema`, one line at a time."""
+    lines = _csv_lines(rows, schema) if export_format == ExportFormat.CSV else _ndjson_lines(
+        rows, schema
+    )
+    return StreamingResponse(
+        lines,
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'
+        },
+    )
@@ -0,0 +1,85 @@
+"""Stored responses for `Idempotency-Key` requests, with single-flight for concurrent retries."""
+
+import asyncio
+import hashlib
+from dataclasses import dataclass
+
+from starlette.routing import BaseRoute
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    fingerprint: str
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+    route: BaseRoute | None = None
+
+
+@dataclass
+class InFlight:
+    fingerprint: str
+    done: asyncio.Future[None]
+
+
+def request_fingerprint(method: str, path: str, query_string: bytes, body: bytes) -> str:
+    """A key may only be reused for the same request; this is what "the same" means."""
+    digest = hashlib.sha256()
+    for part in (method.encode(), path.encode(), query_string, body):
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+class IdempotencyStore:
+    """Completed responses in a bounded TTL cache; running ones as futures retries wait on.
+
+    Per process: with several workers, a retry routed to another worker runs again.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, max_body_bytes: int) -> None:
+        self.responses: TTLCache[str, StoredResponse] = TTLCache(max_entries, ttl_seconds)
+        self.max_body_bytes = max_body_bytes
+        self._in_flight: dict[str, InFlight] = {}
+        self.replayed = 0
+        self.waited = 0
+
+    def get(self, key: str) -> StoredResponse | None:
+        return self.responses.get(key)
+
+    def in_flight(self, key: str) -> InFlight | None:
+        return self._in_flight.get(key)
+
+    def begin(self, key: str, fingerprint: str) -> None:
+        done = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = InFlight(fingerprint, done)
+
+    def finish(self, key: str, response: StoredResponse | None) -> None:
+        """Release waiters. Without a response (5xx, error, oversized body) nothing is kept
+        and the next attempt with this key runs the request again."""
+        if response is not None:
+            self.responses.set(key, response)
+        in_flight = self._in_flight.pop(key)
+        in_flight.done.set_result(None)
+
+    def clear(self) -> None:
+        self.responses.clear()
+        self.replayed = self.waited = 0
+
+    def stats(self) -> dict[str, int | float | None]:
+        return {
+            **self.responses.stats(),
+            "in_flight": len(self._in_flight),
+            "replayed": self.replayed,
+            "waited": self.waited,
+        }
+
+
+idempotency_store = IdempotencyStore(
+    max_entries=settings.idempotency_max_entries,
+    ttl_seconds=settings.idempotency_ttl_seconds,
+    max_body_bytes=settings.idempotency_max_body_bytes,
+)
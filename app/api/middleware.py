@@ -0,0 +1,275 @@
+"""ASGI middleware registered on the application."""
+
+import asyncio
+import math
+import time
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.api.idempotency import (
+    IdempotencyStore,
+    StoredResponse,
+    idempotency_store,
+    request_fingerprint,
+)
+from app.api.response import error_response
+from app.core.config import settings
+from app.core.database import PRIMARY_STICKY_COOKIE, replica_router
+from app.core.instrumentation import metrics_registry, query_guard, track_request
+
+
+def _route_path(scope: Scope) -> str:
+    """Route template (e.g. `/equipment/{equipment_id}`), keeping label cardinality bounded."""
+    return getattr(scope.get("route"), "path", "unmatched")
+
+
+class RequestMetricsMiddleware:
+    """Record per-request DB/serialization timings, emit `Server-Timing` and aggregate them.
+
+    Written as plain ASGI so the request's `RequestMetrics` context is the one the route
+    handler and SQLAlchemy hooks run in. `Server-Timing` can only cover the work done before
+    the headers go out; the budget check and the registry wait for the last body chunk, so
+    queries run while a streamed body (CSV export, SSE) is produced are counted too.
+    """
+
+    def __init__(self, app: ASGIApp, exclude_paths: frozenset[str] = frozenset()) -> None:
+        self.app = app
+        self.exclude_paths = exclude_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        observed = False
+        with track_request(scope["path"]) as metrics:
+
+            def observe() -> None:
+                nonlocal observed
+                if observed:
+                    return
+                observed = True
+                route = _route_path(scope)
+                query_guard.check_budget(scope["method"], route, metrics)
+                metrics_registry.observe(
+                    scope["method"],
+                    route,
+                    status_code,
+                    time.perf_counter() - metrics.started_at,
+                    metrics,
+                )
+
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    elapsed = time.perf_counter() - metrics.started_at
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", metrics.server_timing(elapsed))
+                await send(message)
+                if message["type"] == "http.response.body" and not message.get("more_body"):
+                    observe()
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                # Errors and disconnects never send a last body chunk.
+                observe()
+
+
+class ReadYourWritesMiddleware:
+    """After a successful write, pin this client's reads to the primary for a short window.
+
+    The window is carried in a cookie read by `get_read_db`, so it holds across processes.
+    Only active when read replicas are configured.
+    """
+
+    SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+    def __init__(self, app: ASGIApp, sticky_seconds: float) -> None:
+        self.app = app
+        self.sticky_seconds = sticky_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] in self.SAFE_METHODS
+            or not replica_router.enabled
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                until = time.time() + self.sticky_seconds
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Set-Cookie",
+                    f"{PRIMARY_STICKY_COOKIE}={until:.3f}; "
+                    f"Max-Age={math.ceil(self.sticky_seconds)}; Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
+
+
+class IdempotencyMiddleware:
+    """Replay the stored response for a repeated `Idempotency-Key` on POST and PATCH.
+
+    The first request runs and its response (status, headers, envelope body) is kept unless
+    it is a 5xx. A retry with the same key and the same method, path, query and body gets
+    that response back with `Idempotent-Replayed: true`, without reaching the route or the
+    database. A retry that arrives while the original is still running waits for it. Reusing
+    a key for a different request is rejected with 422.
+
+    Registered innermost, so replays still get fresh `Server-Timing` and sticky-read cookies.
+    """
+
+    METHODS = frozenset({"POST", "PATCH"})
+    MAX_KEY_LENGTH = 255
+
+    def __init__(self, app: ASGIApp, store: IdempotencyStore) -> None:
+        self.app = app
+        self.store = store
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in self.METHODS:
+            await self.app(scope, receive, send)
+            return
+        key = Headers(scope=scope).get("idempotency-key")
+        if key is None:
+            await self.app(scope, receive, send)
+            return
+        if not key or len(key) > self.MAX_KEY_LENGTH:
+            message = f"Idempotency-Key must be 1 to {self.MAX_KEY_LENGTH} characters"
+            await self._error(scope, receive, send, 400, message)
+            return
+
+        body = await self._read_body(receive)
+        fingerprint = request_fingerprint(
+            scope["method"], scope["path"], scope["query_string"], body
+        )
+        while True:
+            stored = self.store.get(key)
+            in_flight = self.store.in_flight(key) if stored is None else None
+            if stored is None and in_flight is None:
+                break
+            if (stored or in_flight).fingerprint != fingerprint:
+                message = "Idempotency-Key was already used for a different request"
+                await self._error(scope, receive, send, 422, message)
+                return
+            if stored is not None:
+                self.store.replayed += 1
+                await self._replay(scope, stored, send)
+                return
+            # Shielded: a waiter whose client disconnects must not cancel the original.
+            self.store.waited += 1
+            await asyncio.shield(in_flight.done)
+
+        await self._run(scope, self._replay_body(body, receive), send, key, fingerprint)
+
+    async def _run(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        key: str,
+        fingerprint: str,
+    ) -> None:
+        status: int | None = None
+        headers: list[tuple[bytes, bytes]] = []
+        chunks: list[bytes] = []
+        size = 0
+        complete = False
+
+        async def send_and_capture(message: Message) -> None:
+            nonlocal status, headers, size, complete
+            if message["type"] == "http.response.start":
+                # Copied before forwarding: the outer middlewares append `Server-Timing` and
+                # the sticky-read cookie to this same message, and replays get fresh ones.
+                status = message["status"]
+                headers = list(message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                body = message.get("body", b"")
+                size += len(body)
+                # Past the cap the response will not be stored, so stop holding it.
+                if size <= self.store.max_body_bytes:
+                    chunks.append(body)
+                else:
+                    chunks.clear()
+                complete = not message.get("more_body", False)
+            await send(message)
+
+        self.store.begin(key, fingerprint)
+        response = None
+        try:
+            await self.app(scope, receive, send_and_capture)
+            if (
+                status is not None
+                and status < 500
+                and complete
+                and size <= self.store.max_body_bytes
+            ):
+                response = StoredResponse(
+                    fingerprint=fingerprint,
+                    status=status,
+                    headers=headers,
+                    body=b"".join(chunks),
+                    route=scope.get("route"),
+                )
+        finally:
+            self.store.finish(key, response)
+
+    @staticmethod
+    async def _read_body(receive: Receive) -> bytes:
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                break
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        return b"".join(chunks)
+
+    @staticmethod
+    def _replay_body(body: bytes, receive: Receive) -> Receive:
+        sent = False
+
+        async def replay_receive() -> Message:
+            nonlocal sent
+            if sent:
+                return await receive()
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        return replay_receive
+
+    @staticmethod
+    async def _replay(scope: Scope, stored: StoredResponse, send: Send) -> None:
+        # Replays never reach the router; label their metrics with the original's route.
+        if stored.route is not None:
+            scope["route"] = stored.route
+        await send(
+            {
+                "type": "http.response.start",
+                "status": stored.status,
+                "headers": [*stored.headers, (b"idempotent-replayed", b"true")],
+            }
+        )
+        await send({"type": "http.response.body", "body": stored.body})
+
+    @staticmethod
+    async def _error(scope: Scope, receive: Receive, send: Send, status: int, message: str):
+        response = JSONResponse(status_code=status, content=error_response(message).model_dump())
+        await response(scope, receive, send)
+
+
+def register_middleware(app: FastAPI) -> None:
+    app.add_middleware(IdempotencyMiddleware, store=idempotency_store)
+    app.add_middleware(ReadYourWritesMiddleware, sticky_seconds=settings.replica_sticky_seconds)
+    app.add_middleware(RequestMetricsMiddleware, exclude_paths=frozenset({"/metrics"}))
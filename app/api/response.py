@@ -1,12 +1,18 @@
 """Standard API response envelope helpers."""
 
+from collections.abc import Sequence
+from functools import lru_cache
 from typing import Any, Generic, TypeVar
 
 from fastapi.encoders import jsonable_encoder
-from pydantic import BaseModel, Field
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field, TypeAdapter
+from pydantic_core import to_json
 
+from app.core.instrumentation import timed
 
 T = TypeVar("T")
+S = TypeVar("S", bound=BaseModel)
 
 
 class SuccessResponse(BaseModel, Generic[T]):
@@ -29,3 +35,36 @@ def success_response(message: str, data: T | None = None) -> SuccessResponse[T]:
 def error_response(message: str, errors: dict[str, Any] | None = None) -> ErrorResponse:
     """Build error response in required interview format."""
     return ErrorResponse(message=message, errors=errors or {})
+
+
+class EnvelopeResponse(JSONResponse):
+    """JSON response whose content is encoded to bytes by pydantic-core in a single pass.
+
+    Content may mix plain dicts/lists with pydantic models; nothing is dumped to
+    intermediate dicts or re-encoded by FastAPI.
+    """
+
+    def render(self, content: Any) -> bytes:
+        with timed("serialization_seconds"):
+            return to_json(content)
+
+
+@lru_cache
+def _list_adapter(schema: type[S]) -> TypeAdapter[list[S]]:
+    return TypeAdapter(list[schema])
+
+
+def to_schema(schema: type[S], data: Any) -> S | list[S]:
+    """Validate ORM row(s) into `schema` models, using a cached adapter for sequences."""
+    with timed("validation_seconds"):
+        if isinstance(data, Sequence):
+            return _list_adapter(schema).validate_python(data, from_attributes=True)
+        return schema.model_validate(data, from_attributes=True)
+
+
+def envelope_response(message: str, data: Any = None, status_code: int = 200) -> EnvelopeResponse:
+    """Build the success envelope and render it straight to JSON bytes."""
+    return EnvelopeResponse(
+        {"success": True, "message": message, "data": data},
+        status_code=status_code,
+    )
@@ -2,11 +2,17 @@
 
 from fastapi import APIRouter
 
+from app.api.v1.admin import router as admin_router
+from app.api.v1.changes import router as changes_router
 from app.api.v1.departments import router as departments_router
 from app.api.v1.equipment import router as equipment_router
 from app.api.v1.equipment_requests import router as equipment_requests_router
+from app.api.v1.organizations import router as organizations_router
 
 api_router = APIRouter()
 api_router.include_router(departments_router)
 api_router.include_router(equipment_router)
 api_router.include_router(equipment_requests_router)
+api_router.include_router(organizations_router)
+api_router.include_router(changes_router)
+api_router.include_router(admin_router)
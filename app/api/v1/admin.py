@@ -0,0 +1,27 @@
+"""Operational endpoints for inspecting in-process state."""
+
+from fastapi import APIRouter
+
+from app.api.idempotency import idempotency_store
+from app.api.response import envelope_response
+from app.core.instrumentation import query_guard
+from app.services.ai_assessment_cache import ai_assessment_cache
+from app.services.department_cache import department_cache
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+@router.get("/cache-stats")
+async def cache_stats():
+    data = {
+        "ai_assessment": ai_assessment_cache.stats(),
+        "departments": department_cache.stats(),
+        "idempotency": idempotency_store.stats(),
+    }
+    return envelope_response("Cache statistics fetched successfully", data)
+
+
+@router.get("/slow-queries")
+async def slow_queries():
+    """Slow statements with their EXPLAIN output and over-budget requests (debug mode)."""
+    return envelope_response("Query diagnostics fetched successfully", query_guard.snapshot())
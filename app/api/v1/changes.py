@@ -0,0 +1,52 @@
+"""Change feed endpoint."""
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies import get_read_db_session
+from app.api.exceptions import BadRequestException, GoneException
+from app.api.response import envelope_response, to_schema
+from app.core.config import settings
+from app.schemas.change_log import ChangeLogEntryRead
+from app.services.change_log_service import ChangeLogService
+from app.utils.pagination import decode_cursor, encode_cursor
+
+router = APIRouter(prefix="/changes", tags=["Changes"])
+
+
+@router.get("")
+async def list_changes(
+    since: str | None = Query(default=None, min_length=1),
+    organization_id: int | None = Query(default=None, ge=1),
+    limit: int = Query(default=100, ge=1, le=1000),
+    wait: float = Query(default=0, ge=0, le=settings.change_feed_max_wait_seconds),
+    db: AsyncSession = Depends(get_read_db_session),
+):
+    """Changes after the `since` cursor, oldest first.
+
+    With `wait`, an empty result is held open for up to that many seconds and returns as
+    soon as a change is committed. Always resume from the returned `next_cursor`.
+    """
+    service = ChangeLogService(db)
+    since_id = 0
+    if since is not None:
+        since_id = decode_cursor(since, "id")["id"]
+        if not isinstance(since_id, int) or since_id < 0:
+            raise BadRequestException("Invalid cursor")
+        oldest_id = await service.oldest_id()
+        if oldest_id is not None and since_id < oldest_id - 1:
+            raise GoneException("Cursor is older than the retained change log; resync")
+
+    entries = await service.poll(
+        since_id=since_id,
+        organization_id=organization_id,
+        limit=limit,
+        wait_seconds=wait,
+    )
+    next_id = entries[-1].id if entries else since_id
+    data = {
+        "items": to_schema(ChangeLogEntryRead, entries),
+        "next_cursor": encode_cursor({"id": next_id}),
+        "has_more": len(entries) == limit,
+    }
+    return envelope_response("Changes fetched successfully", data)
@@ -1,11 +1,18 @@
 """Department endpoints."""
 
+from collections.abc import AsyncIterator
+
 from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_db_session
-from app.api.response import success_response
+from app.api.dependencies import get_db_session, get_read_db_session
+from app.api.exceptions import NotFoundException
+from app.api.response import envelope_response, to_schema
+from app.core.config import settings
+from app.core.pubsub import Subscription, equipment_hub
 from app.schemas.department import DepartmentCreate, DepartmentRead
+from app.services.department_cache import DepartmentLookup
 from app.services.department_service import DepartmentService
 
 router = APIRouter(prefix="/departments", tags=["Departments"])
@@ -17,15 +24,57 @@ async def create_department(
     db: AsyncSession = Depends(get_db_session),
 ):
     department = await DepartmentService(db).create_department(payload)
-    data = DepartmentRead.model_validate(department).model_dump(mode="json")
-    return success_response("Department created successfully", data=data).model_dump()
+    return envelope_response(
+        "Department created successfully",
+        to_schema(DepartmentRead, department),
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 @router.get("")
 async def list_departments(
     organization_id: int | None = Query(default=None, ge=1),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
 ):
     departments = await DepartmentService(db).list_departments(organization_id)
-    data = [DepartmentRead.model_validate(item).model_dump(mode="json") for item in departments]
-    return success_response("Departments fetched successfully", data=data).model_dump()
+    return envelope_response(
+        "Departments fetched successfully",
+        to_schema(DepartmentRead, departments),
+    )
+
+
+async def _event_stream(subscription: Subscription) -> AsyncIterator[bytes]:
+    try:
+        yield b": connected\n\n"
+        while True:
+            try:
+                message = await subscription.get(timeout=settings.sse_heartbeat_seconds)
+            except StopAsyncIteration:
+                # Evicted as a slow consumer; the client reconnects and refetches.
+                return
+            yield message if message is not None else b": keepalive\n\n"
+    finally:
+        subscription.close()
+
+
+@router.get("/{department_id}/equipment/stream")
+async def stream_department_equipment(
+    department_id: int,
+    db: AsyncSession = Depends(get_read_db_session),
+):
+    """Server-Sent Events for status and department changes of this department's equipment.
+
+    Events come from the in-process hub, so an open stream holds no database connection;
+    a display should load the list once, then apply `equipment.updated` events.
+    """
+    if await DepartmentLookup(db).get(department_id) is None:
+        raise NotFoundException("Department not found")
+    if db.in_transaction():
+        await db.commit()
+
+    subscription = equipment_hub.subscribe(department_id)
+    return StreamingResponse(
+        _event_stream(subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,18 +1,75 @@
 """Equipment endpoints."""
 
-from fastapi import APIRouter, Depends, Query, status
+import json
+from typing import Any
+
+from fastapi import APIRouter, Depends, Header, Query, Request, status
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_db_session
-from app.api.response import success_response
+from app.api.conditional import collection_etag, equipment_etag, if_none_match, not_modified
+from app.api.dependencies import get_db_session, get_read_db_session
+from app.api.exceptions import BadRequestException
+from app.api.export import ExportFormat, export_response
+from app.api.response import envelope_response, to_schema
+from app.core.config import settings
 from app.repositories.enums import EquipmentStatus
-from app.schemas.ai import AIAssessmentInput
-from app.schemas.equipment import EquipmentCreate, EquipmentRead, EquipmentUpdate
+from app.schemas.ai import AIAssessmentBatchRequest, AIAssessmentInput
+from app.schemas.equipment import (
+    EquipmentBulkItemResult,
+    EquipmentCreate,
+    EquipmentRead,
+    EquipmentUpdate,
+)
 from app.services.ai_assessment_service import AIAssessmentService
 from app.services.equipment_service import EquipmentService
+from app.utils.pagination import decode_cursor, encode_cursor
 
 router = APIRouter(prefix="/equipment", tags=["Equipment"])
 
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+
+def _row_limit_message() -> str:
+    return f"Bulk import is limited to {settings.bulk_import_max_rows} rows"
+
+
+async def _read_bulk_items(request: Request) -> list[Any]:
+    """Read a JSON array body, or NDJSON line by line as it streams in."""
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+
+    if content_type not in NDJSON_MEDIA_TYPES:
+        try:
+            items = json.loads(await request.body())
+        except ValueError as exc:
+            raise BadRequestException("Request body must be a JSON array") from exc
+        if not isinstance(items, list):
+            raise BadRequestException("Request body must be a JSON array")
+        if len(items) > settings.bulk_import_max_rows:
+            raise BadRequestException(_row_limit_message())
+        return items
+
+    items: list[Any] = []
+    buffer = b""
+
+    def parse(line: bytes) -> None:
+        if not line.strip():
+            return
+        if len(items) >= settings.bulk_import_max_rows:
+            raise BadRequestException(_row_limit_message())
+        try:
+            items.append(json.loads(line))
+        except ValueError:
+            items.append(None)
+
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            parse(line)
+    parse(buffer)
+    return items
+
 
 @router.post("", status_code=status.HTTP_201_CREATED)
 async def create_equipment(
@@ -20,57 +77,183 @@ async def create_equipment(
     db: AsyncSession = Depends(get_db_session),
 ):
     equipment = await EquipmentService(db).create_equipment(payload)
-    data = EquipmentRead.model_validate(equipment).model_dump(mode="json")
-    return success_response("Equipment created successfully", data).model_dump()
+    return envelope_response(
+        "Equipment created successfully",
+        to_schema(EquipmentRead, equipment),
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+@router.post("/bulk")
+async def bulk_create_equipment(
+    request: Request,
+    db: AsyncSession = Depends(get_db_session),
+):
+    results: list[EquipmentBulkItemResult] = []
+    valid: list[tuple[int, EquipmentCreate]] = []
+    for index, item in enumerate(await _read_bulk_items(request)):
+        try:
+            valid.append((index, EquipmentCreate.model_validate(item)))
+        except ValidationError as exc:
+            results.append(
+                EquipmentBulkItemResult(
+                    index=index,
+                    status="invalid",
+                    message="Validation error",
+                    errors=json.loads(exc.json(include_url=False)),
+                )
+            )
+
+    results.extend(await EquipmentService(db).bulk_create_equipment(valid))
+    results.sort(key=lambda result: result.index)
+    created = sum(1 for result in results if result.status == "created")
+
+    data = {
+        "created": created,
+        "failed": len(results) - created,
+        "results": [result.model_dump(mode="json", exclude_none=True) for result in results],
+    }
+    return envelope_response("Equipment bulk import processed", data)
+
+
+@router.get("/search")
+async def search_equipment(
+    q: str = Query(..., min_length=3, max_length=100),
+    organization_id: int = Query(..., ge=1),
+    department_id: int | None = Query(default=None, ge=1),
+    limit: int = Query(default=20, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db_session),
+):
+    items = await EquipmentService(db).search_equipment(
+        query=q,
+        organization_id=organization_id,
+        department_id=department_id,
+        limit=limit,
+    )
+    return envelope_response(
+        "Equipment search results fetched successfully",
+        {"items": to_schema(EquipmentRead, items)},
+    )
+
+
+@router.get("/export")
+async def export_equipment(
+    organization_id: int = Query(..., ge=1),
+    department_id: int | None = Query(default=None, ge=1),
+    status: EquipmentStatus | None = Query(default=None),
+    export_format: ExportFormat = Query(default=ExportFormat.NDJSON, alias="format"),
+    db: AsyncSession = Depends(get_read_db_session),
+):
+    rows = EquipmentService(db).stream_equipment(
+        organization_id=organization_id,
+        department_id=department_id,
+        status=status,
+    )
+    return export_response(rows, EquipmentRead, export_format, f"equipment-{organization_id}")
 
 
 @router.get("/{equipment_id}")
 async def get_equipment(
     equipment_id: int,
-    db: AsyncSession = Depends(get_db_session),
+    request: Request,
+    db: AsyncSession = Depends(get_read_db_session),
 ):
-    equipment = await EquipmentService(db).get_equipment(equipment_id)
-    data = EquipmentRead.model_validate(equipment).model_dump(mode="json")
-    return success_response("Equipment fetched successfully", data).model_dump()
+    service = EquipmentService(db)
+    if request.headers.get("if-none-match"):
+        updated_at = await service.get_updated_at(equipment_id)
+        if updated_at is not None:
+            etag = equipment_etag(equipment_id, updated_at)
+            if if_none_match(request, etag):
+                return not_modified(etag)
+
+    equipment = await service.get_equipment(equipment_id)
+    response = envelope_response(
+        "Equipment fetched successfully", to_schema(EquipmentRead, equipment)
+    )
+    response.headers["ETag"] = equipment_etag(equipment.id, equipment.updated_at)
+    return response
 
 
 @router.get("")
 async def list_equipment(
+    request: Request,
     department_id: int | None = Query(default=None, ge=1),
     status: EquipmentStatus | None = Query(default=None),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db_session),
+    cursor: str | None = Query(default=None, min_length=1),
+    include_total: bool = Query(default=True),
+    db: AsyncSession = Depends(get_read_db_session),
 ):
-    items, total_items = await EquipmentService(db).list_equipment(
-        department_id=department_id,
-        status=status,
-        page=page,
-        page_size=page_size,
-    )
-    total_pages = (total_items + page_size - 1) // page_size
+    service = EquipmentService(db)
+    # The opt-out skips the counter read entirely, so those lists carry no ETag.
+    total, etag = None, None
+    if include_total:
+        total, version = await service.collection_state(department_id, status)
+        etag = collection_etag("equipment", version, request)
+        if if_none_match(request, etag):
+            return not_modified(etag)
 
-    data = {
-        "items": [EquipmentRead.model_validate(item).model_dump(mode="json") for item in items],
-        "pagination": {
+    if cursor is not None:
+        after_id = decode_cursor(cursor, "id")["id"]
+        if not isinstance(after_id, int):
+            raise BadRequestException("Invalid cursor")
+
+        items, next_after_id = await service.list_equipment_after(
+            department_id=department_id,
+            status=status,
+            after_id=after_id,
+            page_size=page_size,
+        )
+        pagination = {
+            "page_size": page_size,
+            "next_cursor": encode_cursor({"id": next_after_id}) if next_after_id else None,
+        }
+    else:
+        items, _ = await service.list_equipment(
+            department_id=department_id,
+            status=status,
+            page=page,
+            page_size=page_size,
+            include_total=False,
+        )
+        total_items = total
+        total_pages = None
+        has_more = len(items) == page_size
+        if total_items is not None:
+            total_pages = (total_items + page_size - 1) // page_size
+            has_more = bool(items) and page * page_size < total_items
+        pagination = {
             "page": page,
             "page_size": page_size,
             "total_items": total_items,
             "total_pages": total_pages,
-        },
+            "next_cursor": encode_cursor({"id": items[-1].id}) if has_more else None,
+        }
+
+    data = {
+        "items": to_schema(EquipmentRead, items),
+        "pagination": pagination,
     }
-    return success_response("Equipment list fetched successfully", data).model_dump()
+    response = envelope_response("Equipment list fetched successfully", data)
+    if etag is not None:
+        response.headers["ETag"] = etag
+    return response
 
 
 @router.put("/{equipment_id}")
 async def update_equipment(
     equipment_id: int,
     payload: EquipmentUpdate,
+    if_match: str | None = Header(default=None),
     db: AsyncSession = Depends(get_db_session),
 ):
-    equipment = await EquipmentService(db).update_equipment(equipment_id, payload)
-    data = EquipmentRead.model_validate(equipment).model_dump(mode="json")
-    return success_response("Equipment updated successfully", data).model_dump()
+    equipment = await EquipmentService(db).update_equipment(equipment_id, payload, if_match)
+    response = envelope_response(
+        "Equipment updated successfully", to_schema(EquipmentRead, equipment)
+    )
+    response.headers["ETag"] = equipment_etag(equipment.id, equipment.updated_at)
+    return response
 
 
 @router.post("/{equipment_id}/ai-assessment")
@@ -80,8 +263,24 @@ async def ai_assessment(
     db: AsyncSession = Depends(get_db_session),
 ):
     equipment = await EquipmentService(db).get_equipment(equipment_id)
-    assessment = AIAssessmentService().generate(equipment, payload)
-    return success_response(
-        "AI assessment generated successfully",
-        assessment.model_dump(mode="json"),
-    ).model_dump()
+    assessment = await AIAssessmentService(db).assess(equipment, payload)
+    return envelope_response("AI assessment generated successfully", assessment)
+
+
+@router.post("/ai-assessment/batch")
+async def ai_assessment_batch(
+    payload: AIAssessmentBatchRequest,
+    db: AsyncSession = Depends(get_db_session),
+):
+    equipment_by_id = await EquipmentService(db).get_equipment_many(
+        [item.equipment_id for item in payload.items]
+    )
+    results = await AIAssessmentService(db).assess_many(equipment_by_id, payload.items)
+    succeeded = sum(1 for result in results if result.success)
+
+    data = {
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "results": results,
+    }
+    return envelope_response("AI assessments generated successfully", data)
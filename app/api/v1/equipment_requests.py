@@ -1,12 +1,23 @@
 """Equipment request endpoints."""
 
+from datetime import datetime
+
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_db_session
-from app.api.response import success_response
-from app.schemas.equipment_request import EquipmentRequestCreate, EquipmentRequestRead
+from app.api.dependencies import get_db_session, get_read_db_session
+from app.api.exceptions import BadRequestException
+from app.api.export import ExportFormat, export_response
+from app.api.response import envelope_response, to_schema
+from app.repositories.equipment_request import EquipmentRequest
+from app.schemas.equipment_request import (
+    EquipmentRequestBulkAction,
+    EquipmentRequestClaim,
+    EquipmentRequestCreate,
+    EquipmentRequestRead,
+)
 from app.services.equipment_request_service import EquipmentRequestService
+from app.utils.pagination import decode_cursor, encode_cursor
 
 router = APIRouter(prefix="/equipment-requests", tags=["Equipment Requests"])
 
@@ -17,8 +28,35 @@ async def create_equipment_request(
     db: AsyncSession = Depends(get_db_session),
 ):
     request = await EquipmentRequestService(db).create_request(payload)
-    data = EquipmentRequestRead.model_validate(request).model_dump(mode="json")
-    return success_response("Equipment request created successfully", data).model_dump()
+    return envelope_response(
+        "Equipment request created successfully",
+        to_schema(EquipmentRequestRead, request),
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+@router.patch("/approve")
+async def approve_equipment_requests(
+    payload: EquipmentRequestBulkAction,
+    db: AsyncSession = Depends(get_db_session),
+):
+    changed, skipped_ids = await EquipmentRequestService(db).approve_requests(payload.ids)
+    return envelope_response(
+        "Equipment requests approved successfully",
+        {"changed": to_schema(EquipmentRequestRead, changed), "skipped_ids": skipped_ids},
+    )
+
+
+@router.patch("/reject")
+async def reject_equipment_requests(
+    payload: EquipmentRequestBulkAction,
+    db: AsyncSession = Depends(get_db_session),
+):
+    changed, skipped_ids = await EquipmentRequestService(db).reject_requests(payload.ids)
+    return envelope_response(
+        "Equipment requests rejected successfully",
+        {"changed": to_schema(EquipmentRequestRead, changed), "skipped_ids": skipped_ids},
+    )
 
 
 @router.patch("/{request_id}/approve")
@@ -27,8 +65,43 @@ async def approve_equipment_request(
     db: AsyncSession = Depends(get_db_session),
 ):
     request = await EquipmentRequestService(db).approve_request(request_id)
-    data = EquipmentRequestRead.model_validate(request).model_dump(mode="json")
-    return success_response("Equipment request approved successfully", data).model_dump()
+    return envelope_response(
+        "Equipment request approved successfully",
+        to_schema(EquipmentRequestRead, request),
+    )
+
+
+@router.patch("/{request_id}/reject")
+async def reject_equipment_request(
+    request_id: int,
+    db: AsyncSession = Depends(get_db_session),
+):
+    request = await EquipmentRequestService(db).reject_request(request_id)
+    return envelope_response(
+        "Equipment request rejected successfully",
+        to_schema(EquipmentRequestRead, request),
+    )
+
+
+QUEUE_SEEK_KEYS = ("priority", "created_at", "id")
+LIST_SEEK_KEYS = ("created_at", "id")
+
+
+def _encode_seek(request: EquipmentRequest, keys: tuple[str, ...]) -> str:
+    values = {key: getattr(request, key) for key in keys}
+    values["created_at"] = request.created_at.isoformat()
+    return encode_cursor(values)
+
+
+def _decode_seek(cursor: str, keys: tuple[str, ...]) -> tuple:
+    values = decode_cursor(cursor, *keys)
+    try:
+        return tuple(
+            datetime.fromisoformat(values[key]) if key == "created_at" else int(values[key])
+            for key in keys
+        )
+    except (TypeError, ValueError) as exc:
+        raise BadRequestException("Invalid cursor") from exc
 
 
 @router.get("")
@@ -36,22 +109,99 @@ async def list_equipment_requests(
     organization_id: int = Query(..., ge=1),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db_session),
+    cursor: str | None = Query(default=None, min_length=1),
+    include_total: bool = Query(default=True),
+    db: AsyncSession = Depends(get_read_db_session),
+):
+    service = EquipmentRequestService(db)
+    if cursor is not None:
+        items, next_after = await service.list_by_organization_after(
+            organization_id=organization_id,
+            after=_decode_seek(cursor, LIST_SEEK_KEYS),
+            page_size=page_size,
+        )
+        pagination = {
+            "page_size": page_size,
+            "next_cursor": _encode_seek(next_after, LIST_SEEK_KEYS) if next_after else None,
+        }
+    else:
+        items, total_items = await service.list_by_organization(
+            organization_id=organization_id,
+            page=page,
+            page_size=page_size,
+            include_total=include_total,
+        )
+        total_pages = None
+        has_more = len(items) == page_size
+        if total_items is not None:
+            total_pages = (total_items + page_size - 1) // page_size
+            has_more = bool(items) and page * page_size < total_items
+        pagination = {
+            "page": page,
+            "page_size": page_size,
+            "total_items": total_items,
+            "total_pages": total_pages,
+            "next_cursor": _encode_seek(items[-1], LIST_SEEK_KEYS) if has_more else None,
+        }
+
+    data = {
+        "items": to_schema(EquipmentRequestRead, items),
+        "pagination": pagination,
+    }
+    return envelope_response("Equipment requests fetched successfully", data)
+
+
+@router.get("/queue")
+async def equipment_request_queue(
+    organization_id: int = Query(..., ge=1),
+    page_size: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None, min_length=1),
+    unclaimed_only: bool = Query(default=False),
+    db: AsyncSession = Depends(get_read_db_session),
 ):
-    items, total_items = await EquipmentRequestService(db).list_by_organization(
+    """Pending requests, most urgent (priority 1) and oldest first, in keyset pages."""
+    items, next_after = await EquipmentRequestService(db).list_queue(
         organization_id=organization_id,
-        page=page,
+        after=_decode_seek(cursor, QUEUE_SEEK_KEYS) if cursor is not None else None,
         page_size=page_size,
+        unclaimed_only=unclaimed_only,
     )
-    total_pages = (total_items + page_size - 1) // page_size
-
     data = {
-        "items": [EquipmentRequestRead.model_validate(item).model_dump(mode="json") for item in items],
+        "items": to_schema(EquipmentRequestRead, items),
         "pagination": {
-            "page": page,
             "page_size": page_size,
-            "total_items": total_items,
-            "total_pages": total_pages,
+            "next_cursor": _encode_seek(next_after, QUEUE_SEEK_KEYS) if next_after else None,
         },
     }
-    return success_response("Equipment requests fetched successfully", data).model_dump()
+    return envelope_response("Equipment request queue fetched successfully", data)
+
+
+@router.post("/queue/claim")
+async def claim_equipment_requests(
+    payload: EquipmentRequestClaim,
+    db: AsyncSession = Depends(get_db_session),
+):
+    claimed = await EquipmentRequestService(db).claim_from_queue(
+        organization_id=payload.organization_id,
+        claimed_by=payload.claimed_by,
+        limit=payload.limit,
+    )
+    return envelope_response(
+        "Equipment requests claimed successfully",
+        to_schema(EquipmentRequestRead, claimed),
+    )
+
+
+@router.get("/export")
+async def export_equipment_requests(
+    organization_id: int = Query(..., ge=1),
+    export_format: ExportFormat = Query(default=ExportFormat.NDJSON, alias="format"),
+    db: AsyncSession = Depends(get_read_db_session),
+):
+    rows = EquipmentRequestService(db).stream_by_organization(organization_id)
+    return export_response(
+        rows,
+        EquipmentRequestRead,
+        export_format,
+        f"equipment-requests-{organization_id}",
+    )
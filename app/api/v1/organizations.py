@@ -0,0 +1,19 @@
+"""Organization endpoints."""
+
+from fastapi import APIRouter, Depends, Path
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies import get_read_db_session
+from app.api.response import envelope_response
+from app.services.organization_summary_service import OrganizationSummaryService
+
+router = APIRouter(prefix="/organizations", tags=["Organizations"])
+
+
+@router.get("/{organization_id}/summary")
+async def get_organization_summary(
+    organization_id: int = Path(..., ge=1),
+    db: AsyncSession = Depends(get_read_db_session),
+):
+    summary = await OrganizationSummaryService(db).get_summary(organization_id)
+    return envelope_response("Organization summary fetched successfully", summary)
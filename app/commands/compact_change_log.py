@@ -0,0 +1,35 @@
+"""Trim the change log to `CHANGE_LOG_RETENTION_SECONDS` and `CHANGE_LOG_MAX_ENTRIES`.
+
+    python -m app.commands.compact_change_log
+
+Meant to run on a schedule (cron, a Kubernetes CronJob). Consumers whose cursor falls
+behind the oldest retained entry get 410 from `GET /changes` and must resync.
+"""
+
+import asyncio
+import json
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, engine
+from app.services.change_log_service import ChangeLogService
+
+
+async def compact_change_log() -> int:
+    try:
+        async with AsyncSessionLocal() as session:
+            return await ChangeLogService(session).compact(
+                retention_seconds=settings.change_log_retention_seconds,
+                max_entries=settings.change_log_max_entries,
+            )
+    finally:
+        await engine.dispose()
+
+
+def main() -> int:
+    deleted = asyncio.run(compact_change_log())
+    print(json.dumps({"deleted_entries": deleted}))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,31 @@
+"""Recompute the summary tables from source rows and repair any drift.
+
+    python -m app.commands.rebuild_summaries
+
+On PostgreSQL the counts are read from one snapshot; if a concurrent write makes the
+correction fail with a serialization error, run it again.
+"""
+
+import asyncio
+import json
+
+from app.core.database import AsyncSessionLocal, engine
+from app.services.organization_summary_service import OrganizationSummaryService
+
+
+async def rebuild_summaries() -> dict[str, int]:
+    try:
+        async with AsyncSessionLocal() as session:
+            return await OrganizationSummaryService(session).rebuild()
+    finally:
+        await engine.dispose()
+
+
+def main() -> int:
+    corrected = asyncio.run(rebuild_summaries())
+    print(json.dumps({"corrected_rows": corrected}))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
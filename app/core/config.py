@@ -20,6 +20,7 @@ class Settings(BaseSettings):
     app_version: str = "0.1.0"
     app_env: str = "development"
     debug: bool = False
+    sql_echo: bool = False
     api_prefix: str = Field(default="", alias="API_PREFIX")
 
     database_url: str | None = Field(default=None, alias="DATABASE_URL")
@@ -29,6 +30,59 @@ class Settings(BaseSettings):
     db_name: str | None = Field(default=None, alias="DBNAME")
     db_port: int = Field(default=5432, alias="DBPORT")
 
+    # Comma-separated read replica URLs; GET routes are routed to them round-robin.
+    database_replica_urls: str = Field(default="", alias="DATABASE_REPLICA_URLS")
+    replica_retry_seconds: float = 30.0
+    replica_sticky_seconds: float = 5.0
+
+    # SQLite file databases: WAL, tuned pragmas, one serialized writer plus a reader pool.
+    sqlite_tuned: bool = True
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+    sqlite_cache_size_kib: int = 64 * 1024
+    sqlite_reader_pool_size: int = 4
+
+    bulk_import_max_rows: int = 50_000
+    bulk_import_chunk_size: int = 500
+    export_fetch_size: int = 1000
+    search_candidate_limit: int = 200
+    queue_claim_ttl_seconds: int = 300
+    change_feed_max_wait_seconds: float = 30.0
+    change_log_retention_seconds: int = 7 * 24 * 60 * 60
+    change_log_max_entries: int = 1_000_000
+    sse_queue_size: int = 100
+    sse_heartbeat_seconds: float = 15.0
+    idempotency_max_entries: int = 10_000
+    idempotency_ttl_seconds: int = 24 * 60 * 60
+    idempotency_max_body_bytes: int = 256 * 1024
+
+    department_cache_max_entries: int = 10_000
+    department_cache_ttl_seconds: int = 300
+
+    ai_cache_max_entries: int = 1024
+    ai_cache_ttl_seconds: int = 24 * 60 * 60
+    ai_cache_persistent: bool = False
+    ai_batch_concurrency: int = 8
+
+    llm_provider: str = "mock"
+    llm_base_url: str = "https://api.anthropic.com"
+    llm_api_key: str | None = None
+    llm_model: str | None = None
+    llm_timeout_seconds: float = 30.0
+    llm_max_concurrency: int = 16
+    llm_max_concurrency_per_org: int = 4
+    llm_max_retries: int = 3
+    llm_backoff_seconds: float = 0.5
+
+    # Query guard; active when DEBUG=true.
+    query_budget: int = 25
+    slow_query_ms: float = 100.0
+    slow_query_buffer_size: int = 100
+
+    @property
+    def replica_urls(self) -> list[str]:
+        return [url.strip() for url in self.database_replica_urls.split(",") if url.strip()]
+
     @property
     def sqlalchemy_database_uri(self) -> str:
         """Resolve async SQLAlchemy database URI with SQLite fallback."""
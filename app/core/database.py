@@ -1,22 +1,153 @@
 """Async SQLAlchemy database configuration."""
 
-from collections.abc import AsyncGenerator
+import itertools
+import time
+from collections.abc import AsyncGenerator, Callable
+from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
 
 from app.core.config import settings
+from app.core.instrumentation import install_query_hooks
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+PRIMARY_STICKY_COOKIE = "db_read_primary_until"
 
 
 class Base(DeclarativeBase):
     """Base class for all ORM models."""
 
 
-engine = create_async_engine(
-    settings.sqlalchemy_database_uri,
-    echo=settings.debug,
-    pool_pre_ping=True,
-)
+def _is_sqlite_file(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database not in (None, "", ":memory:")
+
+
+def _apply_sqlite_pragmas(engine: AsyncEngine, read_only: bool) -> None:
+    """Set WAL and tuned pragmas on every new DBAPI connection of `engine`."""
+    pragmas = [
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA busy_timeout={settings.sqlite_busy_timeout_ms}",
+        f"PRAGMA mmap_size={settings.sqlite_mmap_size}",
+        f"PRAGMA cache_size=-{settings.sqlite_cache_size_kib}",
+    ]
+    if read_only:
+        pragmas.append("PRAGMA query_only=ON")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record) -> None:  # noqa: ARG001
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def create_engines(url: str, tuned_sqlite: bool | None = None) -> tuple[AsyncEngine, AsyncEngine]:
+    """Return `(writer, reader)` engines for `url`.
+
+    For a SQLite file in tuned mode the writer is a single pooled connection, so writes are
+    serialized in-process instead of failing with "database is locked", and readers get
+    their own read-only pool that WAL lets proceed while a write is in flight. Otherwise
+    both names refer to the same engine.
+    """
+    if tuned_sqlite is None:
+        tuned_sqlite = settings.sqlite_tuned
+    if not (tuned_sqlite and _is_sqlite_file(url)):
+        shared = create_async_engine(url, echo=settings.sql_echo, pool_pre_ping=True)
+        return shared, shared
+
+    writer = create_async_engine(url, echo=settings.sql_echo, pool_size=1, max_overflow=0)
+    reader = create_async_engine(
+        url,
+        echo=settings.sql_echo,
+        pool_size=settings.sqlite_reader_pool_size,
+        max_overflow=0,
+    )
+    _apply_sqlite_pragmas(writer, read_only=False)
+    _apply_sqlite_pragmas(reader, read_only=True)
+    return writer, reader
+
+
+class ReplicaRouter:
+    """Round-robin over read replicas, skipping replicas that recently failed to connect."""
+
+    def __init__(
+        self,
+        urls: list[str],
+        retry_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.urls = urls
+        self.retry_seconds = retry_seconds
+        self._clock = clock
+        self.engines = [
+            create_async_engine(url, echo=settings.sql_echo, pool_pre_ping=True) for url in urls
+        ]
+        self._sessionmakers = [
+            async_sessionmaker(bind=replica, expire_on_commit=False, autoflush=False)
+            for replica in self.engines
+        ]
+        self._down_until = [0.0] * len(urls)
+        self._turn = itertools.count()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.engines)
+
+    def _candidates(self) -> list[int]:
+        now = self._clock()
+        start = next(self._turn) % len(self.engines)
+        order = [(start + offset) % len(self.engines) for offset in range(len(self.engines))]
+        return [index for index in order if self._down_until[index] <= now]
+
+    def mark_down(self, index: int) -> None:
+        self._down_until[index] = self._clock() + self.retry_seconds
+
+    async def open_session(self) -> AsyncSession | None:
+        """Session on the next reachable replica, or None when none can be reached."""
+        if not self.enabled:
+            return None
+        for index in self._candidates():
+            session = self._sessionmakers[index]()
+            try:
+                await session.connection()
+            except (DBAPIError, OSError) as exc:
+                await session.close()
+                self.mark_down(index)
+                logger.warning(
+                    "Replica %s unreachable (%s); retrying in %ss",
+                    make_url(self.urls[index]).render_as_string(hide_password=True),
+                    exc,
+                    self.retry_seconds,
+                )
+                continue
+            return session
+        return None
+
+    async def dispose(self) -> None:
+        for replica in self.engines:
+            await replica.dispose()
+
+
+install_query_hooks()
+
+engine, read_engine = create_engines(settings.sqlalchemy_database_uri)
 
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
@@ -24,8 +155,49 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+AsyncReadSessionLocal = async_sessionmaker(
+    bind=read_engine,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
+replica_router = ReplicaRouter(settings.replica_urls, settings.replica_retry_seconds)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Yield one async DB session per request."""
     async with AsyncSessionLocal() as session:
         yield session
+
+
+def _reads_pinned_to_primary(request: Request) -> bool:
+    """True for a short while after this client wrote (see `ReadYourWritesMiddleware`)."""
+    try:
+        return float(request.cookies.get(PRIMARY_STICKY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Yield a session for read-only routes.
+
+    Reads go to a replica when any is configured and reachable, unless the client wrote
+    recently; otherwise to the primary (the reader pool in tuned SQLite mode).
+    """
+    session = None
+    if replica_router.enabled and not _reads_pinned_to_primary(request):
+        session = await replica_router.open_session()
+    if session is None:
+        session = AsyncReadSessionLocal()
+    async with session:
+        yield session
+
+
+def dialect_insert(session: AsyncSession, entity: Any):
+    """Return an INSERT construct supporting ON CONFLICT for the session's dialect."""
+    dialect_name = session.get_bind().dialect.name
+    if dialect_name == "postgresql":
+        return postgresql.insert(entity)
+    if dialect_name == "sqlite":
+        return sqlite.insert(entity)
+    raise NotImplementedError(f"ON CONFLICT inserts are not supported on {dialect_name}")
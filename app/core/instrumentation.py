@@ -0,0 +1,342 @@
+"""Per-request performance metrics and a minimal Prometheus text-format registry.
+
+SQLAlchemy cursor hooks and `EnvelopeResponse.render` record into the `RequestMetrics`
+bound to the current request context; the middleware in `app/api/middleware.py` binds it,
+emits `Server-Timing` and feeds the totals into `metrics_registry`.
+
+In debug mode `query_guard` also flags requests over the statement budget and keeps the
+`EXPLAIN` output of slow statements in a ring buffer (`GET /admin/slow-queries`).
+"""
+
+import time
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from threading import Lock
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class RequestMetrics:
+    statements: int = 0
+    db_seconds: float = 0.0
+    validation_seconds: float = 0.0
+    serialization_seconds: float = 0.0
+    path: str = ""
+    started_at: float = field(default_factory=time.perf_counter)
+
+    def server_timing(self, total_seconds: float) -> str:
+        return ", ".join(
+            [
+                f'db;dur={self.db_seconds * 1000:.2f};desc="{self.statements} queries"',
+                f"validation;dur={self.validation_seconds * 1000:.2f}",
+                f"serialization;dur={self.serialization_seconds * 1000:.2f}",
+                f"total;dur={total_seconds * 1000:.2f}",
+            ]
+        )
+
+
+_current: ContextVar[RequestMetrics | None] = ContextVar("request_metrics", default=None)
+
+
+def current_metrics() -> RequestMetrics | None:
+    return _current.get()
+
+
+@contextmanager
+def track_request(path: str = "") -> Iterator[RequestMetrics]:
+    """Bind a fresh `RequestMetrics` to the current context for the duration of a request."""
+    metrics = RequestMetrics(path=path)
+    token = _current.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def timed(attribute: str) -> Iterator[None]:
+    """Add the elapsed time of the block to `attribute` of the current request's metrics."""
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        setattr(metrics, attribute, getattr(metrics, attribute) + time.perf_counter() - started)
+
+
+@dataclass
+class QueryCount:
+    statements: list[str] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+_query_counts: ContextVar[tuple[QueryCount, ...]] = ContextVar("query_counts", default=())
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCount]:
+    """Collect every SQL statement executed in this context, e.g. to assert a query budget.
+
+        with count_queries() as queries:
+            await client.get("/equipment/1")
+        assert queries.count <= 2
+    """
+    counter = QueryCount()
+    token = _query_counts.set((*_query_counts.get(), counter))
+    try:
+        yield counter
+    finally:
+        _query_counts.reset(token)
+
+
+EXPLAINABLE_PREFIXES = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+
+
+class QueryGuard:
+    """Debug-mode statement budget per request and slow-statement capture with EXPLAIN."""
+
+    def __init__(
+        self,
+        enabled: bool,
+        budget: int,
+        slow_query_ms: float,
+        buffer_size: int,
+    ) -> None:
+        self.enabled = enabled
+        self.budget = budget
+        self.slow_query_ms = slow_query_ms
+        self.slow_queries: deque[dict[str, Any]] = deque(maxlen=buffer_size)
+        self.over_budget: deque[dict[str, Any]] = deque(maxlen=buffer_size)
+
+    def check_budget(self, method: str, route: str, metrics: RequestMetrics) -> None:
+        if not self.enabled or metrics.statements <= self.budget:
+            return
+        logger.warning(
+            "%s %s ran %s SQL statements (budget %s)",
+            method,
+            route,
+            metrics.statements,
+            self.budget,
+        )
+        self.over_budget.append(
+            {
+                "recorded_at": datetime.now(UTC).isoformat(),
+                "method": method,
+                "route": route,
+                "statements": metrics.statements,
+                "budget": self.budget,
+            }
+        )
+
+    def capture(self, conn, statement: str, parameters, context, elapsed: float) -> None:
+        metrics = _current.get()
+        self.slow_queries.append(
+            {
+                "recorded_at": datetime.now(UTC).isoformat(),
+                "path": metrics.path if metrics else None,
+                "duration_ms": round(elapsed * 1000, 3),
+                "statement": statement,
+                "plan": self._explain(conn, statement, parameters, context),
+            }
+        )
+        logger.warning("Slow SQL statement (%.1fms): %s", elapsed * 1000, statement)
+
+    @staticmethod
+    def _explain(conn, statement: str, parameters, context) -> list[str] | str:
+        if context.executemany or context.execution_options.get("stream_results"):
+            return "not explained: executemany or server-side cursor"
+        if not statement.lstrip().upper().startswith(EXPLAINABLE_PREFIXES):
+            return "not explained: not a DML statement"
+
+        prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+        # A raw DBAPI cursor bypasses the engine events, so the EXPLAIN itself is never
+        # counted or captured (no recursion back into this hook).
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            cursor.execute(prefix + statement, parameters)
+            return [" ".join(str(value) for value in row) for row in cursor.fetchall()]
+        except Exception as exc:
+            return f"EXPLAIN failed: {exc}"
+        finally:
+            cursor.close()
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "budget": self.budget,
+            "slow_query_ms": self.slow_query_ms,
+            "slow_queries": list(self.slow_queries),
+            "over_budget_requests": list(self.over_budget),
+        }
+
+    def clear(self) -> None:
+        self.slow_queries.clear()
+        self.over_budget.clear()
+
+
+query_guard = QueryGuard(
+    enabled=settings.debug,
+    budget=settings.query_budget,
+    slow_query_ms=settings.slow_query_ms,
+    buffer_size=settings.slow_query_buffer_size,
+)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _current.get() is not None or _query_counts.get() or query_guard.enabled:
+        context._query_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = getattr(context, "_query_started_at", None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.statements += 1
+        metrics.db_seconds += elapsed
+    for counter in _query_counts.get():
+        counter.statements.append(statement)
+    if query_guard.enabled and elapsed * 1000 >= query_guard.slow_query_ms:
+        query_guard.capture(conn, statement, parameters, context, elapsed)
+
+
+def install_query_hooks() -> None:
+    """Listen on the `Engine` class so every engine (including test engines) is covered."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+class MetricsRegistry:
+    """Per-route request metrics rendered in the Prometheus text exposition format."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self._lock = Lock()
+        self._latency: dict[tuple[str, str], Histogram] = {}
+        self._requests: dict[tuple[str, str, str], int] = {}
+        self._statements: dict[tuple[str, str], int] = {}
+        self._db_seconds: dict[tuple[str, str], float] = {}
+        self._serialization_seconds: dict[tuple[str, str], float] = {}
+
+    def observe(
+        self,
+        method: str,
+        route: str,
+        status_code: int,
+        duration_seconds: float,
+        metrics: RequestMetrics,
+    ) -> None:
+        key = (method, route)
+        with self._lock:
+            if key not in self._latency:
+                self._latency[key] = Histogram(self.buckets)
+            self._latency[key].observe(duration_seconds)
+            status_key = (method, route, str(status_code))
+            self._requests[status_key] = self._requests.get(status_key, 0) + 1
+            self._statements[key] = self._statements.get(key, 0) + metrics.statements
+            self._db_seconds[key] = self._db_seconds.get(key, 0.0) + metrics.db_seconds
+            self._serialization_seconds[key] = (
+                self._serialization_seconds.get(key, 0.0)
+                + metrics.validation_seconds
+                + metrics.serialization_seconds
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            for series in (
+                self._latency,
+                self._requests,
+                self._statements,
+                self._db_seconds,
+                self._serialization_seconds,
+            ):
+                series.clear()
+
+    def render(self) -> str:
+        lines = [
+            "# HELP http_request_duration_seconds Request latency by route.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            for (method, route), histogram in sorted(self._latency.items()):
+                cumulative = 0
+                bounds = [*(str(bound) for bound in histogram.buckets), "+Inf"]
+                for bound, count in zip(bounds, histogram.counts, strict=True):
+                    cumulative += count
+                    labels = _labels(method=method, route=route, le=bound)
+                    lines.append(f"http_request_duration_seconds_bucket{labels} {cumulative}")
+                labels = _labels(method=method, route=route)
+                lines.append(f"http_request_duration_seconds_sum{labels} {histogram.sum}")
+                lines.append(f"http_request_duration_seconds_count{labels} {histogram.count}")
+
+            lines += [
+                "# HELP http_requests_total Requests by route and status code.",
+                "# TYPE http_requests_total counter",
+            ]
+            for (method, route, status), count in sorted(self._requests.items()):
+                labels = _labels(method=method, route=route, status=status)
+                lines.append(f"http_requests_total{labels} {count}")
+
+            for name, help_text, series in (
+                ("db_statements_total", "SQL statements executed.", self._statements),
+                ("db_seconds_total", "Time spent executing SQL.", self._db_seconds),
+                (
+                    "serialization_seconds_total",
+                    "Time spent validating and rendering responses.",
+                    self._serialization_seconds,
+                ),
+            ):
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+                for (method, route), value in sorted(series.items()):
+                    lines.append(f"{name}{_labels(method=method, route=route)} {value}")
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,112 @@
+"""In-process pub/sub hub with bounded per-subscriber queues and slow-consumer eviction.
+
+Publishing never blocks and never waits on a subscriber: a message is offered to every
+queue with `put_nowait`. A subscriber whose queue is full has fallen too far behind; it is
+dropped from the hub and its stream ends, so the client reconnects and resyncs instead of
+silently missing updates.
+"""
+
+import asyncio
+import json
+from collections.abc import Hashable
+from typing import Any
+
+from app.core.config import settings
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+_CLOSED = object()
+
+
+def format_sse(event: str, data: Any) -> bytes:
+    """Encode one Server-Sent Events frame. Done once per publish, not per subscriber."""
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n".encode()
+
+
+class Subscription:
+    def __init__(self, hub: "PubSubHub", topic: Hashable, queue_size: int) -> None:
+        self.hub = hub
+        self.topic = topic
+        self.queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=queue_size)
+        self.evicted = False
+
+    def _close(self) -> None:
+        # Drop the backlog so the close marker fits and is seen next.
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(_CLOSED)
+
+    async def get(self, timeout: float | None = None) -> Any | None:
+        """Next message; None when `timeout` passes first. Raises StopAsyncIteration once
+        the subscription has been closed or evicted."""
+        try:
+            message = self.queue.get_nowait()
+        except asyncio.QueueEmpty:
+            try:
+                message = await asyncio.wait_for(self.queue.get(), timeout)
+            except TimeoutError:
+                return None
+        if message is _CLOSED:
+            raise StopAsyncIteration
+        return message
+
+    def close(self) -> None:
+        self.hub.unsubscribe(self)
+
+
+class PubSubHub:
+    def __init__(self, queue_size: int) -> None:
+        self.queue_size = queue_size
+        self._topics: dict[Hashable, set[Subscription]] = {}
+        self.published = 0
+        self.delivered = 0
+        self.evicted = 0
+
+    def subscribe(self, topic: Hashable) -> Subscription:
+        subscription = Subscription(self, topic, self.queue_size)
+        self._topics.setdefault(topic, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscribers = self._topics.get(subscription.topic)
+        if subscribers is None or subscription not in subscribers:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._topics[subscription.topic]
+        subscription._close()
+
+    def publish(self, topic: Hashable, message: Any) -> int:
+        """Offer `message` to every subscriber of `topic`; returns how many accepted it."""
+        self.published += 1
+        delivered = 0
+        for subscription in list(self._topics.get(topic, ())):
+            try:
+                subscription.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                subscription.evicted = True
+                self.evicted += 1
+                logger.warning("Evicting slow subscriber on topic %s", topic)
+                self.unsubscribe(subscription)
+            else:
+                delivered += 1
+        self.delivered += delivered
+        return delivered
+
+    def subscriber_count(self, topic: Hashable | None = None) -> int:
+        if topic is not None:
+            return len(self._topics.get(topic, ()))
+        return sum(len(subscribers) for subscribers in self._topics.values())
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "topics": len(self._topics),
+            "subscribers": self.subscriber_count(),
+            "published": self.published,
+            "delivered": self.delivered,
+            "evicted": self.evicted,
+        }
+
+
+equipment_hub = PubSubHub(queue_size=settings.sse_queue_size)
@@ -1,19 +1,39 @@
 """Application entrypoint."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 
 from app.api.exceptions import register_exception_handlers
+from app.api.middleware import register_middleware
 from app.api.response import SuccessResponse, success_response
 from app.api.v1 import api_router
 from app.core.config import settings
+from app.core.database import replica_router
+from app.core.instrumentation import metrics_registry
+from app.services.llm_provider_service import close_llm_provider, get_llm_provider
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:  # noqa: ARG001
+    # Build the provider up front so incomplete LLM settings fail at startup.
+    get_llm_provider()
+    yield
+    await close_llm_provider()
+    await replica_router.dispose()
+
 
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     debug=settings.debug,
+    lifespan=lifespan,
 )
 
 register_exception_handlers(app)
+register_middleware(app)
 app.include_router(api_router, prefix=settings.api_prefix)
 
 
@@ -24,3 +44,12 @@ async def health() -> SuccessResponse[dict[str, str]]:
         message="Service is healthy",
         data={"status": "ok", "environment": settings.app_env},
     )
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    """Prometheus text-format request metrics for this process."""
+    return PlainTextResponse(
+        metrics_registry.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
@@ -1,7 +1,19 @@
 """ORM model package exports."""
 
+from app.repositories.ai_assessment_cache import AIAssessmentCacheEntry
+from app.repositories.change_log import ChangeLogEntry
 from app.repositories.department import Department
 from app.repositories.equipment import Equipment
 from app.repositories.equipment_request import EquipmentRequest
+from app.repositories.inventory_counter import InventoryCounter
+from app.repositories.pending_request_counter import PendingRequestCounter
 
-__all__ = ["Department", "Equipment", "EquipmentRequest"]
+__all__ = [
+    "AIAssessmentCacheEntry",
+    "ChangeLogEntry",
+    "Department",
+    "Equipment",
+    "EquipmentRequest",
+    "InventoryCounter",
+    "PendingRequestCounter",
+]
@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class AIAssessmentCacheEntry(Base):
+    """Persistent tier of the AI assessment cache."""
+
+    __tablename__ = "ai_assessment_cache"
+
+    cache_key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    equipment_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    result: Mapped[str] = mapped_column(Text, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
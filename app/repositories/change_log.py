@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, Index, Integer, String, func
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class ChangeLogEntry(Base):
+    """Append-only record of a mutation, written in the same transaction as the change."""
+
+    __tablename__ = "change_log"
+
+    __table_args__ = (Index("ix_change_log_organization_id_id", "organization_id", "id"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    organization_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    resource: Mapped[str] = mapped_column(String(40), nullable=False)
+    resource_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    action: Mapped[str] = mapped_column(String(20), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    # Same text format as the SQLite server default, so retention cutoffs compare exactly.
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True).with_variant(sqlite.DATETIME(truncate_microseconds=True), "sqlite"),
+        nullable=False,
+        server_default=func.now(),
+    )
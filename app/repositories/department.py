@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, String
+from sqlalchemy import Index, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -11,3 +11,12 @@ class Department(Base):
     organization_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
 
     equipment_items = relationship("Equipment", back_populates="department")
+
+
+# Department names are unique per organization, case-insensitively.
+uq_departments_organization_name = Index(
+    "uq_departments_organization_name",
+    Department.organization_id,
+    func.lower(Department.name),
+    unique=True,
+)
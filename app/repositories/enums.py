@@ -9,4 +9,19 @@ class EquipmentStatus(str, Enum):
 class EquipmentRequestStatus(str, Enum):
     PENDING = "pending"
     APPROVED = "approved"
-    REJECTED = "rejected"
\ No newline at end of file
+    REJECTED = "rejected"
+
+class CounterResource(str, Enum):
+    EQUIPMENT = "equipment"
+    EQUIPMENT_REQUEST = "equipment_request"
+
+class ChangeResource(str, Enum):
+    DEPARTMENT = "department"
+    EQUIPMENT = "equipment"
+    EQUIPMENT_REQUEST = "equipment_request"
+
+class ChangeAction(str, Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    APPROVED = "approved"
+    REJECTED = "rejected"
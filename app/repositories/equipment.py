@@ -1,6 +1,17 @@
-from datetime import datetime
+from datetime import UTC, datetime
 
-from sqlalchemy import DateTime, Enum as SqlEnum, ForeignKey, Index, Integer, String, func
+from sqlalchemy import (
+    DDL,
+    DateTime,
+    Enum as SqlEnum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    event,
+    func,
+    literal_column,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -35,8 +46,85 @@ class Equipment(Base):
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        # Python-side so SQLite keeps sub-second precision; cache keys depend on it.
+        onupdate=lambda: datetime.now(UTC),
     )
 
     department = relationship("Department", back_populates="equipment_items")
     equipment_requests = relationship("EquipmentRequest", back_populates="equipment")
+
+
+# Same name, manufacturer and model may appear once per department, case-insensitively.
+uq_equipment_department_identity = Index(
+    "uq_equipment_department_identity",
+    Equipment.department_id,
+    func.lower(Equipment.name),
+    func.lower(Equipment.manufacturer),
+    func.lower(Equipment.model_number),
+    unique=True,
+)
+
+
+# Text search (GET /equipment/search). Postgres: trigram GIN index over one lowercased
+# document. SQLite: FTS5 trigram table with external content, kept in sync by triggers.
+# The separator is a literal, not a bound parameter, so queries compile to exactly the
+# indexed expression; Postgres only uses an expression index on a textual match.
+_SEARCH_SEPARATOR = literal_column("' '", String)
+equipment_search_document = func.lower(
+    Equipment.name
+    + _SEARCH_SEPARATOR
+    + Equipment.manufacturer
+    + _SEARCH_SEPARATOR
+    + Equipment.model_number
+)
+
+Index(
+    "ix_equipment_search_trgm",
+    equipment_search_document.label("search_document"),
+    postgresql_using="gin",
+    postgresql_ops={"search_document": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
+
+EQUIPMENT_SEARCH_TABLE = "equipment_search"
+
+SQLITE_SEARCH_DDL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {EQUIPMENT_SEARCH_TABLE} USING fts5(
+        name, manufacturer, model_number,
+        content='equipment', content_rowid='id', tokenize='trigram'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS equipment_search_ai AFTER INSERT ON equipment BEGIN
+        INSERT INTO {EQUIPMENT_SEARCH_TABLE}(rowid, name, manufacturer, model_number)
+        VALUES (new.id, new.name, new.manufacturer, new.model_number);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS equipment_search_ad AFTER DELETE ON equipment BEGIN
+        INSERT INTO {EQUIPMENT_SEARCH_TABLE}(
+            {EQUIPMENT_SEARCH_TABLE}, rowid, name, manufacturer, model_number
+        )
+        VALUES ('delete', old.id, old.name, old.manufacturer, old.model_number);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS equipment_search_au
+    AFTER UPDATE OF name, manufacturer, model_number ON equipment BEGIN
+        INSERT INTO {EQUIPMENT_SEARCH_TABLE}(
+            {EQUIPMENT_SEARCH_TABLE}, rowid, name, manufacturer, model_number
+        )
+        VALUES ('delete', old.id, old.name, old.manufacturer, old.model_number);
+        INSERT INTO {EQUIPMENT_SEARCH_TABLE}(rowid, name, manufacturer, model_number)
+        VALUES (new.id, new.name, new.manufacturer, new.model_number);
+    END""",
+]
+
+for _statement in SQLITE_SEARCH_DDL:
+    event.listen(Equipment.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(
+    Equipment.__table__,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {EQUIPMENT_SEARCH_TABLE}").execute_if(dialect="sqlite"),
+)
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
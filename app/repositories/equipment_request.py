@@ -1,6 +1,7 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum as SqlEnum, ForeignKey, Integer, String, Text, func
+from sqlalchemy import DateTime, Enum as SqlEnum, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -26,8 +27,47 @@ class EquipmentRequest(Base):
         server_default=EquipmentRequestStatus.PENDING.value,
     )
     organization_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    # SQLite stores the server default as 'YYYY-MM-DD HH:MM:SS'; binding datetimes in the same
+    # text format keeps keyset comparisons on created_at exact.
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, server_default=func.now()
+        DateTime(timezone=True).with_variant(sqlite.DATETIME(truncate_microseconds=True), "sqlite"),
+        nullable=False,
+        server_default=func.now(),
     )
+    claimed_by: Mapped[str | None] = mapped_column(String(120), nullable=True)
+    claimed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    equipment = relationship("Equipment", back_populates="equipment_requests")
+
+
+_pending = EquipmentRequest.status == EquipmentRequestStatus.PENDING
+
+# One pending request per requester and equipment, enforced atomically by the database.
+Index(
+    "uq_equipment_requests_pending_requester",
+    EquipmentRequest.equipment_id,
+    EquipmentRequest.organization_id,
+    func.lower(EquipmentRequest.requested_by),
+    unique=True,
+    postgresql_where=_pending,
+    sqlite_where=_pending,
+)
+
+# Newest-first listing per organization; keyset pages seek on (created_at, id).
+ix_equipment_requests_organization_created = Index(
+    "ix_equipment_requests_organization_created",
+    EquipmentRequest.organization_id,
+    EquipmentRequest.created_at.desc(),
+    EquipmentRequest.id.desc(),
+)
 
-    equipment = relationship("Equipment", back_populates="equipment_requests")
\ No newline at end of file
+# Approver work queue: pending requests per organization, most urgent (priority 1) and oldest
+# first. Keyset pages and claims walk this index in order.
+ix_equipment_requests_queue = Index(
+    "ix_equipment_requests_queue",
+    EquipmentRequest.organization_id,
+    EquipmentRequest.status,
+    EquipmentRequest.priority,
+    EquipmentRequest.created_at,
+    EquipmentRequest.id,
+)
@@ -0,0 +1,29 @@
+from sqlalchemy import Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class InventoryCounter(Base):
+    """Row counts per (resource, organization, department, status), kept in step with writes."""
+
+    __tablename__ = "inventory_counters"
+
+    __table_args__ = (
+        UniqueConstraint(
+            "resource",
+            "organization_id",
+            "department_id",
+            "status",
+            name="uq_inventory_counters_key",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    resource: Mapped[str] = mapped_column(String(40), nullable=False)
+    organization_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    department_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    status: Mapped[str] = mapped_column(String(40), nullable=False)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    # Incremented on every write touching this key; summed into collection ETags.
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
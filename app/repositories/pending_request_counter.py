@@ -0,0 +1,19 @@
+from sqlalchemy import Integer, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class PendingRequestCounter(Base):
+    """Pending equipment requests per (organization, priority), kept in step with writes."""
+
+    __tablename__ = "pending_request_counters"
+
+    __table_args__ = (
+        UniqueConstraint("organization_id", "priority", name="uq_pending_request_counters_key"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    organization_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    priority: Mapped[int] = mapped_column(Integer, nullable=False)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
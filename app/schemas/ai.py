@@ -13,3 +13,19 @@ class AIAssessmentOutput(BaseModel):
     risk_score: int = Field(ge=1, le=10)
     risk_factors: list[str]
     recommendations: list[str]
+
+
+class AIAssessmentBatchItem(BaseModel):
+    equipment_id: int = Field(ge=1)
+    input: AIAssessmentInput
+
+
+class AIAssessmentBatchRequest(BaseModel):
+    items: list[AIAssessmentBatchItem] = Field(min_length=1, max_length=500)
+
+
+class AIAssessmentBatchResult(BaseModel):
+    equipment_id: int
+    success: bool
+    data: AIAssessmentOutput | None = None
+    error: str | None = None
@@ -0,0 +1,18 @@
+"""Change feed schemas."""
+
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ChangeLogEntryRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    organization_id: int
+    resource: str
+    resource_id: int
+    action: str
+    payload: dict[str, Any]
+    created_at: datetime
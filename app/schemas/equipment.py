@@ -1,6 +1,7 @@
 """Equipment request/response schemas."""
 
 from datetime import datetime
+from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -30,3 +31,11 @@ class EquipmentRead(EquipmentBase):
     id: int
     created_at: datetime
     updated_at: datetime
+
+
+class EquipmentBulkItemResult(BaseModel):
+    index: int
+    status: Literal["created", "invalid", "not_found", "conflict"]
+    id: int | None = None
+    message: str | None = None
+    errors: list[dict[str, Any]] | None = None
@@ -15,6 +15,16 @@ class EquipmentRequestCreate(BaseModel):
     organization_id: int = Field(ge=1)
 
 
+class EquipmentRequestBulkAction(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=1000)
+
+
+class EquipmentRequestClaim(BaseModel):
+    organization_id: int = Field(ge=1)
+    claimed_by: str = Field(min_length=2, max_length=120)
+    limit: int = Field(default=1, ge=1, le=50)
+
+
 class EquipmentRequestRead(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -26,3 +36,5 @@ class EquipmentRequestRead(BaseModel):
     status: EquipmentRequestStatus
     organization_id: int
     created_at: datetime
+    claimed_by: str | None = None
+    claimed_at: datetime | None = None
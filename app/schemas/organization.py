@@ -0,0 +1,27 @@
+"""Organization dashboard schemas."""
+
+from pydantic import BaseModel
+
+
+class DepartmentEquipmentSummary(BaseModel):
+    department_id: int
+    department_name: str | None
+    total: int
+    by_status: dict[str, int]
+
+
+class EquipmentSummary(BaseModel):
+    total: int
+    by_status: dict[str, int]
+    departments: list[DepartmentEquipmentSummary]
+
+
+class PendingRequestSummary(BaseModel):
+    total: int
+    by_priority: dict[int, int]
+
+
+class OrganizationSummary(BaseModel):
+    organization_id: int
+    equipment: EquipmentSummary
+    pending_requests: PendingRequestSummary
@@ -0,0 +1,144 @@
+"""Two-tier cache for AI assessments: in-process LRU plus an optional database table."""
+
+import hashlib
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import and_, delete, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import dialect_insert
+from app.repositories.ai_assessment_cache import AIAssessmentCacheEntry
+from app.repositories.equipment import Equipment
+from app.schemas.ai import AIAssessmentInput, AIAssessmentOutput
+
+
+def _version_prefix(equipment: Equipment) -> str:
+    return f"ai_assessment:{equipment.id}:{equipment.updated_at.isoformat()}:"
+
+
+def assessment_cache_key(equipment: Equipment, payload: AIAssessmentInput) -> str:
+    """`ai_assessment:{equipment_id}:{updated_at}:{payload_hash}`, per llm_design.md.
+
+    Any equipment update changes `updated_at`, so older entries simply stop matching.
+    """
+    payload_hash = hashlib.sha256(payload.model_dump_json().encode()).hexdigest()
+    return f"{_version_prefix(equipment)}{payload_hash}"
+
+
+class AIAssessmentCache:
+    def __init__(self, max_entries: int, ttl_seconds: int, persistent: bool = False) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.persistent = persistent
+        self.memory: TTLCache[str, AIAssessmentOutput] = TTLCache(max_entries, ttl_seconds)
+        self.persistent_hits = 0
+        self.persistent_misses = 0
+
+    async def get(self, key: str, db: AsyncSession | None = None) -> AIAssessmentOutput | None:
+        return (await self.get_many([key], db)).get(key)
+
+    async def get_many(
+        self,
+        keys: Sequence[str],
+        db: AsyncSession | None = None,
+    ) -> dict[str, AIAssessmentOutput]:
+        """Look keys up in memory, then fetch the remainder from the table in one query."""
+        found: dict[str, AIAssessmentOutput] = {}
+        missing: set[str] = set()
+        for key in keys:
+            assessment = self.memory.get(key)
+            if assessment is None:
+                missing.add(key)
+            else:
+                found[key] = assessment
+
+        if not missing or not self.persistent or db is None:
+            return found
+
+        stmt = select(AIAssessmentCacheEntry.cache_key, AIAssessmentCacheEntry.result).where(
+            AIAssessmentCacheEntry.cache_key.in_(missing),
+            AIAssessmentCacheEntry.expires_at > datetime.now(UTC),
+        )
+        stored = dict((await db.execute(stmt)).all())
+        self.persistent_hits += len(stored)
+        self.persistent_misses += len(missing) - len(stored)
+
+        for key, result in stored.items():
+            found[key] = AIAssessmentOutput.model_validate_json(result)
+            self.memory.set(key, found[key])
+        return found
+
+    async def set(
+        self,
+        key: str,
+        equipment: Equipment,
+        assessment: AIAssessmentOutput,
+        db: AsyncSession | None = None,
+    ) -> None:
+        await self.set_many([(key, equipment, assessment)], db)
+
+    async def set_many(
+        self,
+        entries: Sequence[tuple[str, Equipment, AIAssessmentOutput]],
+        db: AsyncSession | None = None,
+    ) -> None:
+        for key, _, assessment in entries:
+            self.memory.set(key, assessment)
+        if not entries or not self.persistent or db is None:
+            return
+
+        # Entries for earlier equipment versions can never match again; drop them here.
+        prefixes = {equipment.id: _version_prefix(equipment) for _, equipment, _ in entries}
+        await db.execute(
+            delete(AIAssessmentCacheEntry).where(
+                or_(
+                    *(
+                        and_(
+                            AIAssessmentCacheEntry.equipment_id == equipment_id,
+                            ~AIAssessmentCacheEntry.cache_key.startswith(prefix, autoescape=True),
+                        )
+                        for equipment_id, prefix in prefixes.items()
+                    )
+                )
+            )
+        )
+
+        expires_at = datetime.now(UTC) + timedelta(seconds=self.ttl_seconds)
+        rows = {
+            key: {
+                "cache_key": key,
+                "equipment_id": equipment.id,
+                "result": assessment.model_dump_json(),
+                "expires_at": expires_at,
+            }
+            for key, equipment, assessment in entries
+        }
+        stmt = dialect_insert(db, AIAssessmentCacheEntry)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AIAssessmentCacheEntry.cache_key],
+            set_={"result": stmt.excluded.result, "expires_at": stmt.excluded.expires_at},
+        )
+        await db.execute(stmt, list(rows.values()))
+        # Committed by the caller's service, together with the rest of its unit of work.
+        await db.flush()
+
+    def clear(self) -> None:
+        self.memory.clear()
+        self.persistent_hits = self.persistent_misses = 0
+
+    def stats(self) -> dict:
+        return {
+            **self.memory.stats(),
+            "persistent": self.persistent,
+            "persistent_hits": self.persistent_hits,
+            "persistent_misses": self.persistent_misses,
+        }
+
+
+ai_assessment_cache = AIAssessmentCache(
+    max_entries=settings.ai_cache_max_entries,
+    ttl_seconds=settings.ai_cache_ttl_seconds,
+    persistent=settings.ai_cache_persistent,
+)
@@ -1,11 +1,174 @@
+import asyncio
+from collections.abc import Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.exceptions import ServiceUnavailableException
+from app.core.config import settings
 from app.repositories.enums import EquipmentStatus
 from app.repositories.equipment import Equipment
-from app.schemas.ai import AIAssessmentInput, AIAssessmentOutput
+from app.schemas.ai import (
+    AIAssessmentBatchItem,
+    AIAssessmentBatchResult,
+    AIAssessmentInput,
+    AIAssessmentOutput,
+)
+from app.services.ai_assessment_cache import (
+    AIAssessmentCache,
+    ai_assessment_cache,
+    assessment_cache_key,
+)
+from app.services.department_cache import DepartmentLookup
+from app.services.llm_provider_service import (
+    HTTPLLMProvider,
+    LLMProviderError,
+    get_llm_provider,
+)
 
 
 class AIAssessmentService:
     """Simulates AI security/risk assessment for equipment."""
 
+    def __init__(
+        self,
+        db: AsyncSession | None = None,
+        cache: AIAssessmentCache = ai_assessment_cache,
+        provider: HTTPLLMProvider | None = None,
+    ) -> None:
+        self.db = db
+        self.cache = cache
+        self.provider = provider or get_llm_provider()
+
+    async def assess(self, equipment: Equipment, payload: AIAssessmentInput) -> AIAssessmentOutput:
+        """Return a cached assessment for this equipment version and input, or generate one."""
+        key = assessment_cache_key(equipment, payload)
+        assessment = await self.cache.get(key, self.db)
+        if assessment is None:
+            organization_ids = await self._organization_ids([equipment])
+            await self._release_connection()
+            try:
+                assessment = await self._score(
+                    equipment, payload, organization_ids.get(equipment.department_id)
+                )
+            except LLMProviderError as exc:
+                raise ServiceUnavailableException(str(exc)) from exc
+            await self.cache.set(key, equipment, assessment, self.db)
+            await self._commit()
+        return assessment
+
+    async def assess_many(
+        self,
+        equipment_by_id: dict[int, Equipment],
+        items: Sequence[AIAssessmentBatchItem],
+    ) -> list[AIAssessmentBatchResult]:
+        """Score a batch in one pass: one cache lookup, bounded concurrent scoring, one write."""
+        keys = [
+            assessment_cache_key(equipment_by_id[item.equipment_id], item.input)
+            if item.equipment_id in equipment_by_id
+            else None
+            for item in items
+        ]
+        cached = await self.cache.get_many([key for key in keys if key], self.db)
+        misses = {
+            key: item
+            for key, item in zip(keys, items, strict=True)
+            if key is not None and key not in cached
+        }
+        organization_ids = await self._organization_ids(
+            [equipment_by_id[item.equipment_id] for item in misses.values()]
+        )
+        await self._release_connection()
+
+        semaphore = asyncio.Semaphore(settings.ai_batch_concurrency)
+        scored: dict[str, AIAssessmentOutput] = {}
+
+        async def score(key: str, item: AIAssessmentBatchItem) -> None:
+            equipment = equipment_by_id[item.equipment_id]
+            async with semaphore:
+                scored[key] = await self._score(
+                    equipment, item.input, organization_ids.get(equipment.department_id)
+                )
+
+        outcomes = await asyncio.gather(
+            *(score(key, item) for key, item in misses.items()),
+            return_exceptions=True,
+        )
+        errors = {
+            key: str(outcome) or type(outcome).__name__
+            for key, outcome in zip(misses, outcomes, strict=True)
+            if isinstance(outcome, Exception)
+        }
+        await self.cache.set_many(
+            [
+                (key, equipment_by_id[misses[key].equipment_id], assessment)
+                for key, assessment in scored.items()
+            ],
+            self.db,
+        )
+        await self._commit()
+
+        results: list[AIAssessmentBatchResult] = []
+        for key, item in zip(keys, items, strict=True):
+            if key is None:
+                results.append(
+                    AIAssessmentBatchResult(
+                        equipment_id=item.equipment_id, success=False, error="Equipment not found"
+                    )
+                )
+            elif key in errors:
+                results.append(
+                    AIAssessmentBatchResult(
+                        equipment_id=item.equipment_id, success=False, error=errors[key]
+                    )
+                )
+            else:
+                results.append(
+                    AIAssessmentBatchResult(
+                        equipment_id=item.equipment_id,
+                        success=True,
+                        data=cached.get(key) or scored[key],
+                    )
+                )
+        return results
+
+    async def _organization_ids(self, equipment_items: Sequence[Equipment]) -> dict[int, int]:
+        """Department -> organization, needed only for per-organization provider limits."""
+        if self.provider is None or self.db is None:
+            return {}
+        departments = await DepartmentLookup(self.db).get_many(
+            equipment.department_id for equipment in equipment_items
+        )
+        return {
+            department_id: department.organization_id
+            for department_id, department in departments.items()
+        }
+
+    async def _commit(self) -> None:
+        """Commit the persistent cache writes made through this service's session."""
+        if self.db is not None and self.db.in_transaction():
+            await self.db.commit()
+
+    async def _release_connection(self) -> None:
+        """End the read transaction before provider calls so no pooled connection (the single
+        writer in tuned SQLite mode) is held while waiting on the network."""
+        if self.provider is not None and self.db is not None and self.db.in_transaction():
+            await self.db.commit()
+
+    async def _score(
+        self,
+        equipment: Equipment,
+        payload: AIAssessmentInput,
+        organization_id: int | None = None,
+    ) -> AIAssessmentOutput:
+        if self.provider is None:
+            return self.generate(equipment, payload)
+        return await self.provider.assess(
+            equipment,
+            payload,
+            organization_id,
+            coalesce_key=assessment_cache_key(equipment, payload),
+        )
+
     def generate(self, equipment: Equipment, payload: AIAssessmentInput) -> AIAssessmentOutput:
         score = 2
         risk_factors: list[str] = []
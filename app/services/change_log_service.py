@@ -0,0 +1,171 @@
+"""Append-only change feed: recorded with each mutation, read by cursor with long-polling."""
+
+import asyncio
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, func, insert, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.change_log import ChangeLogEntry
+from app.repositories.enums import ChangeAction, ChangeResource
+
+
+class ChangeNotifier:
+    """Wakes long-polling readers in this process after a change is committed.
+
+    Readers in other worker processes are not woken; their poll ends at its timeout and
+    the next one picks the changes up from the table.
+    """
+
+    def __init__(self) -> None:
+        self.version = 0
+        self._waiters: set[asyncio.Future[None]] = set()
+
+    def notify(self) -> None:
+        self.version += 1
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        self._waiters.clear()
+
+    async def wait(self, seen_version: int, timeout: float) -> bool:
+        """Wait until a change newer than `seen_version` is committed; False on timeout."""
+        if self.version != seen_version:
+            return True
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except TimeoutError:
+            return False
+        finally:
+            self._waiters.discard(waiter)
+        return True
+
+
+change_notifier = ChangeNotifier()
+
+
+def change_entry(
+    organization_id: int,
+    resource: ChangeResource,
+    resource_id: int,
+    action: ChangeAction,
+    payload: dict[str, Any],
+) -> dict[str, Any]:
+    return {
+        "organization_id": organization_id,
+        "resource": resource.value,
+        "resource_id": resource_id,
+        "action": action.value,
+        "payload": payload,
+    }
+
+
+class ChangeLogService:
+    """Entries are written through the caller's session, so they commit with its writes."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def record(
+        self,
+        organization_id: int,
+        resource: ChangeResource,
+        resource_id: int,
+        action: ChangeAction,
+        payload: dict[str, Any],
+    ) -> None:
+        entry = change_entry(organization_id, resource, resource_id, action, payload)
+        await self.record_many([entry])
+
+    async def record_many(self, entries: Sequence[dict[str, Any]]) -> None:
+        if not entries:
+            return
+        if self.db.get_bind().dialect.name == "postgresql":
+            # Sequence values are handed out before commit, so concurrent writers could commit
+            # ids out of order and a reader would skip the late one. Holding this lock until
+            # commit keeps id order equal to commit order. SQLite already has a single writer.
+            await self.db.execute(text("SELECT pg_advisory_xact_lock(hashtext('change_log'))"))
+        await self.db.execute(insert(ChangeLogEntry), list(entries))
+
+    async def oldest_id(self) -> int | None:
+        return (await self.db.execute(select(func.min(ChangeLogEntry.id)))).scalar_one()
+
+    async def read_since(
+        self,
+        since_id: int,
+        organization_id: int | None,
+        limit: int,
+    ) -> list[ChangeLogEntry]:
+        stmt = select(ChangeLogEntry).where(ChangeLogEntry.id > since_id)
+        if organization_id is not None:
+            stmt = stmt.where(ChangeLogEntry.organization_id == organization_id)
+        stmt = stmt.order_by(ChangeLogEntry.id).limit(limit)
+        return list((await self.db.execute(stmt)).scalars().all())
+
+    async def poll(
+        self,
+        since_id: int,
+        organization_id: int | None,
+        limit: int,
+        wait_seconds: float,
+    ) -> list[ChangeLogEntry]:
+        """Entries after `since_id`; when there are none, wait up to `wait_seconds` for more."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait_seconds
+        while True:
+            seen_version = change_notifier.version
+            entries = await self.read_since(since_id, organization_id, limit)
+            remaining = deadline - loop.time()
+            if entries or remaining <= 0:
+                return entries
+            # End the read transaction (and free its connection) while waiting; a snapshot
+            # held open across the wait would never see the new rows.
+            await self.db.rollback()
+            if not await change_notifier.wait(seen_version, remaining):
+                return await self.read_since(since_id, organization_id, limit)
+
+    async def compact(
+        self,
+        retention_seconds: int,
+        max_entries: int,
+        batch_size: int = 10_000,
+    ) -> int:
+        """Delete entries past the retention age or beyond the newest `max_entries`.
+
+        The newest entry is always kept, so readers can still tell an expired cursor (older
+        than the oldest retained id) from an idle feed. Deletes run in id-ordered batches,
+        each in its own transaction, to keep write locks short.
+        """
+        newest_id = (await self.db.execute(select(func.max(ChangeLogEntry.id)))).scalar_one()
+        if newest_id is None:
+            return 0
+
+        cutoff = datetime.now(UTC) - timedelta(seconds=retention_seconds)
+        expired_stmt = select(func.max(ChangeLogEntry.id)).where(
+            ChangeLogEntry.id < newest_id,
+            or_(
+                ChangeLogEntry.created_at < cutoff,
+                ChangeLogEntry.id <= newest_id - max_entries,
+            ),
+        )
+        last_expired_id = (await self.db.execute(expired_stmt)).scalar_one()
+        oldest = await self.oldest_id()
+        await self.db.commit()
+        if last_expired_id is None or oldest is None:
+            return 0
+
+        deleted = 0
+        for start in range(oldest, last_expired_id + 1, batch_size):
+            result = await self.db.execute(
+                delete(ChangeLogEntry).where(
+                    ChangeLogEntry.id >= start,
+                    ChangeLogEntry.id <= min(start + batch_size - 1, last_expired_id),
+                )
+            )
+            await self.db.commit()
+            deleted += result.rowcount
+        return deleted
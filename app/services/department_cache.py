@@ -0,0 +1,110 @@
+"""Read-through department lookups backed by a bounded in-process cache."""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.repositories.department import Department
+
+
+@dataclass(frozen=True, slots=True)
+class CachedDepartment:
+    """Detached snapshot of a department row; safe to share across sessions."""
+
+    id: int
+    name: str
+    organization_id: int
+
+    @classmethod
+    def from_row(cls, department: Department) -> "CachedDepartment":
+        return cls(
+            id=department.id,
+            name=department.name,
+            organization_id=department.organization_id,
+        )
+
+
+class DepartmentCache:
+    """Departments by id and by organization.
+
+    Any code that creates, renames or deletes a department must call `invalidate`.
+    The TTL bounds staleness in other worker processes, which never see that call.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: int) -> None:
+        self.by_id: TTLCache[int, CachedDepartment] = TTLCache(max_entries, ttl_seconds)
+        self.by_organization: TTLCache[int, tuple[CachedDepartment, ...]] = TTLCache(
+            max_entries, ttl_seconds
+        )
+
+    def invalidate(
+        self,
+        department_id: int | None = None,
+        organization_id: int | None = None,
+    ) -> None:
+        if department_id is not None:
+            self.by_id.pop(department_id)
+        if organization_id is not None:
+            self.by_organization.pop(organization_id)
+
+    def clear(self) -> None:
+        self.by_id.clear()
+        self.by_organization.clear()
+
+    def stats(self) -> dict:
+        return {"by_id": self.by_id.stats(), "by_organization": self.by_organization.stats()}
+
+
+department_cache = DepartmentCache(
+    max_entries=settings.department_cache_max_entries,
+    ttl_seconds=settings.department_cache_ttl_seconds,
+)
+
+
+class DepartmentLookup:
+    """Hot-path department existence and organization checks shared by services."""
+
+    def __init__(self, db: AsyncSession, cache: DepartmentCache = department_cache) -> None:
+        self.db = db
+        self.cache = cache
+
+    async def get(self, department_id: int) -> CachedDepartment | None:
+        return (await self.get_many([department_id])).get(department_id)
+
+    async def get_many(self, department_ids: Iterable[int]) -> dict[int, CachedDepartment]:
+        """Resolve ids from the cache, loading any misses with one IN query."""
+        found: dict[int, CachedDepartment] = {}
+        missing: set[int] = set()
+        for department_id in set(department_ids):
+            department = self.cache.by_id.get(department_id)
+            if department is None:
+                missing.add(department_id)
+            else:
+                found[department_id] = department
+
+        if missing:
+            stmt = select(Department).where(Department.id.in_(missing))
+            for row in (await self.db.execute(stmt)).scalars().all():
+                department = CachedDepartment.from_row(row)
+                self.cache.by_id.set(department.id, department)
+                found[department.id] = department
+        return found
+
+    async def list_for_organization(self, organization_id: int) -> list[CachedDepartment]:
+        departments = self.cache.by_organization.get(organization_id)
+        if departments is None:
+            stmt = (
+                select(Department)
+                .where(Department.organization_id == organization_id)
+                .order_by(Department.id.asc())
+            )
+            rows = (await self.db.execute(stmt)).scalars().all()
+            departments = tuple(CachedDepartment.from_row(row) for row in rows)
+            self.cache.by_organization.set(organization_id, departments)
+            for department in departments:
+                self.cache.by_id.set(department.id, department)
+        return list(departments)
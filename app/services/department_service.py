@@ -1,41 +1,57 @@
 """Business logic for department operations."""
 
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.exceptions import ConflictException
-from app.repositories.department import Department
-from app.schemas.department import DepartmentCreate
+from app.core.database import dialect_insert
+from app.repositories.department import Department, uq_departments_organization_name
+from app.repositories.enums import ChangeAction, ChangeResource
+from app.schemas.department import DepartmentCreate, DepartmentRead
+from app.services.change_log_service import ChangeLogService, change_notifier
+from app.services.department_cache import CachedDepartment, DepartmentLookup, department_cache
 
 
 class DepartmentService:
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
+        self.lookup = DepartmentLookup(db)
 
     async def create_department(self, payload: DepartmentCreate) -> Department:
-        duplicate_stmt = select(Department).where(
-            Department.organization_id == payload.organization_id,
-            func.lower(Department.name) == payload.name.strip().lower(),
+        # One round trip, race-free: the unique lower(name) index decides, not a pre-check.
+        stmt = (
+            dialect_insert(self.db, Department)
+            .values(name=payload.name.strip(), organization_id=payload.organization_id)
+            .on_conflict_do_nothing(
+                index_elements=list(uq_departments_organization_name.expressions)
+            )
+            .returning(Department)
         )
-        duplicate = (await self.db.execute(duplicate_stmt)).scalar_one_or_none()
-        if duplicate:
+        department = (await self.db.scalars(stmt)).one_or_none()
+        if department is None:
+            await self.db.rollback()
             raise ConflictException("Department already exists")
 
-        department = Department(
-            name=payload.name.strip(),
-            organization_id=payload.organization_id,
+        await ChangeLogService(self.db).record(
+            department.organization_id,
+            ChangeResource.DEPARTMENT,
+            department.id,
+            ChangeAction.CREATED,
+            DepartmentRead.model_validate(department).model_dump(mode="json"),
         )
-        self.db.add(department)
         await self.db.commit()
-        await self.db.refresh(department)
+        change_notifier.notify()
+        department_cache.invalidate(organization_id=department.organization_id)
         return department
 
-    async def get_department(self, department_id: int) -> Department | None:
-        stmt = select(Department).where(Department.id == department_id)
-        return (await self.db.execute(stmt)).scalar_one_or_none()
+    async def get_department(self, department_id: int) -> CachedDepartment | None:
+        return await self.lookup.get(department_id)
 
-    async def list_departments(self, organization_id: int | None = None) -> list[Department]:
-        stmt = select(Department).order_by(Department.id.asc())
+    async def list_departments(
+        self,
+        organization_id: int | None = None,
+    ) -> list[Department] | list[CachedDepartment]:
         if organization_id is not None:
-            stmt = stmt.where(Department.organization_id == organization_id)
+            return await self.lookup.list_for_organization(organization_id)
+        stmt = select(Department).order_by(Department.id.asc())
         return list((await self.db.execute(stmt)).scalars().all())
@@ -1,99 +1,347 @@
 """Business logic for equipment request workflow."""
 
-from sqlalchemy import func, select
+from collections import Counter
+from collections.abc import AsyncIterator, Sequence
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import func, insert, or_, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.exceptions import BadRequestException, ConflictException, NotFoundException
+from app.core.config import settings
 from app.repositories.department import Department
-from app.repositories.enums import EquipmentRequestStatus, EquipmentStatus
+from app.repositories.enums import (
+    ChangeAction,
+    ChangeResource,
+    CounterResource,
+    EquipmentRequestStatus,
+    EquipmentStatus,
+)
 from app.repositories.equipment import Equipment
 from app.repositories.equipment_request import EquipmentRequest
-from app.schemas.equipment_request import EquipmentRequestCreate
+from app.schemas.equipment_request import EquipmentRequestCreate, EquipmentRequestRead
+from app.services.change_log_service import ChangeLogService, change_entry, change_notifier
+from app.services.inventory_counter_service import InventoryCounterService
 
 
-class EquipmentRequestService:
-    def __init__(self, db: AsyncSession) -> None:
-        self.db = db
+def _seek_past(columns: tuple, values: tuple):
+    """Row value for keyset comparisons, bound with the columns' own types.
 
-    async def _get_equipment_or_none(self, equipment_id: int) -> Equipment | None:
-        stmt = select(Equipment).where(Equipment.id == equipment_id)
-        return (await self.db.execute(stmt)).scalar_one_or_none()
+    Untyped binds would render datetimes in the generic format, which on SQLite does not
+    compare equal to the stored `created_at` text.
+    """
+    return tuple_(*values, types=[column.type for column in columns])
 
-    async def _get_department_or_none(self, department_id: int) -> Department | None:
-        stmt = select(Department).where(Department.id == department_id)
-        return (await self.db.execute(stmt)).scalar_one_or_none()
 
-    async def _get_request_or_none(self, request_id: int) -> EquipmentRequest | None:
-        stmt = select(EquipmentRequest).where(EquipmentRequest.id == request_id)
-        return (await self.db.execute(stmt)).scalar_one_or_none()
+QUEUE_ORDER = (EquipmentRequest.priority, EquipmentRequest.created_at, EquipmentRequest.id)
+LIST_SEEK = (EquipmentRequest.created_at, EquipmentRequest.id)
+
+
+class EquipmentRequestService:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.counters = InventoryCounterService(db)
+        self.changes = ChangeLogService(db)
 
     async def create_request(self, payload: EquipmentRequestCreate) -> EquipmentRequest:
-        equipment = await self._get_equipment_or_none(payload.equipment_id)
-        if not equipment:
+        requested_by = payload.requested_by.strip()
+        pending_duplicate = (
+            select(EquipmentRequest.id)
+            .where(
+                EquipmentRequest.equipment_id == payload.equipment_id,
+                EquipmentRequest.organization_id == payload.organization_id,
+                func.lower(EquipmentRequest.requested_by) == requested_by.lower(),
+                EquipmentRequest.status == EquipmentRequestStatus.PENDING,
+            )
+            .exists()
+        )
+        validation_stmt = (
+            select(
+                Equipment.status,
+                Equipment.department_id,
+                Department.organization_id,
+                pending_duplicate.label("has_pending_duplicate"),
+            )
+            .outerjoin(Department, Department.id == Equipment.department_id)
+            .where(Equipment.id == payload.equipment_id)
+        )
+        row = (await self.db.execute(validation_stmt)).one_or_none()
+        if not row:
             raise NotFoundException("Equipment not found")
 
-        if equipment.status == EquipmentStatus.DECOMMISSIONED:
+        if row.status == EquipmentStatus.DECOMMISSIONED:
             raise BadRequestException("Decommissioned equipment cannot be requested")
 
-        duplicate_stmt = select(EquipmentRequest).where(
-            EquipmentRequest.equipment_id == payload.equipment_id,
-            EquipmentRequest.organization_id == payload.organization_id,
-            func.lower(EquipmentRequest.requested_by) == payload.requested_by.strip().lower(),
-            EquipmentRequest.status == EquipmentRequestStatus.PENDING,
-        )
-        duplicate = (await self.db.execute(duplicate_stmt)).scalar_one_or_none()
-        if duplicate:
+        if row.has_pending_duplicate:
             raise ConflictException("Pending request already exists for this equipment")
 
-        department = await self._get_department_or_none(equipment.department_id)
-        if not department:
+        if row.organization_id is None:
             raise NotFoundException("Department not found for equipment")
 
-        if department.organization_id != payload.organization_id:
+        if row.organization_id != payload.organization_id:
             raise BadRequestException("organization_id does not match equipment organization")
 
-        request = EquipmentRequest(
-            equipment_id=payload.equipment_id,
-            requested_by=payload.requested_by.strip(),
-            justification=payload.justification.strip(),
-            priority=payload.priority,
-            organization_id=payload.organization_id,
+        insert_stmt = insert(EquipmentRequest).returning(EquipmentRequest)
+        values = {
+            "equipment_id": payload.equipment_id,
+            "requested_by": requested_by,
+            "justification": payload.justification.strip(),
+            "priority": payload.priority,
+            "organization_id": payload.organization_id,
+        }
+        try:
+            request = (await self.db.scalars(insert_stmt, [values])).one()
+        except IntegrityError as exc:
+            # Lost a race with a concurrent insert; the partial unique index rejected it.
+            await self.db.rollback()
+            raise ConflictException("Pending request already exists for this equipment") from exc
+
+        await self.counters.adjust(
+            CounterResource.EQUIPMENT_REQUEST,
+            payload.organization_id,
+            row.department_id,
+            EquipmentRequestStatus.PENDING,
+            1,
+        )
+        await self.counters.adjust_pending(payload.organization_id, payload.priority, 1)
+        await self.changes.record(
+            payload.organization_id,
+            ChangeResource.EQUIPMENT_REQUEST,
+            request.id,
+            ChangeAction.CREATED,
+            EquipmentRequestRead.model_validate(request).model_dump(mode="json"),
         )
-        self.db.add(request)
         await self.db.commit()
-        await self.db.refresh(request)
+        change_notifier.notify()
         return request
 
-    async def approve_request(self, request_id: int) -> EquipmentRequest:
-        request = await self._get_request_or_none(request_id)
-        if not request:
+    async def _resolve_pending(
+        self,
+        request_ids: Sequence[int],
+        status: EquipmentRequestStatus,
+    ) -> list[EquipmentRequest]:
+        """Move pending requests to `status` in one conditional UPDATE ... RETURNING.
+
+        Ids that are missing or no longer pending are simply not matched, so concurrent
+        approvers can never both win. Counters are adjusted for the returned rows only.
+        """
+        department_id = (
+            select(Equipment.department_id)
+            .where(Equipment.id == EquipmentRequest.equipment_id)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(EquipmentRequest)
+            .where(
+                EquipmentRequest.id.in_(request_ids),
+                EquipmentRequest.status == EquipmentRequestStatus.PENDING,
+            )
+            .values(status=status)
+            .returning(EquipmentRequest, department_id.label("department_id"))
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        rows = (await self.db.execute(stmt)).all()
+        if not rows:
+            return []
+
+        counter_deltas: Counter = Counter()
+        pending_deltas: Counter = Counter()
+        for request, request_department_id in rows:
+            organization_id = request.organization_id
+            key = (CounterResource.EQUIPMENT_REQUEST, organization_id, request_department_id)
+            counter_deltas[(*key, EquipmentRequestStatus.PENDING)] -= 1
+            counter_deltas[(*key, status)] += 1
+            pending_deltas[(organization_id, request.priority)] -= 1
+        await self.counters.adjust_many(dict(counter_deltas))
+        await self.counters.adjust_pending_many(dict(pending_deltas))
+        action = (
+            ChangeAction.APPROVED
+            if status == EquipmentRequestStatus.APPROVED
+            else ChangeAction.REJECTED
+        )
+        await self.changes.record_many(
+            [
+                change_entry(
+                    request.organization_id,
+                    ChangeResource.EQUIPMENT_REQUEST,
+                    request.id,
+                    action,
+                    EquipmentRequestRead.model_validate(request).model_dump(mode="json"),
+                )
+                for request, _ in rows
+            ]
+        )
+        await self.db.commit()
+        change_notifier.notify()
+        return sorted((request for request, _ in rows), key=lambda request: request.id)
+
+    async def _resolve_one(
+        self,
+        request_id: int,
+        status: EquipmentRequestStatus,
+        action: str,
+    ) -> EquipmentRequest:
+        resolved = await self._resolve_pending([request_id], status)
+        if resolved:
+            return resolved[0]
+
+        # Nothing matched; only now pay for a lookup to tell the two failures apart.
+        exists_stmt = select(EquipmentRequest.id).where(EquipmentRequest.id == request_id)
+        if (await self.db.execute(exists_stmt)).scalar_one_or_none() is None:
             raise NotFoundException("Equipment request not found")
+        raise BadRequestException(f"Only pending requests can be {action}")
 
-        if request.status != EquipmentRequestStatus.PENDING:
-            raise BadRequestException("Only pending requests can be approved")
+    async def _resolve_many(
+        self,
+        request_ids: Sequence[int],
+        status: EquipmentRequestStatus,
+    ) -> tuple[list[EquipmentRequest], list[int]]:
+        unique_ids = list(dict.fromkeys(request_ids))
+        changed = await self._resolve_pending(unique_ids, status)
+        changed_ids = {request.id for request in changed}
+        return changed, [request_id for request_id in unique_ids if request_id not in changed_ids]
+
+    async def approve_request(self, request_id: int) -> EquipmentRequest:
+        return await self._resolve_one(request_id, EquipmentRequestStatus.APPROVED, "approved")
 
-        request.status = EquipmentRequestStatus.APPROVED
+    async def reject_request(self, request_id: int) -> EquipmentRequest:
+        return await self._resolve_one(request_id, EquipmentRequestStatus.REJECTED, "rejected")
+
+    async def approve_requests(
+        self,
+        request_ids: Sequence[int],
+    ) -> tuple[list[EquipmentRequest], list[int]]:
+        """Approve every pending request among `request_ids`; returns (changed, skipped ids)."""
+        return await self._resolve_many(request_ids, EquipmentRequestStatus.APPROVED)
+
+    async def reject_requests(
+        self,
+        request_ids: Sequence[int],
+    ) -> tuple[list[EquipmentRequest], list[int]]:
+        """Reject every pending request among `request_ids`; returns (changed, skipped ids)."""
+        return await self._resolve_many(request_ids, EquipmentRequestStatus.REJECTED)
+
+    def _queue_stmt(self, organization_id: int, unclaimed_only: bool):
+        stmt = select(EquipmentRequest).where(
+            EquipmentRequest.organization_id == organization_id,
+            EquipmentRequest.status == EquipmentRequestStatus.PENDING,
+        )
+        if unclaimed_only:
+            stale_before = datetime.now(UTC) - timedelta(seconds=settings.queue_claim_ttl_seconds)
+            stmt = stmt.where(
+                or_(
+                    EquipmentRequest.claimed_at.is_(None),
+                    EquipmentRequest.claimed_at < stale_before,
+                )
+            )
+        return stmt.order_by(*QUEUE_ORDER)
+
+    async def list_queue(
+        self,
+        organization_id: int,
+        after: tuple[int, datetime, int] | None,
+        page_size: int,
+        unclaimed_only: bool = False,
+    ) -> tuple[list[EquipmentRequest], EquipmentRequest | None]:
+        """Keyset page of the pending queue; returns items and the row to seek after next.
+
+        Seeks on (priority, created_at, id) so each page is a range scan of
+        `ix_equipment_requests_queue`, however deep into the queue it is.
+        """
+        stmt = self._queue_stmt(organization_id, unclaimed_only)
+        if after is not None:
+            stmt = stmt.where(tuple_(*QUEUE_ORDER) > _seek_past(QUEUE_ORDER, after))
+        items = list((await self.db.execute(stmt.limit(page_size + 1))).scalars().all())
+        next_after = items[page_size - 1] if len(items) > page_size else None
+        return items[:page_size], next_after
+
+    async def claim_from_queue(
+        self,
+        organization_id: int,
+        claimed_by: str,
+        limit: int,
+    ) -> list[EquipmentRequest]:
+        """Claim the next unclaimed pending requests for one approver, in queue order.
+
+        On Postgres the candidate rows are locked with FOR UPDATE SKIP LOCKED, so concurrent
+        approvers each get different rows without waiting on one another. SQLite has a single
+        writer, and the clause is simply not rendered.
+        """
+        candidates = (
+            self._queue_stmt(organization_id, unclaimed_only=True)
+            .with_only_columns(EquipmentRequest.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(EquipmentRequest)
+            .where(EquipmentRequest.id.in_(candidates.scalar_subquery()))
+            .values(claimed_by=claimed_by.strip(), claimed_at=datetime.now(UTC))
+            .returning(EquipmentRequest)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        claimed = list((await self.db.execute(stmt)).scalars().all())
         await self.db.commit()
-        await self.db.refresh(request)
-        return request
+        return sorted(
+            claimed,
+            key=lambda request: (request.priority, request.created_at, request.id),
+        )
 
     async def list_by_organization(
         self,
         organization_id: int,
         page: int,
         page_size: int,
-    ) -> tuple[list[EquipmentRequest], int]:
+        include_total: bool = True,
+    ) -> tuple[list[EquipmentRequest], int | None]:
         base_stmt = select(EquipmentRequest).where(
             EquipmentRequest.organization_id == organization_id
         )
-        total_stmt = select(func.count()).select_from(base_stmt.subquery())
-        total_items = (await self.db.execute(total_stmt)).scalar_one()
+        total_items = None
+        if include_total:
+            total_items = await self.counters.total(
+                CounterResource.EQUIPMENT_REQUEST,
+                organization_id=organization_id,
+            )
 
         stmt = (
-            base_stmt.order_by(EquipmentRequest.created_at.desc())
+            base_stmt.order_by(EquipmentRequest.created_at.desc(), EquipmentRequest.id.desc())
             .offset((page - 1) * page_size)
             .limit(page_size)
         )
         items = (await self.db.execute(stmt)).scalars().all()
 
-        return list(items), int(total_items)
+        return list(items), total_items
+
+    async def list_by_organization_after(
+        self,
+        organization_id: int,
+        after: tuple[datetime, int] | None,
+        page_size: int,
+    ) -> tuple[list[EquipmentRequest], EquipmentRequest | None]:
+        """Keyset page, newest first; returns items and the row to seek after next.
+
+        Seeks on (created_at, id) along `ix_equipment_requests_organization_created`, so the
+        cost of a page does not depend on how many older requests the organization has.
+        """
+        stmt = select(EquipmentRequest).where(EquipmentRequest.organization_id == organization_id)
+        if after is not None:
+            stmt = stmt.where(tuple_(*LIST_SEEK) < _seek_past(LIST_SEEK, after))
+
+        stmt = stmt.order_by(EquipmentRequest.created_at.desc(), EquipmentRequest.id.desc())
+        items = list((await self.db.execute(stmt.limit(page_size + 1))).scalars().all())
+        next_after = items[page_size - 1] if len(items) > page_size else None
+        return items[:page_size], next_after
+
+    async def stream_by_organization(self, organization_id: int) -> AsyncIterator[EquipmentRequest]:
+        """Yield an organization's requests through a server-side cursor."""
+        stmt = (
+            select(EquipmentRequest)
+            .where(EquipmentRequest.organization_id == organization_id)
+            .order_by(EquipmentRequest.id.asc())
+            .execution_options(yield_per=settings.export_fetch_size)
+        )
+        result = await self.db.stream_scalars(stmt)
+        async for request in result:
+            yield request
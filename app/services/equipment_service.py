@@ -1,74 +1,288 @@
 """Business logic for equipment operations."""
 
-from sqlalchemy import func, select
+from collections import Counter
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+
+from sqlalchemy import case, column, func, literal_column, select, table
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.exceptions import ConflictException, NotFoundException
+from app.api.conditional import check_if_match, equipment_etag
+from app.api.exceptions import BadRequestException, ConflictException, NotFoundException
+from app.core.config import settings
+from app.core.database import dialect_insert
+from app.core.pubsub import equipment_hub, format_sse
 from app.repositories.department import Department
-from app.repositories.enums import EquipmentStatus
-from app.repositories.equipment import Equipment
-from app.schemas.equipment import EquipmentCreate, EquipmentUpdate
+from app.repositories.enums import ChangeAction, ChangeResource, CounterResource, EquipmentStatus
+from app.repositories.equipment import (
+    EQUIPMENT_SEARCH_TABLE,
+    Equipment,
+    equipment_search_document,
+    uq_equipment_department_identity,
+)
+from app.repositories.equipment_request import EquipmentRequest
+from app.schemas.equipment import (
+    EquipmentBulkItemResult,
+    EquipmentCreate,
+    EquipmentRead,
+    EquipmentUpdate,
+)
+from app.services.change_log_service import ChangeLogService, change_entry, change_notifier
+from app.services.department_cache import DepartmentLookup
+from app.services.inventory_counter_service import InventoryCounterService
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
 class EquipmentService:
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
-
-    async def _get_department_or_none(self, department_id: int) -> Department | None:
-        stmt = select(Department).where(Department.id == department_id)
-        return (await self.db.execute(stmt)).scalar_one_or_none()
+        self.counters = InventoryCounterService(db)
+        self.changes = ChangeLogService(db)
+        self.departments = DepartmentLookup(db)
 
     async def create_equipment(self, payload: EquipmentCreate) -> Equipment:
-        department = await self._get_department_or_none(payload.department_id)
+        department = await self.departments.get(payload.department_id)
         if not department:
             raise NotFoundException("Department not found")
 
-        duplicate_stmt = select(Equipment).where(
-            Equipment.department_id == payload.department_id,
-            func.lower(Equipment.name) == payload.name.strip().lower(),
-            func.lower(Equipment.manufacturer) == payload.manufacturer.strip().lower(),
-            func.lower(Equipment.model_number) == payload.model_number.strip().lower(),
+        stmt = (
+            dialect_insert(self.db, Equipment)
+            .values(
+                name=payload.name.strip(),
+                manufacturer=payload.manufacturer.strip(),
+                model_number=payload.model_number.strip(),
+                category=payload.category.strip(),
+                status=payload.status,
+                department_id=payload.department_id,
+            )
+            .on_conflict_do_nothing(
+                index_elements=list(uq_equipment_department_identity.expressions)
+            )
+            .returning(Equipment)
         )
-        duplicate = (await self.db.execute(duplicate_stmt)).scalar_one_or_none()
-        if duplicate:
+        equipment = (await self.db.scalars(stmt)).one_or_none()
+        if equipment is None:
+            await self.db.rollback()
             raise ConflictException("Equipment already exists in this department")
 
-        equipment = Equipment(
-            name=payload.name.strip(),
-            manufacturer=payload.manufacturer.strip(),
-            model_number=payload.model_number.strip(),
-            category=payload.category.strip(),
-            status=payload.status,
-            department_id=payload.department_id,
+        await self.counters.adjust(
+            CounterResource.EQUIPMENT,
+            department.organization_id,
+            payload.department_id,
+            payload.status,
+            1,
+        )
+        await self.changes.record(
+            department.organization_id,
+            ChangeResource.EQUIPMENT,
+            equipment.id,
+            ChangeAction.CREATED,
+            EquipmentRead.model_validate(equipment).model_dump(mode="json"),
         )
-        self.db.add(equipment)
         await self.db.commit()
-        await self.db.refresh(equipment)
+        change_notifier.notify()
         return equipment
 
-    async def get_equipment(self, equipment_id: int) -> Equipment:
+    async def bulk_create_equipment(
+        self,
+        payloads: Sequence[tuple[int, EquipmentCreate]],
+    ) -> list[EquipmentBulkItemResult]:
+        """Insert many rows in one transaction; `payloads` pairs each item with its input index.
+
+        Departments are resolved with one IN query, duplicates are checked with one query per
+        chunk, and each chunk is written as a multi-row INSERT ... ON CONFLICT DO NOTHING
+        RETURNING.
+        """
+        departments = await self.departments.get_many(
+            payload.department_id for _, payload in payloads
+        )
+
+        results: list[EquipmentBulkItemResult] = []
+        seen_keys: set[tuple[int, str, str, str]] = set()
+        counter_deltas: Counter = Counter()
+        changes: list[dict] = []
+        chunk_size = settings.bulk_import_chunk_size
+
+        for start in range(0, len(payloads), chunk_size):
+            chunk = payloads[start : start + chunk_size]
+            keys = {
+                index: (
+                    payload.department_id,
+                    payload.name.strip().lower(),
+                    payload.manufacturer.strip().lower(),
+                    payload.model_number.strip().lower(),
+                )
+                for index, payload in chunk
+            }
+
+            candidate_names = {key[1] for key in keys.values()}
+            existing_stmt = select(
+                Equipment.department_id,
+                func.lower(Equipment.name),
+                func.lower(Equipment.manufacturer),
+                func.lower(Equipment.model_number),
+            ).where(
+                Equipment.department_id.in_({key[0] for key in keys.values()}),
+                func.lower(Equipment.name).in_(candidate_names),
+            )
+            existing_keys = {tuple(row) for row in (await self.db.execute(existing_stmt)).all()}
+
+            pending: list[tuple[int, dict]] = []
+            for index, payload in chunk:
+                key = keys[index]
+                if payload.department_id not in departments:
+                    results.append(
+                        EquipmentBulkItemResult(
+                            index=index, status="not_found", message="Department not found"
+                        )
+                    )
+                elif key in existing_keys or key in seen_keys:
+                    results.append(
+                        EquipmentBulkItemResult(
+                            index=index,
+                            status="conflict",
+                            message="Equipment already exists in this department",
+                        )
+                    )
+                else:
+                    seen_keys.add(key)
+                    pending.append(
+                        (
+                            index,
+                            {
+                                "name": payload.name.strip(),
+                                "manufacturer": payload.manufacturer.strip(),
+                                "model_number": payload.model_number.strip(),
+                                "category": payload.category.strip(),
+                                "status": payload.status,
+                                "department_id": payload.department_id,
+                            },
+                        )
+                    )
+
+            if not pending:
+                continue
+
+            # Rows inserted concurrently since the pre-check are skipped by ON CONFLICT and
+            # reported as conflicts instead of failing the whole chunk.
+            insert_stmt = (
+                dialect_insert(self.db, Equipment)
+                .on_conflict_do_nothing(
+                    index_elements=list(uq_equipment_department_identity.expressions)
+                )
+                # Every EquipmentRead field, so the change log gets the same payload as create.
+                .returning(*(Equipment.__table__.c[name] for name in EquipmentRead.model_fields))
+            )
+            inserted = await self.db.execute(insert_stmt, [row for _, row in pending])
+            inserted_rows = {
+                (
+                    row.department_id,
+                    row.name.lower(),
+                    row.manufacturer.lower(),
+                    row.model_number.lower(),
+                ): row
+                for row in inserted.all()
+            }
+            for index, row in pending:
+                created = inserted_rows.get(keys[index])
+                if created is None:
+                    results.append(
+                        EquipmentBulkItemResult(
+                            index=index,
+                            status="conflict",
+                            message="Equipment already exists in this department",
+                        )
+                    )
+                    continue
+                equipment_id = created.id
+                results.append(
+                    EquipmentBulkItemResult(index=index, status="created", id=equipment_id)
+                )
+                department_id = row["department_id"]
+                organization_id = departments[department_id].organization_id
+                counter_deltas[
+                    (CounterResource.EQUIPMENT, organization_id, department_id, row["status"].value)
+                ] += 1
+                changes.append(
+                    change_entry(
+                        organization_id,
+                        ChangeResource.EQUIPMENT,
+                        equipment_id,
+                        ChangeAction.CREATED,
+                        EquipmentRead.model_validate(created).model_dump(mode="json"),
+                    )
+                )
+
+        await self.counters.adjust_many(dict(counter_deltas))
+        await self.changes.record_many(changes)
+        await self.db.commit()
+        if changes:
+            change_notifier.notify()
+        return results
+
+    async def get_equipment(self, equipment_id: int, for_update: bool = False) -> Equipment:
         stmt = select(Equipment).where(Equipment.id == equipment_id)
+        if for_update:
+            stmt = stmt.with_for_update()
         equipment = (await self.db.execute(stmt)).scalar_one_or_none()
         if not equipment:
             raise NotFoundException("Equipment not found")
         return equipment
 
-    async def list_equipment(
+    async def get_updated_at(self, equipment_id: int) -> datetime | None:
+        """Fetch only `updated_at`, enough to answer a conditional GET."""
+        stmt = select(Equipment.updated_at).where(Equipment.id == equipment_id)
+        return (await self.db.execute(stmt)).scalar_one_or_none()
+
+    async def collection_state(
         self,
         department_id: int | None,
         status: EquipmentStatus | None,
-        page: int,
-        page_size: int,
-    ) -> tuple[list[Equipment], int]:
+    ) -> tuple[int, int]:
+        """`(total, version)` of the filtered equipment collection from the counter store."""
+        return await self.counters.total_and_version(
+            CounterResource.EQUIPMENT,
+            department_id=department_id,
+            status=status,
+        )
+
+    def _filtered_stmt(self, department_id: int | None, status: EquipmentStatus | None):
         stmt = select(Equipment)
 
         if department_id is not None:
             stmt = stmt.where(Equipment.department_id == department_id)
         if status is not None:
             stmt = stmt.where(Equipment.status == status)
+        return stmt
+
+    async def get_equipment_many(self, equipment_ids: Sequence[int]) -> dict[int, Equipment]:
+        """Load several equipment rows with one IN query; missing ids are simply absent."""
+        if not equipment_ids:
+            return {}
+        stmt = select(Equipment).where(Equipment.id.in_(set(equipment_ids)))
+        return {item.id: item for item in (await self.db.execute(stmt)).scalars().all()}
+
+    async def list_equipment(
+        self,
+        department_id: int | None,
+        status: EquipmentStatus | None,
+        page: int,
+        page_size: int,
+        include_total: bool = True,
+    ) -> tuple[list[Equipment], int | None]:
+        stmt = self._filtered_stmt(department_id, status)
 
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_items = (await self.db.execute(count_stmt)).scalar_one()
+        total_items = None
+        if include_total:
+            total_items = await self.counters.total(
+                CounterResource.EQUIPMENT,
+                department_id=department_id,
+                status=status,
+            )
 
         stmt = (
             stmt.order_by(Equipment.id.desc())
@@ -77,20 +291,206 @@ class EquipmentService:
         )
         items = (await self.db.execute(stmt)).scalars().all()
 
-        return list(items), int(total_items)
+        return list(items), total_items
+
+    async def list_equipment_after(
+        self,
+        department_id: int | None,
+        status: EquipmentStatus | None,
+        after_id: int | None,
+        page_size: int,
+    ) -> tuple[list[Equipment], int | None]:
+        """Keyset page ordered by id desc; returns items and the id to seek after next."""
+        stmt = self._filtered_stmt(department_id, status)
+        if after_id is not None:
+            stmt = stmt.where(Equipment.id < after_id)
+
+        stmt = stmt.order_by(Equipment.id.desc()).limit(page_size + 1)
+        items = list((await self.db.execute(stmt)).scalars().all())
+
+        next_after_id = items[page_size - 1].id if len(items) > page_size else None
+        return items[:page_size], next_after_id
+
+    async def stream_equipment(
+        self,
+        organization_id: int,
+        department_id: int | None,
+        status: EquipmentStatus | None,
+    ) -> AsyncIterator[Equipment]:
+        """Yield an organization's equipment through a server-side cursor."""
+        stmt = (
+            self._filtered_stmt(department_id, status)
+            .join(Department, Department.id == Equipment.department_id)
+            .where(Department.organization_id == organization_id)
+            .order_by(Equipment.id.asc())
+            .execution_options(yield_per=settings.export_fetch_size)
+        )
+        result = await self.db.stream_scalars(stmt)
+        async for equipment in result:
+            yield equipment
+
+    async def search_equipment(
+        self,
+        query: str,
+        organization_id: int,
+        department_id: int | None = None,
+        limit: int = 20,
+    ) -> list[Equipment]:
+        """Search an organization's equipment by name, manufacturer or model number.
+
+        Every whitespace-separated term must match as a substring. Terms of three or more
+        characters are served by the trigram index (FTS5 on SQLite, pg_trgm on Postgres);
+        shorter ones only narrow those candidates. Ranking runs over the newest
+        `search_candidate_limit` matches, so broad terms never rank the whole catalog.
+        """
+        terms = [term.lower() for term in query.split()]
+        indexed_terms = [term for term in terms if len(term) >= 3]
+        if not indexed_terms:
+            raise BadRequestException("Search needs at least one term of 3 or more characters")
+
+        candidates = (
+            select(Equipment.id)
+            .join(Department, Department.id == Equipment.department_id)
+            .where(Department.organization_id == organization_id)
+        )
+        if department_id is not None:
+            candidates = candidates.where(Equipment.department_id == department_id)
+
+        use_fts = self.db.get_bind().dialect.name == "sqlite"
+        for term in terms:
+            if len(term) < 3 or not use_fts:
+                candidates = candidates.where(
+                    equipment_search_document.like(f"%{_escape_like(term)}%", escape="\\")
+                )
+        if use_fts:
+            fts = table(EQUIPMENT_SEARCH_TABLE, column("rowid"))
+            match = " ".join('"' + term.replace('"', '""') + '"' for term in indexed_terms)
+            candidates = (
+                candidates.join(fts, fts.c.rowid == Equipment.id)
+                .where(literal_column(EQUIPMENT_SEARCH_TABLE).op("MATCH")(match))
+                .order_by(fts.c.rowid.desc())
+            )
+        else:
+            candidates = candidates.order_by(Equipment.id.desc())
+        candidates = candidates.limit(settings.search_candidate_limit).subquery()
+
+        # Name prefix matches first, then name substring matches, then shorter names.
+        lead = _escape_like(indexed_terms[0])
+        name = func.lower(Equipment.name)
+        relevance = case(
+            (name.like(f"{lead}%", escape="\\"), 0),
+            (name.like(f"%{lead}%", escape="\\"), 1),
+            else_=2,
+        )
+        stmt = (
+            select(Equipment)
+            .join(candidates, candidates.c.id == Equipment.id)
+            .order_by(relevance, func.length(Equipment.name), Equipment.id.desc())
+            .limit(limit)
+        )
+        return list((await self.db.execute(stmt)).scalars().all())
 
-    async def update_equipment(self, equipment_id: int, payload: EquipmentUpdate) -> Equipment:
-        equipment = await self.get_equipment(equipment_id)
+    async def update_equipment(
+        self,
+        equipment_id: int,
+        payload: EquipmentUpdate,
+        if_match: str | None = None,
+    ) -> Equipment:
+        # Locked even without If-Match: the counter deltas below are computed from the status
+        # and department read here, and a concurrent PUT must not apply them a second time.
+        equipment = await self.get_equipment(equipment_id, for_update=True)
+        check_if_match(if_match, equipment_etag(equipment.id, equipment.updated_at))
 
-        department = await self._get_department_or_none(payload.department_id)
+        department = await self.departments.get(payload.department_id)
         if not department:
             raise NotFoundException("Department not found")
 
+        previous_department = department
+        if equipment.department_id != payload.department_id:
+            previous_department = await self.departments.get(equipment.department_id)
+        # Always written, even when the key is unchanged, to bump the list ETag version.
+        counter_deltas: Counter = Counter()
+        counter_deltas[
+            (
+                CounterResource.EQUIPMENT,
+                previous_department.organization_id,
+                equipment.department_id,
+                equipment.status.value,
+            )
+        ] -= 1
+        counter_deltas[
+            (
+                CounterResource.EQUIPMENT,
+                department.organization_id,
+                payload.department_id,
+                payload.status.value,
+            )
+        ] += 1
+        if equipment.department_id != payload.department_id:
+            # Request counters are keyed by the equipment's department; its requests move too.
+            request_counts = await self.db.execute(
+                select(EquipmentRequest.organization_id, EquipmentRequest.status, func.count())
+                .where(EquipmentRequest.equipment_id == equipment.id)
+                .group_by(EquipmentRequest.organization_id, EquipmentRequest.status)
+            )
+            for organization_id, request_status, count in request_counts:
+                for department_id, delta in (
+                    (equipment.department_id, -count),
+                    (payload.department_id, count),
+                ):
+                    key = (
+                        CounterResource.EQUIPMENT_REQUEST,
+                        organization_id,
+                        department_id,
+                        request_status.value,
+                    )
+                    counter_deltas[key] += delta
+        await self.counters.adjust_many(dict(counter_deltas))
+
+        previous_department_id = equipment.department_id
+        previous_status = equipment.status
         for key, value in payload.model_dump().items():
             if isinstance(value, str):
                 value = value.strip()
             setattr(equipment, key, value)
 
+        # Flush first so the logged payload carries the new updated_at (set Python-side).
+        try:
+            await self.db.flush()
+        except IntegrityError as exc:
+            # Renamed or moved onto an existing identity; the expression unique index says no.
+            await self.db.rollback()
+            raise ConflictException("Equipment already exists in this department") from exc
+        snapshot = EquipmentRead.model_validate(equipment).model_dump(mode="json")
+        await self.changes.record(
+            department.organization_id,
+            ChangeResource.EQUIPMENT,
+            equipment.id,
+            ChangeAction.UPDATED,
+            snapshot,
+        )
         await self.db.commit()
+        change_notifier.notify()
+        if previous_department_id != equipment.department_id or previous_status != equipment.status:
+            self._publish_status_change(snapshot, previous_department_id, previous_status)
         await self.db.refresh(equipment)
         return equipment
+
+    @staticmethod
+    def _publish_status_change(
+        snapshot: dict,
+        previous_department_id: int,
+        previous_status: EquipmentStatus,
+    ) -> None:
+        """Push the committed row to the department streams; built from the snapshot already
+        in hand, so subscribers cost no query. A move is sent to both departments."""
+        message = format_sse(
+            "equipment.updated",
+            {
+                "equipment": snapshot,
+                "previous_department_id": previous_department_id,
+                "previous_status": previous_status.value,
+            },
+        )
+        for department_id in {previous_department_id, snapshot["department_id"]}:
+            equipment_hub.publish(department_id, message)
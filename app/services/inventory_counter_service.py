@@ -0,0 +1,155 @@
+"""Maintained row counters used instead of COUNT(*) on list endpoints."""
+
+from enum import Enum
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import dialect_insert
+from app.repositories.enums import CounterResource
+from app.repositories.inventory_counter import InventoryCounter
+from app.repositories.pending_request_counter import PendingRequestCounter
+
+CounterKey = tuple[CounterResource, int, int, str]
+
+
+def _status_value(status: Enum | str) -> str:
+    return status.value if isinstance(status, Enum) else status
+
+
+class InventoryCounterService:
+    """Counter rows are written through the caller's session, so they commit with its writes."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    def _upsert(self):
+        stmt = dialect_insert(self.db, InventoryCounter)
+        return stmt.on_conflict_do_update(
+            index_elements=[
+                InventoryCounter.resource,
+                InventoryCounter.organization_id,
+                InventoryCounter.department_id,
+                InventoryCounter.status,
+            ],
+            set_={
+                "count": InventoryCounter.count + stmt.excluded.count,
+                "version": InventoryCounter.version + 1,
+            },
+        )
+
+    async def adjust(
+        self,
+        resource: CounterResource,
+        organization_id: int,
+        department_id: Any,
+        status: Enum | str,
+        delta: int,
+    ) -> None:
+        """Add `delta` to one counter; `department_id` may be a scalar subquery."""
+        stmt = self._upsert().values(
+            resource=resource.value,
+            organization_id=organization_id,
+            department_id=department_id,
+            status=_status_value(status),
+            count=delta,
+            version=1,
+        )
+        await self.db.execute(stmt)
+
+    async def adjust_many(self, deltas: dict[CounterKey, int]) -> None:
+        """Apply several counter deltas in one executemany round trip.
+
+        Zero deltas are written too: they leave the count alone but bump the version. Rows go
+        out in key order, so concurrent writers lock the same counters in the same order and
+        cannot deadlock on Postgres, whatever order their callers built the deltas in.
+        """
+        rows = sorted(
+            (
+                {
+                    "resource": resource.value,
+                    "organization_id": organization_id,
+                    "department_id": department_id,
+                    "status": _status_value(status),
+                    "count": delta,
+                    "version": 1,
+                }
+                for (resource, organization_id, department_id, status), delta in deltas.items()
+            ),
+            key=lambda row: (
+                row["resource"],
+                row["organization_id"],
+                row["department_id"],
+                row["status"],
+            ),
+        )
+        if rows:
+            await self.db.execute(self._upsert(), rows)
+
+    def _pending_upsert(self):
+        stmt = dialect_insert(self.db, PendingRequestCounter)
+        return stmt.on_conflict_do_update(
+            index_elements=[PendingRequestCounter.organization_id, PendingRequestCounter.priority],
+            set_={"count": PendingRequestCounter.count + stmt.excluded.count},
+        )
+
+    async def adjust_pending(self, organization_id: int, priority: int, delta: int) -> None:
+        """Add `delta` to the pending request count of one organization and priority."""
+        await self.adjust_pending_many({(organization_id, priority): delta})
+
+    async def adjust_pending_many(self, deltas: dict[tuple[int, int], int]) -> None:
+        """Like `adjust_many`, rows are written in key order to keep lock order fixed."""
+        rows = [
+            {"organization_id": organization_id, "priority": priority, "count": delta}
+            for (organization_id, priority), delta in sorted(deltas.items())
+        ]
+        if rows:
+            await self.db.execute(self._pending_upsert(), rows)
+
+    def _filtered(
+        self,
+        stmt,
+        resource: CounterResource,
+        organization_id: int | None,
+        department_id: int | None,
+        status: Enum | str | None,
+    ):
+        stmt = stmt.where(InventoryCounter.resource == resource.value)
+        if organization_id is not None:
+            stmt = stmt.where(InventoryCounter.organization_id == organization_id)
+        if department_id is not None:
+            stmt = stmt.where(InventoryCounter.department_id == department_id)
+        if status is not None:
+            stmt = stmt.where(InventoryCounter.status == _status_value(status))
+        return stmt
+
+    async def total(
+        self,
+        resource: CounterResource,
+        organization_id: int | None = None,
+        department_id: int | None = None,
+        status: Enum | str | None = None,
+    ) -> int:
+        stmt = select(func.coalesce(func.sum(InventoryCounter.count), 0))
+        stmt = self._filtered(stmt, resource, organization_id, department_id, status)
+        return int((await self.db.execute(stmt)).scalar_one())
+
+    async def total_and_version(
+        self,
+        resource: CounterResource,
+        organization_id: int | None = None,
+        department_id: int | None = None,
+        status: Enum | str | None = None,
+    ) -> tuple[int, int]:
+        """Row count and collection version for a filter, in one query.
+
+        Versions only ever grow, so their sum changes whenever any matching row is written.
+        """
+        stmt = select(
+            func.coalesce(func.sum(InventoryCounter.count), 0),
+            func.coalesce(func.sum(InventoryCounter.version), 0),
+        )
+        stmt = self._filtered(stmt, resource, organization_id, department_id, status)
+        total, version = (await self.db.execute(stmt)).one()
+        return int(total), int(version)
@@ -0,0 +1,226 @@
+"""LLM provider client used by AIAssessmentService (see llm_design.md)."""
+
+import asyncio
+import json
+from typing import Any
+
+import httpx
+from pydantic import ValidationError
+
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.repositories.equipment import Equipment
+from app.schemas.ai import AIAssessmentInput, AIAssessmentOutput
+
+logger = get_logger(__name__)
+
+SYSTEM_PROMPT = (
+    "You are a healthcare equipment security analyst. "
+    "Return strict JSON only with keys: risk_score, risk_factors, recommendations. "
+    "risk_score must be integer from 1 to 10."
+)
+
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504, 529}
+
+
+class LLMProviderError(Exception):
+    """Provider call failed after retries, or returned an unusable response."""
+
+
+class LLMConfigurationError(ValueError):
+    """Provider settings are incomplete, so no provider can be built."""
+
+
+def build_prompt(equipment: Equipment, payload: AIAssessmentInput) -> str:
+    return json.dumps(
+        {
+            "equipment": {
+                "name": equipment.name,
+                "manufacturer": equipment.manufacturer,
+                "model_number": equipment.model_number,
+                "category": equipment.category,
+                "status": equipment.status.value,
+            },
+            "operational_input": payload.model_dump(mode="json"),
+        }
+    )
+
+
+def parse_assessment(response_body: dict[str, Any]) -> AIAssessmentOutput:
+    """Extract and validate the JSON assessment from a Messages API response."""
+    try:
+        text = "".join(
+            block["text"] for block in response_body["content"] if block.get("type") == "text"
+        )
+        return AIAssessmentOutput.model_validate_json(text)
+    except (KeyError, TypeError, ValidationError) as exc:
+        raise LLMProviderError("Provider returned an invalid assessment") from exc
+
+
+class HTTPLLMProvider:
+    """Messages-API client with pooling, concurrency limits, retries and single-flight.
+
+    One pooled `httpx.AsyncClient` is shared by all requests in the process. Calls are
+    bounded by a global semaphore and a per-organization semaphore. Identical concurrent
+    assessments (same cache key) share one upstream call.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        model: str | None,
+        api_key: str | None = None,
+        timeout_seconds: float = 30.0,
+        max_concurrency: int = 16,
+        max_concurrency_per_org: int = 4,
+        max_retries: int = 3,
+        backoff_seconds: float = 0.5,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        if not model:
+            raise LLMConfigurationError("LLM_MODEL must be set unless LLM_PROVIDER=mock")
+        self.base_url = base_url
+        self.api_key = api_key
+        self.model = model
+        self.timeout_seconds = timeout_seconds
+        self.max_concurrency = max_concurrency
+        self.max_concurrency_per_org = max_concurrency_per_org
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._global_limit = asyncio.Semaphore(max_concurrency)
+        self._org_limits: dict[int | None, asyncio.Semaphore] = {}
+        self._in_flight: dict[str, asyncio.Future[AIAssessmentOutput]] = {}
+        self.upstream_calls = 0
+        self.coalesced_calls = 0
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            headers = {"anthropic-version": "2023-06-01"}
+            if self.api_key:
+                headers["x-api-key"] = self.api_key
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=headers,
+                timeout=self.timeout_seconds,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+                transport=self._transport,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _org_limit(self, organization_id: int | None) -> asyncio.Semaphore:
+        if organization_id not in self._org_limits:
+            self._org_limits[organization_id] = asyncio.Semaphore(self.max_concurrency_per_org)
+        return self._org_limits[organization_id]
+
+    async def assess(
+        self,
+        equipment: Equipment,
+        payload: AIAssessmentInput,
+        organization_id: int | None,
+        coalesce_key: str,
+    ) -> AIAssessmentOutput:
+        in_flight = self._in_flight.get(coalesce_key)
+        if in_flight is not None:
+            self.coalesced_calls += 1
+            return await asyncio.shield(in_flight)
+
+        future: asyncio.Future[AIAssessmentOutput] = asyncio.get_running_loop().create_future()
+        self._in_flight[coalesce_key] = future
+        try:
+            assessment = await self._call_with_retry(equipment, payload, organization_id)
+        except BaseException as exc:
+            # Followers must be released on every exit, cancellation included; they did not
+            # ask to be cancelled, so they get a provider error rather than CancelledError.
+            if not isinstance(exc, Exception):
+                exc = LLMProviderError("Coalesced provider call was cancelled")
+            future.set_exception(exc)
+            future.exception()  # Mark retrieved when nobody else was waiting.
+            raise
+        else:
+            future.set_result(assessment)
+            return assessment
+        finally:
+            del self._in_flight[coalesce_key]
+
+    async def _call_with_retry(
+        self,
+        equipment: Equipment,
+        payload: AIAssessmentInput,
+        organization_id: int | None,
+    ) -> AIAssessmentOutput:
+        body = {
+            "model": self.model,
+            "max_tokens": 1024,
+            "system": SYSTEM_PROMPT,
+            "messages": [{"role": "user", "content": build_prompt(equipment, payload)}],
+        }
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self._org_limit(organization_id), self._global_limit:
+                    self.upstream_calls += 1
+                    response = await self.client.post("/v1/messages", json=body)
+                if response.status_code in RETRYABLE_STATUS_CODES:
+                    raise LLMProviderError(f"Provider responded with {response.status_code}")
+                response.raise_for_status()
+                return parse_assessment(response.json())
+            except (httpx.TransportError, LLMProviderError, ValueError) as exc:
+                if attempt == self.max_retries:
+                    raise LLMProviderError("AI provider unavailable") from exc
+                delay = self.backoff_seconds * 2**attempt
+                logger.warning(
+                    "LLM provider attempt %s failed (%s); retrying in %.2fs",
+                    attempt + 1,
+                    exc,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+            except httpx.HTTPStatusError as exc:
+                raise LLMProviderError(f"Provider rejected request: {exc}") from exc
+
+        raise AssertionError("unreachable")
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "upstream_calls": self.upstream_calls,
+            "coalesced_calls": self.coalesced_calls,
+            "in_flight": len(self._in_flight),
+        }
+
+
+_provider: HTTPLLMProvider | None = None
+
+
+def get_llm_provider() -> HTTPLLMProvider | None:
+    """Process-wide provider, or None when `LLM_PROVIDER=mock` (rule-based scoring)."""
+    global _provider
+    if settings.llm_provider == "mock":
+        return None
+    if _provider is None:
+        _provider = HTTPLLMProvider(
+            base_url=settings.llm_base_url,
+            model=settings.llm_model,
+            api_key=settings.llm_api_key,
+            timeout_seconds=settings.llm_timeout_seconds,
+            max_concurrency=settings.llm_max_concurrency,
+            max_concurrency_per_org=settings.llm_max_concurrency_per_org,
+            max_retries=settings.llm_max_retries,
+            backoff_seconds=settings.llm_backoff_seconds,
+        )
+    return _provider
+
+
+async def close_llm_provider() -> None:
+    if _provider is not None:
+        await _provider.aclose()
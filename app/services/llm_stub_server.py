@@ -0,0 +1,56 @@
+"""Local Messages-API stub for tests and benchmarks; no network access required.
+
+Run standalone with `uvicorn app.services.llm_stub_server:app --port 8100` and point
+`LLM_BASE_URL` at it, or mount it in-process with `httpx.ASGITransport(app=create_stub_app())`.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from app.repositories.enums import EquipmentStatus
+from app.schemas.ai import AIAssessmentInput
+from app.services.ai_assessment_service import AIAssessmentService
+
+
+def create_stub_app(latency_seconds: float = 0.0, fail_first: int = 0) -> FastAPI:
+    """Build a stub that scores with the mock rules after `latency_seconds`.
+
+    The first `fail_first` calls answer 503, to exercise retry handling.
+    """
+    stub = FastAPI(title="LLM provider stub")
+    stub.state.calls = 0
+    stub.state.in_flight = 0
+    stub.state.peak_in_flight = 0
+
+    @stub.post("/v1/messages")
+    async def messages(request: Request):
+        stub.state.calls += 1
+        if stub.state.calls <= fail_first:
+            return JSONResponse(status_code=503, content={"error": "overloaded"})
+
+        stub.state.in_flight += 1
+        stub.state.peak_in_flight = max(stub.state.peak_in_flight, stub.state.in_flight)
+        try:
+            await asyncio.sleep(latency_seconds)
+        finally:
+            stub.state.in_flight -= 1
+
+        body = await request.json()
+        prompt = json.loads(body["messages"][-1]["content"])
+        equipment = SimpleNamespace(status=EquipmentStatus(prompt["equipment"]["status"]))
+        payload = AIAssessmentInput.model_validate(prompt["operational_input"])
+        assessment = AIAssessmentService().generate(equipment, payload)
+        return {
+            "type": "message",
+            "role": "assistant",
+            "content": [{"type": "text", "text": assessment.model_dump_json()}],
+        }
+
+    return stub
+
+
+app = create_stub_app()
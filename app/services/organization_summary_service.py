@@ -0,0 +1,183 @@
+"""Organization dashboard read from the maintained summary tables, plus drift repair."""
+
+from collections import Counter
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.department import Department
+from app.repositories.enums import CounterResource, EquipmentRequestStatus, EquipmentStatus
+from app.repositories.equipment import Equipment
+from app.repositories.equipment_request import EquipmentRequest
+from app.repositories.inventory_counter import InventoryCounter
+from app.repositories.pending_request_counter import PendingRequestCounter
+from app.schemas.organization import (
+    DepartmentEquipmentSummary,
+    EquipmentSummary,
+    OrganizationSummary,
+    PendingRequestSummary,
+)
+from app.services.inventory_counter_service import CounterKey, InventoryCounterService
+
+REQUEST_PRIORITIES = range(1, 6)
+
+
+def _drift(actual: Counter, stored: Counter) -> dict:
+    """Deltas that bring `stored` in line with `actual`, for the keys that differ."""
+    return {
+        key: actual[key] - stored[key]
+        for key in actual.keys() | stored.keys()
+        if actual[key] != stored[key]
+    }
+
+
+class OrganizationSummaryService:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.counters = InventoryCounterService(db)
+
+    async def get_summary(self, organization_id: int) -> OrganizationSummary:
+        """Two indexed reads over summary rows; no GROUP BY over equipment or requests."""
+        equipment_stmt = (
+            select(Department.id, Department.name, InventoryCounter.status, InventoryCounter.count)
+            .outerjoin(
+                InventoryCounter,
+                and_(
+                    InventoryCounter.department_id == Department.id,
+                    InventoryCounter.organization_id == Department.organization_id,
+                    InventoryCounter.resource == CounterResource.EQUIPMENT.value,
+                ),
+            )
+            .where(Department.organization_id == organization_id)
+            .order_by(Department.id)
+        )
+        by_department: dict[int, DepartmentEquipmentSummary] = {}
+        for department_id, name, status, count in await self.db.execute(equipment_stmt):
+            if department_id not in by_department:
+                by_department[department_id] = DepartmentEquipmentSummary(
+                    department_id=department_id,
+                    department_name=name,
+                    total=0,
+                    by_status={status.value: 0 for status in EquipmentStatus},
+                )
+            if status is not None:
+                summary = by_department[department_id]
+                summary.by_status[status] = summary.by_status.get(status, 0) + count
+                summary.total += count
+
+        by_status = {status.value: 0 for status in EquipmentStatus}
+        for summary in by_department.values():
+            for status, count in summary.by_status.items():
+                by_status[status] = by_status.get(status, 0) + count
+
+        pending_stmt = select(PendingRequestCounter.priority, PendingRequestCounter.count).where(
+            PendingRequestCounter.organization_id == organization_id
+        )
+        by_priority = dict.fromkeys(REQUEST_PRIORITIES, 0)
+        for priority, count in await self.db.execute(pending_stmt):
+            by_priority[priority] = by_priority.get(priority, 0) + count
+
+        return OrganizationSummary(
+            organization_id=organization_id,
+            equipment=EquipmentSummary(
+                total=sum(by_status.values()),
+                by_status=by_status,
+                departments=list(by_department.values()),
+            ),
+            pending_requests=PendingRequestSummary(
+                total=sum(by_priority.values()),
+                by_priority=by_priority,
+            ),
+        )
+
+    async def rebuild(self) -> dict[str, int]:
+        """Recompute every summary row from the source tables and correct any drift.
+
+        Corrections are applied as deltas through the usual upserts, so counter versions
+        (and with them list ETags) move forward. Returns the number of rows corrected.
+
+        On PostgreSQL the reads share one REPEATABLE READ snapshot, so the aggregates and
+        the stored counters describe the same moment. If a writer changes a counter after
+        the snapshot, the correction fails with a serialization error instead of counting
+        that write twice; run the rebuild again.
+        """
+        if self.db.get_bind().dialect.name == "postgresql":
+            await self.db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+
+        actual: Counter = Counter()
+        equipment_stmt = (
+            select(
+                Department.organization_id,
+                Equipment.department_id,
+                Equipment.status,
+                func.count(),
+            )
+            .join(Department, Department.id == Equipment.department_id)
+            .group_by(Department.organization_id, Equipment.department_id, Equipment.status)
+        )
+        for organization_id, department_id, status, count in await self.db.execute(
+            equipment_stmt
+        ):
+            key = (CounterResource.EQUIPMENT, organization_id, department_id, status.value)
+            actual[key] = count
+
+        request_stmt = (
+            select(
+                EquipmentRequest.organization_id,
+                Equipment.department_id,
+                EquipmentRequest.status,
+                func.count(),
+            )
+            .join(Equipment, Equipment.id == EquipmentRequest.equipment_id)
+            .group_by(
+                EquipmentRequest.organization_id,
+                Equipment.department_id,
+                EquipmentRequest.status,
+            )
+        )
+        for organization_id, department_id, status, count in await self.db.execute(request_stmt):
+            key = (CounterResource.EQUIPMENT_REQUEST, organization_id, department_id, status.value)
+            actual[key] = count
+
+        stored: Counter = Counter()
+        stored_stmt = select(
+            InventoryCounter.resource,
+            InventoryCounter.organization_id,
+            InventoryCounter.department_id,
+            InventoryCounter.status,
+            InventoryCounter.count,
+        )
+        for resource, organization_id, department_id, status, count in await self.db.execute(
+            stored_stmt
+        ):
+            stored[(CounterResource(resource), organization_id, department_id, status)] = count
+
+        counter_deltas: dict[CounterKey, int] = _drift(actual, stored)
+        await self.counters.adjust_many(counter_deltas)
+
+        actual_pending: Counter = Counter()
+        pending_stmt = (
+            select(EquipmentRequest.organization_id, EquipmentRequest.priority, func.count())
+            .where(EquipmentRequest.status == EquipmentRequestStatus.PENDING)
+            .group_by(EquipmentRequest.organization_id, EquipmentRequest.priority)
+        )
+        for organization_id, priority, count in await self.db.execute(pending_stmt):
+            actual_pending[(organization_id, priority)] = count
+
+        stored_pending: Counter = Counter()
+        stored_pending_stmt = select(
+            PendingRequestCounter.organization_id,
+            PendingRequestCounter.priority,
+            PendingRequestCounter.count,
+        )
+        for organization_id, priority, count in await self.db.execute(stored_pending_stmt):
+            stored_pending[(organization_id, priority)] = count
+
+        pending_deltas = _drift(actual_pending, stored_pending)
+        await self.counters.adjust_pending_many(pending_deltas)
+
+        await self.db.commit()
+        return {
+            "inventory_counters": len(counter_deltas),
+            "pending_request_counters": len(pending_deltas),
+        }
@@ -0,0 +1,26 @@
+"""Opaque cursor helpers for keyset pagination."""
+
+import base64
+import json
+from typing import Any
+
+from app.api.exceptions import BadRequestException
+
+
+def encode_cursor(values: dict[str, Any]) -> str:
+    """Encode seek values into an opaque, URL-safe cursor string."""
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *keys: str) -> dict[str, Any]:
+    """Decode a cursor produced by `encode_cursor` and check the expected keys."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as exc:
+        raise BadRequestException("Invalid cursor") from exc
+
+    if not isinstance(values, dict) or any(key not in values for key in keys):
+        raise BadRequestException("Invalid cursor")
+    return values
@@ -0,0 +1 @@
+"""Performance benchmarks for the API (not part of the test suite)."""
@@ -0,0 +1,199 @@
+"""In-process load benchmark.
+
+    python -m benchmarks --concurrency 1,8,32 --operations 500 --output report.json
+    python -m benchmarks --baseline baseline.json --tolerance 0.2   # exit 1 on regression
+
+Seeds a fresh schema (dropping existing tables) in `--database-url`, then drives the ASGI
+app through httpx for each scenario and concurrency level.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import sys
+import time
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime
+from pathlib import Path
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import Base, create_engines, get_db, get_read_db
+from app.main import app
+from app.services.ai_assessment_cache import ai_assessment_cache
+from app.services.department_cache import department_cache
+from benchmarks.report import compare, summarize, write_report
+from benchmarks.scenarios import SCENARIOS, Scenario, ScenarioContext
+from benchmarks.seed import SeedConfig, seed_dataset
+
+DEFAULT_DATABASE_URL = "sqlite+aiosqlite:///./benchmark.db"
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--organizations", type=int, default=5)
+    parser.add_argument("--departments", type=int, default=5, help="per organization")
+    parser.add_argument("--equipment", type=int, default=200, help="per department")
+    parser.add_argument("--requests", type=float, default=0.5, help="per equipment")
+    parser.add_argument(
+        "--scenarios",
+        default=",".join(SCENARIOS),
+        help=f"comma-separated subset of: {', '.join(SCENARIOS)}",
+    )
+    parser.add_argument("--concurrency", default="1,8,32")
+    parser.add_argument("--operations", type=int, default=200, help="per scenario and level")
+    parser.add_argument(
+        "--sqlite-mode",
+        choices=["tuned", "plain"],
+        default="tuned",
+        help="tuned: WAL, pragmas, one writer plus a reader pool (see app/core/database.py)",
+    )
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    return parser.parse_args(argv)
+
+
+async def _run_level(
+    client: AsyncClient,
+    scenario: Scenario,
+    ctx: ScenarioContext,
+    concurrency: int,
+    operations: int,
+) -> tuple[list[float], int, int, float]:
+    latencies: list[float] = []
+    errors = 0
+    skipped = 0
+    remaining = iter(range(operations))
+
+    async def worker() -> None:
+        nonlocal errors, skipped
+        for _ in remaining:
+            started = time.perf_counter()
+            try:
+                status_code = await scenario(client, ctx)
+            except Exception:
+                status_code = 599
+            if status_code is None:
+                # No request was sent; keep it out of latency and throughput.
+                skipped += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+            if status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, skipped, time.perf_counter() - started
+
+
+async def run(args: argparse.Namespace) -> dict:
+    names = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = sorted(set(names) - set(SCENARIOS))
+    if unknown:
+        raise SystemExit(f"Unknown scenarios: {', '.join(unknown)}")
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    engine, read_engine = create_engines(
+        args.database_url, tuned_sqlite=args.sqlite_mode == "tuned"
+    )
+    session_local = async_sessionmaker(bind=engine, expire_on_commit=False, autoflush=False)
+    read_session_local = async_sessionmaker(
+        bind=read_engine, expire_on_commit=False, autoflush=False
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    config = SeedConfig(
+        organizations=args.organizations,
+        departments_per_organization=args.departments,
+        equipment_per_department=args.equipment,
+        requests_per_equipment=args.requests,
+    )
+    seed_started = time.perf_counter()
+    seed = await seed_dataset(engine, config)
+    seed_seconds = time.perf_counter() - seed_started
+    print(
+        f"Seeded {len(seed.equipment_ids)} equipment rows in {seed_seconds:.2f}s "
+        f"({engine.dialect.name})",
+        file=sys.stderr,
+    )
+
+    async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
+        async with session_local() as session:
+            yield session
+
+    async def override_get_read_db() -> AsyncGenerator[AsyncSession, None]:
+        async with read_session_local() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_read_db
+    ai_assessment_cache.clear()
+    department_cache.clear()
+
+    results = []
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url=f"http://benchmark{settings.api_prefix}",
+        ) as client:
+            for name in names:
+                for concurrency in levels:
+                    ctx = ScenarioContext(seed=seed, rng=random.Random(concurrency))
+                    latencies, errors, skipped, wall = await _run_level(
+                        client, SCENARIOS[name], ctx, concurrency, args.operations
+                    )
+                    row = summarize(name, concurrency, latencies, errors, wall, skipped)
+                    results.append(row)
+                    print(
+                        f"{name:<24} c={concurrency:<3} {row['throughput_rps']:>9} rps  "
+                        f"p50={row['p50_ms']}ms p95={row['p95_ms']}ms p99={row['p99_ms']}ms "
+                        f"errors={errors} skipped={skipped}",
+                        file=sys.stderr,
+                    )
+    finally:
+        app.dependency_overrides.clear()
+        await engine.dispose()
+        await read_engine.dispose()
+
+    return {
+        "generated_at": datetime.now(UTC).isoformat(),
+        "dialect": engine.dialect.name,
+        "sqlite_mode": args.sqlite_mode if engine.dialect.name == "sqlite" else None,
+        "python": platform.python_version(),
+        "seed": {
+            **vars(config),
+            "equipment_rows": len(seed.equipment_ids),
+            "seconds": round(seed_seconds, 3),
+        },
+        "operations": args.operations,
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    report = asyncio.run(run(args))
+    if args.output:
+        write_report(args.output, report)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.baseline:
+        regressions = compare(report, json.loads(args.baseline.read_text()), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,65 @@
+"""Latency/throughput summaries and baseline comparison."""
+
+import json
+import statistics
+from pathlib import Path
+from typing import Any
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, round(fraction * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def summarize(
+    scenario: str,
+    concurrency: int,
+    latencies: list[float],
+    errors: int,
+    wall_seconds: float,
+    skipped: int = 0,
+) -> dict[str, Any]:
+    ordered = sorted(latencies)
+    to_ms = 1000.0
+    return {
+        "scenario": scenario,
+        "concurrency": concurrency,
+        "operations": len(latencies),
+        "errors": errors,
+        "skipped": skipped,
+        "throughput_rps": round(len(latencies) / wall_seconds, 2) if wall_seconds else 0.0,
+        "mean_ms": round(statistics.fmean(ordered) * to_ms, 3) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 0.50) * to_ms, 3),
+        "p95_ms": round(percentile(ordered, 0.95) * to_ms, 3),
+        "p99_ms": round(percentile(ordered, 0.99) * to_ms, 3),
+    }
+
+
+def write_report(path: Path, report: dict[str, Any]) -> None:
+    path.write_text(json.dumps(report, indent=2) + "\n")
+
+
+def compare(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float,
+) -> list[str]:
+    """Return human-readable regressions beyond `tolerance` (0.2 = 20%)."""
+    previous = {(row["scenario"], row["concurrency"]): row for row in baseline["results"]}
+    regressions = []
+    for row in report["results"]:
+        base = previous.get((row["scenario"], row["concurrency"]))
+        if base is None:
+            continue
+        label = f"{row['scenario']}@{row['concurrency']}"
+        if base["p95_ms"] and row["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{label}: p95 {base['p95_ms']}ms -> {row['p95_ms']}ms")
+        if base["throughput_rps"] and row["throughput_rps"] < base["throughput_rps"] * (
+            1 - tolerance
+        ):
+            regressions.append(
+                f"{label}: throughput {base['throughput_rps']} -> {row['throughput_rps']} rps"
+            )
+    return regressions
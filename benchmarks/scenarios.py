@@ -0,0 +1,126 @@
+"""Request scenarios driven against the in-process ASGI app."""
+
+import itertools
+import random
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from httpx import AsyncClient
+
+from benchmarks.seed import MANUFACTURERS, SeedResult
+
+_unique = itertools.count()
+
+
+@dataclass
+class ScenarioContext:
+    seed: SeedResult
+    rng: random.Random = field(default_factory=lambda: random.Random(7))
+
+
+# Returns the response status, or None when the scenario had nothing to send (skipped).
+Scenario = Callable[[AsyncClient, ScenarioContext], Awaitable[int | None]]
+
+
+def _equipment_body(ctx: ScenarioContext, department_id: int | None = None) -> dict:
+    return {
+        "name": f"Bench-{next(_unique)}",
+        "manufacturer": "Bench Medical",
+        "model_number": "B-1",
+        "category": "Monitor",
+        "status": "available",
+        "department_id": department_id or ctx.rng.choice(ctx.seed.department_ids),
+    }
+
+
+async def list_equipment(client: AsyncClient, ctx: ScenarioContext) -> int:
+    params = {"department_id": ctx.rng.choice(ctx.seed.department_ids), "page_size": 50}
+    return (await client.get("/equipment", params=params)).status_code
+
+
+async def list_equipment_requests(client: AsyncClient, ctx: ScenarioContext) -> int:
+    params = {"organization_id": ctx.rng.choice(ctx.seed.organization_ids), "page_size": 50}
+    return (await client.get("/equipment-requests", params=params)).status_code
+
+
+async def organization_summary(client: AsyncClient, ctx: ScenarioContext) -> int:
+    organization_id = ctx.rng.choice(ctx.seed.organization_ids)
+    return (await client.get(f"/organizations/{organization_id}/summary")).status_code
+
+
+async def search_equipment(client: AsyncClient, ctx: ScenarioContext) -> int:
+    """One selective term (a seeded model number) plus one broad one (a manufacturer)."""
+    params = {
+        "q": f"m-{ctx.rng.randint(100, 999)} {ctx.rng.choice(MANUFACTURERS)}",
+        "organization_id": ctx.rng.choice(ctx.seed.organization_ids),
+    }
+    return (await client.get("/equipment/search", params=params)).status_code
+
+
+async def get_equipment(client: AsyncClient, ctx: ScenarioContext) -> int:
+    equipment_id = ctx.rng.choice(ctx.seed.equipment_ids)
+    return (await client.get(f"/equipment/{equipment_id}")).status_code
+
+
+async def create_equipment(client: AsyncClient, ctx: ScenarioContext) -> int:
+    return (await client.post("/equipment", json=_equipment_body(ctx))).status_code
+
+
+async def bulk_import(client: AsyncClient, ctx: ScenarioContext) -> int:
+    department_id = ctx.rng.choice(ctx.seed.department_ids)
+    body = [_equipment_body(ctx, department_id) for _ in range(100)]
+    return (await client.post("/equipment/bulk", json=body)).status_code
+
+
+async def create_request(client: AsyncClient, ctx: ScenarioContext) -> int:
+    equipment_id = ctx.rng.choice(ctx.seed.requestable_equipment_ids)
+    department_id = ctx.seed.department_by_equipment[equipment_id]
+    body = {
+        "equipment_id": equipment_id,
+        "requested_by": f"Bench {next(_unique)}",
+        "justification": "Benchmark request",
+        "priority": ctx.rng.randint(1, 5),
+        "organization_id": ctx.seed.organization_by_department[department_id],
+    }
+    return (await client.post("/equipment-requests", json=body)).status_code
+
+
+async def approve_request(client: AsyncClient, ctx: ScenarioContext) -> int | None:
+    if not ctx.seed.pending_request_ids:
+        return None
+    request_id = ctx.seed.pending_request_ids.pop()
+    return (await client.patch(f"/equipment-requests/{request_id}/approve")).status_code
+
+
+async def mixed(client: AsyncClient, ctx: ScenarioContext) -> int | None:
+    """80% reads (list/get), 20% writes (create/approve)."""
+    roll = ctx.rng.random()
+    if roll < 0.4:
+        return await list_equipment(client, ctx)
+    if roll < 0.8:
+        return await get_equipment(client, ctx)
+    if roll < 0.9:
+        return await create_equipment(client, ctx)
+    return await approve_request(client, ctx)
+
+
+async def reads_during_writes(client: AsyncClient, ctx: ScenarioContext) -> int:
+    """50/50 list reads and single-row inserts, so reads always overlap in-flight writes."""
+    if ctx.rng.random() < 0.5:
+        return await list_equipment(client, ctx)
+    return await create_equipment(client, ctx)
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "list_equipment": list_equipment,
+    "list_equipment_requests": list_equipment_requests,
+    "get_equipment": get_equipment,
+    "search_equipment": search_equipment,
+    "organization_summary": organization_summary,
+    "create_equipment": create_equipment,
+    "bulk_import": bulk_import,
+    "create_request": create_request,
+    "approve_request": approve_request,
+    "mixed": mixed,
+    "reads_during_writes": reads_during_writes,
+}
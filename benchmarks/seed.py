@@ -0,0 +1,157 @@
+"""Synthetic hospital dataset generator, written with bulk executemany inserts."""
+
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.repositories.department import Department
+from app.repositories.enums import CounterResource, EquipmentRequestStatus, EquipmentStatus
+from app.repositories.equipment import Equipment
+from app.repositories.equipment_request import EquipmentRequest
+from app.repositories.inventory_counter import InventoryCounter
+from app.repositories.pending_request_counter import PendingRequestCounter
+
+CATEGORIES = ["Monitor", "Ventilator", "Infusion Pump", "Imaging", "Defibrillator", "Analyzer"]
+MANUFACTURERS = ["Philips", "GE", "Siemens", "Draeger", "Medtronic", "Baxter", "Mindray"]
+DEPARTMENT_NAMES = ["ICU", "ER", "Radiology", "Cardiology", "Oncology", "Pediatrics", "Surgery"]
+EQUIPMENT_STATUSES = list(EquipmentStatus)
+
+
+@dataclass
+class SeedConfig:
+    organizations: int = 5
+    departments_per_organization: int = 5
+    equipment_per_department: int = 200
+    requests_per_equipment: float = 0.5
+    batch_size: int = 5000
+    seed: int = 42
+
+
+@dataclass
+class SeedResult:
+    """Ids handed to scenarios so they can address real rows."""
+
+    organization_ids: list[int] = field(default_factory=list)
+    department_ids: list[int] = field(default_factory=list)
+    equipment_ids: list[int] = field(default_factory=list)
+    requestable_equipment_ids: list[int] = field(default_factory=list)
+    pending_request_ids: list[int] = field(default_factory=list)
+    organization_by_department: dict[int, int] = field(default_factory=dict)
+    department_by_equipment: dict[int, int] = field(default_factory=dict)
+
+
+async def _insert_batched(engine: AsyncEngine, table, rows: list[dict], batch_size: int) -> None:
+    for start in range(0, len(rows), batch_size):
+        async with engine.begin() as conn:
+            await conn.execute(insert(table), rows[start : start + batch_size])
+
+
+async def seed_dataset(engine: AsyncEngine, config: SeedConfig) -> SeedResult:
+    """Populate an empty schema and return the generated ids."""
+    rng = random.Random(config.seed)
+    result = SeedResult(organization_ids=list(range(1, config.organizations + 1)))
+
+    department_rows = [
+        {
+            "name": f"{DEPARTMENT_NAMES[index % len(DEPARTMENT_NAMES)]}-{index}",
+            "organization_id": organization_id,
+        }
+        for organization_id in result.organization_ids
+        for index in range(config.departments_per_organization)
+    ]
+    await _insert_batched(engine, Department, department_rows, config.batch_size)
+
+    async with engine.connect() as conn:
+        departments = (await conn.execute(select(Department.id, Department.organization_id))).all()
+    result.organization_by_department = dict(departments)
+    result.department_ids = list(result.organization_by_department)
+
+    counters: Counter = Counter()
+    equipment_rows = []
+    for department_id in result.department_ids:
+        for index in range(config.equipment_per_department):
+            status = rng.choice(EQUIPMENT_STATUSES)
+            equipment_rows.append(
+                {
+                    "name": f"Device-{department_id}-{index}",
+                    "manufacturer": rng.choice(MANUFACTURERS),
+                    "model_number": f"M-{rng.randint(100, 999)}",
+                    "category": rng.choice(CATEGORIES),
+                    "status": status,
+                    "department_id": department_id,
+                }
+            )
+            organization_id = result.organization_by_department[department_id]
+            counters[
+                (CounterResource.EQUIPMENT.value, organization_id, department_id, status.value)
+            ] += 1
+    await _insert_batched(engine, Equipment, equipment_rows, config.batch_size)
+
+    async with engine.connect() as conn:
+        equipment = (
+            await conn.execute(select(Equipment.id, Equipment.department_id, Equipment.status))
+        ).all()
+    result.department_by_equipment = {row.id: row.department_id for row in equipment}
+    result.equipment_ids = list(result.department_by_equipment)
+    result.requestable_equipment_ids = [
+        row.id for row in equipment if row.status != EquipmentStatus.DECOMMISSIONED
+    ]
+
+    pending_counters: Counter = Counter()
+    request_rows = []
+    for row in equipment:
+        count = int(config.requests_per_equipment) + (
+            rng.random() < config.requests_per_equipment % 1
+        )
+        for index in range(count):
+            organization_id = result.organization_by_department[row.department_id]
+            status = rng.choice([EquipmentRequestStatus.PENDING, EquipmentRequestStatus.APPROVED])
+            priority = rng.randint(1, 5)
+            request_rows.append(
+                {
+                    "equipment_id": row.id,
+                    "requested_by": f"Staff {row.id}-{index}",
+                    "justification": "Synthetic benchmark request",
+                    "priority": priority,
+                    "status": status,
+                    "organization_id": organization_id,
+                }
+            )
+            counters[
+                (
+                    CounterResource.EQUIPMENT_REQUEST.value,
+                    organization_id,
+                    row.department_id,
+                    status.value,
+                )
+            ] += 1
+            if status == EquipmentRequestStatus.PENDING:
+                pending_counters[(organization_id, priority)] += 1
+    await _insert_batched(engine, EquipmentRequest, request_rows, config.batch_size)
+
+    counter_rows = [
+        {
+            "resource": resource,
+            "organization_id": organization_id,
+            "department_id": department_id,
+            "status": status,
+            "count": count,
+        }
+        for (resource, organization_id, department_id, status), count in counters.items()
+    ]
+    await _insert_batched(engine, InventoryCounter, counter_rows, config.batch_size)
+    pending_counter_rows = [
+        {"organization_id": organization_id, "priority": priority, "count": count}
+        for (organization_id, priority), count in pending_counters.items()
+    ]
+    await _insert_batched(engine, PendingRequestCounter, pending_counter_rows, config.batch_size)
+
+    async with engine.connect() as conn:
+        pending_stmt = select(EquipmentRequest.id).where(
+            EquipmentRequest.status == EquipmentRequestStatus.PENDING
+        )
+        result.pending_request_ids = list((await conn.execute(pending_stmt)).scalars().all())
+    return result
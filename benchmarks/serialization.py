@@ -0,0 +1,79 @@
+"""Microbenchmark: legacy multi-pass envelope vs the single-pass EnvelopeResponse.
+
+Run with `python -m benchmarks.serialization [--items 100] [--rounds 2000]`.
+"""
+
+import argparse
+import json
+import timeit
+from datetime import UTC, datetime
+
+from fastapi.encoders import jsonable_encoder
+
+from app.api.response import envelope_response, success_response, to_schema
+from app.repositories.enums import EquipmentStatus
+from app.repositories.equipment import Equipment
+from app.schemas.equipment import EquipmentRead
+
+
+def build_rows(count: int) -> list[Equipment]:
+    now = datetime.now(UTC)
+    return [
+        Equipment(
+            id=index,
+            name=f"Monitor-{index}",
+            manufacturer="Philips",
+            model_number=f"MX-{index}",
+            category="Patient Monitor",
+            status=EquipmentStatus.AVAILABLE,
+            department_id=1,
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(count)
+    ]
+
+
+def pagination(count: int) -> dict:
+    return {"page": 1, "page_size": count, "total_items": count, "total_pages": 1}
+
+
+def legacy(rows: list[Equipment]) -> bytes:
+    """ORM -> model -> dict, jsonable_encoder, envelope dump, FastAPI encode, json.dumps."""
+    data = {
+        "items": [EquipmentRead.model_validate(row).model_dump(mode="json") for row in rows],
+        "pagination": pagination(len(rows)),
+    }
+    content = success_response("Equipment list fetched successfully", data).model_dump()
+    return json.dumps(jsonable_encoder(content), separators=(",", ":")).encode()
+
+
+def single_pass(rows: list[Equipment]) -> bytes:
+    data = {"items": to_schema(EquipmentRead, rows), "pagination": pagination(len(rows))}
+    return envelope_response("Equipment list fetched successfully", data).body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    rows = build_rows(args.items)
+    assert json.loads(legacy(rows)) == json.loads(single_pass(rows))
+
+    results = {}
+    for name, func in (("legacy", legacy), ("single_pass", single_pass)):
+        seconds = min(timeit.repeat(lambda f=func: f(rows), number=args.rounds, repeat=3))
+        results[name] = seconds / args.rounds * 1_000_000
+
+    print(json.dumps({
+        "items": args.items,
+        "legacy_us_per_response": round(results["legacy"], 1),
+        "single_pass_us_per_response": round(results["single_pass"], 1),
+        "speedup": round(results["legacy"] / results["single_pass"], 2),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
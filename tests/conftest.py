@@ -5,8 +5,12 @@ import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from app.core.database import Base, get_db
+from app.api.idempotency import idempotency_store
+from app.core.database import Base, get_db, get_read_db
+from app.core.instrumentation import query_guard
 from app.main import app
+from app.services.ai_assessment_cache import ai_assessment_cache
+from app.services.department_cache import department_cache
 
 
 @pytest.fixture
@@ -33,6 +37,11 @@ async def client(tmp_path) -> AsyncGenerator[AsyncClient, None]:
             yield session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    ai_assessment_cache.clear()
+    department_cache.clear()
+    idempotency_store.clear()
+    query_guard.clear()
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
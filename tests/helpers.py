@@ -0,0 +1,29 @@
+from httpx import AsyncClient
+
+from app.core.config import settings
+
+
+def api_path(path: str) -> str:
+    prefix = settings.api_prefix.rstrip("/")
+    return f"{prefix}{path}" if prefix else path
+
+
+async def create_department(client: AsyncClient, name: str, organization_id: int) -> int:
+    response = await client.post(
+        api_path("/departments"),
+        json={"name": name, "organization_id": organization_id},
+    )
+    assert response.status_code == 201
+    return response.json()["data"]["id"]
+
+
+def equipment_body(department_id: int, **fields) -> dict:
+    return {
+        "name": "Infusion Pump",
+        "manufacturer": "Baxter",
+        "model_number": "Sigma Spectrum",
+        "category": "Infusion",
+        "status": "available",
+        "department_id": department_id,
+        **fields,
+    }
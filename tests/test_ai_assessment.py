@@ -0,0 +1,182 @@
+import httpx
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from app.core.database import get_db
+from app.main import app
+from app.repositories.ai_assessment_cache import AIAssessmentCacheEntry
+from app.repositories.department import Department
+from app.repositories.equipment import Equipment
+from app.schemas.ai import AIAssessmentInput
+from app.services import ai_assessment_service
+from app.services.ai_assessment_cache import (
+    AIAssessmentCache,
+    ai_assessment_cache,
+    assessment_cache_key,
+)
+from app.services.ai_assessment_service import AIAssessmentService
+from app.services.llm_provider_service import HTTPLLMProvider
+from app.services.llm_stub_server import create_stub_app
+from tests.helpers import api_path
+
+
+async def _create_equipment(client: AsyncClient, name: str = "Ventilator-A") -> dict:
+    department = await client.post(
+        api_path("/departments"),
+        json={"name": "ICU", "organization_id": 70},
+    )
+    response = await client.post(
+        api_path("/equipment"),
+        json={
+            "name": name,
+            "manufacturer": "Draeger",
+            "model_number": "V-500",
+            "category": "Ventilator",
+            "status": "in_use",
+            "department_id": department.json()["data"]["id"],
+        },
+    )
+    assert response.status_code == 201
+    return response.json()["data"]
+
+
+ASSESSMENT_INPUT = {
+    "environment": "ICU",
+    "usage_pattern": "Continuous",
+    "known_issues": ["Firmware outdated"],
+    "internet_connected": True,
+}
+
+
+async def _cache_stats(client: AsyncClient) -> dict:
+    response = await client.get(api_path("/admin/cache-stats"))
+    return response.json()["data"]["ai_assessment"]
+
+
+@pytest.mark.anyio
+async def test_assessment_is_cached_until_equipment_changes(client: AsyncClient) -> None:
+    equipment = await _create_equipment(client)
+    path = api_path(f"/equipment/{equipment['id']}/ai-assessment")
+
+    first = await client.post(path, json=ASSESSMENT_INPUT)
+    second = await client.post(path, json=ASSESSMENT_INPUT)
+    assert first.status_code == second.status_code == 200
+    assert first.json()["data"] == second.json()["data"]
+    stats = await _cache_stats(client)
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    update = await client.put(
+        api_path(f"/equipment/{equipment['id']}"),
+        json={
+            key: equipment[key]
+            for key in ("name", "manufacturer", "model_number", "category", "department_id")
+        }
+        | {"status": "maintenance"},
+    )
+    assert update.status_code == 200
+
+    third = await client.post(path, json=ASSESSMENT_INPUT)
+    assert third.json()["data"]["risk_score"] > first.json()["data"]["risk_score"]
+    stats = await _cache_stats(client)
+    assert (stats["hits"], stats["misses"]) == (1, 2)
+
+
+@pytest.mark.anyio
+async def test_persistent_tier_survives_memory_eviction(
+    client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(ai_assessment_cache, "persistent", True)
+    equipment = await _create_equipment(client, name="Ventilator-B")
+    path = api_path(f"/equipment/{equipment['id']}/ai-assessment")
+
+    first = await client.post(path, json=ASSESSMENT_INPUT)
+    ai_assessment_cache.memory.clear()
+    second = await client.post(path, json=ASSESSMENT_INPUT)
+
+    assert first.json()["data"] == second.json()["data"]
+    stats = await _cache_stats(client)
+    assert stats["persistent_hits"] == 1
+
+
+@pytest.mark.anyio
+async def test_batch_assessment_reports_per_item_results(client: AsyncClient) -> None:
+    equipment = await _create_equipment(client, name="Ventilator-C")
+    single = await client.post(
+        api_path(f"/equipment/{equipment['id']}/ai-assessment"),
+        json=ASSESSMENT_INPUT,
+    )
+
+    response = await client.post(
+        api_path("/equipment/ai-assessment/batch"),
+        json={
+            "items": [
+                {"equipment_id": equipment["id"], "input": ASSESSMENT_INPUT},
+                {
+                    "equipment_id": equipment["id"],
+                    "input": {**ASSESSMENT_INPUT, "known_issues": []},
+                },
+                {"equipment_id": 9999, "input": ASSESSMENT_INPUT},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert (data["succeeded"], data["failed"]) == (2, 1)
+    first, second, missing = data["results"]
+    assert first["data"] == single.json()["data"]
+    assert second["data"]["risk_score"] < first["data"]["risk_score"]
+    assert missing == {
+        "equipment_id": 9999,
+        "success": False,
+        "data": None,
+        "error": "Equipment not found",
+    }
+    stats = await _cache_stats(client)
+    assert stats["hits"] == 1
+
+
+@pytest.mark.anyio
+async def test_provider_failure_is_reported_as_unavailable(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    provider = HTTPLLMProvider(
+        base_url="http://llm-stub",
+        model="stub-model",
+        transport=httpx.ASGITransport(app=create_stub_app(fail_first=100)),
+        max_retries=1,
+        backoff_seconds=0.001,
+    )
+    monkeypatch.setattr(ai_assessment_service, "get_llm_provider", lambda: provider)
+    equipment = await _create_equipment(client)
+
+    response = await client.post(
+        api_path(f"/equipment/{equipment['id']}/ai-assessment"), json=ASSESSMENT_INPUT
+    )
+
+    assert response.status_code == 503
+    assert response.json()["message"] == "AI provider unavailable"
+    await provider.aclose()
+
+
+@pytest.mark.anyio
+async def test_persistent_cache_write_leaves_the_commit_to_the_caller(
+    client: AsyncClient,
+) -> None:
+    equipment = await _create_equipment(client, name="Ventilator-C")
+    cache = AIAssessmentCache(max_entries=10, ttl_seconds=60, persistent=True)
+    payload = AIAssessmentInput.model_validate(ASSESSMENT_INPUT)
+
+    async for session in app.dependency_overrides[get_db]():
+        row = await session.get(Equipment, equipment["id"])
+        assessment = AIAssessmentService().generate(row, payload)
+        session.add(Department(name="Unrelated", organization_id=71))
+        await cache.set(assessment_cache_key(row, payload), row, assessment, session)
+        await session.rollback()
+
+        entries = select(func.count()).select_from(AIAssessmentCacheEntry)
+        departments = select(func.count()).where(Department.organization_id == 71)
+        assert (await session.execute(entries)).scalar_one() == 0
+        assert (await session.execute(departments)).scalar_one() == 0
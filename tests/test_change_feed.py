@@ -0,0 +1,132 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.database import get_db
+from app.main import app
+from app.services.change_log_service import ChangeLogService
+from app.utils.pagination import encode_cursor
+from tests.helpers import api_path, create_department, equipment_body
+
+
+async def _changes(client: AsyncClient, **params) -> dict:
+    response = await client.get(api_path("/changes"), params=params)
+    assert response.status_code == 200
+    return response.json()["data"]
+
+
+@pytest.mark.anyio
+async def test_mutations_are_logged_in_commit_order(client: AsyncClient) -> None:
+    department_id = await create_department(client, "Theatre", 91)
+    await create_department(client, "Theatre", 92)
+    created = await client.post(api_path("/equipment"), json=equipment_body(department_id))
+    equipment_id = created.json()["data"]["id"]
+    await client.put(
+        api_path(f"/equipment/{equipment_id}"),
+        json=equipment_body(department_id, status="maintenance"),
+    )
+    request = await client.post(
+        api_path("/equipment-requests"),
+        json={
+            "equipment_id": equipment_id,
+            "requested_by": "Dr Haddad",
+            "justification": "Backup workstation",
+            "priority": 2,
+            "organization_id": 91,
+        },
+    )
+    request_id = request.json()["data"]["id"]
+    await client.patch(api_path(f"/equipment-requests/{request_id}/approve"))
+
+    feed = await _changes(client, organization_id=91)
+    assert [(item["resource"], item["action"]) for item in feed["items"]] == [
+        ("department", "created"),
+        ("equipment", "created"),
+        ("equipment", "updated"),
+        ("equipment_request", "created"),
+        ("equipment_request", "approved"),
+    ]
+    assert feed["items"][2]["payload"]["status"] == "maintenance"
+    assert feed["items"][4]["payload"]["status"] == "approved"
+
+    first_page = await _changes(client, limit=2)
+    assert first_page["has_more"] is True
+    rest = await _changes(client, since=first_page["next_cursor"])
+    assert len(first_page["items"]) + len(rest["items"]) == 6
+    assert await _changes(client, since=rest["next_cursor"]) == {
+        "items": [],
+        "next_cursor": rest["next_cursor"],
+        "has_more": False,
+    }
+
+
+@pytest.mark.anyio
+async def test_bulk_create_logs_the_same_payload_as_single_create(client: AsyncClient) -> None:
+    department_id = await create_department(client, "Recovery", 95)
+    await client.post(api_path("/equipment"), json=equipment_body(department_id))
+    bulk = await client.post(
+        api_path("/equipment/bulk"),
+        json=[
+            equipment_body(department_id),
+            equipment_body(department_id, model_number="Sigma Spectrum 2"),
+        ],
+    )
+    results = bulk.json()["data"]["results"]
+    assert [row["status"] for row in results] == ["conflict", "created"]
+    bulk_id = results[1]["id"]
+
+    single, bulk_created = [
+        item["payload"]
+        for item in (await _changes(client, organization_id=95))["items"]
+        if item["resource"] == "equipment"
+    ]
+    assert bulk_created.keys() == single.keys()
+    fetched = await client.get(api_path(f"/equipment/{bulk_id}"))
+    assert bulk_created == fetched.json()["data"]
+
+
+@pytest.mark.anyio
+async def test_long_poll_returns_as_soon_as_a_change_commits(client: AsyncClient) -> None:
+    await create_department(client, "Dialysis", 93)
+    cursor = (await _changes(client))["next_cursor"]
+
+    idle = await _changes(client, since=cursor, wait=0.2)
+    assert idle["items"] == []
+
+    poll = asyncio.create_task(_changes(client, since=cursor, wait=10))
+    await asyncio.sleep(0.2)
+    assert not poll.done()
+    await create_department(client, "Endoscopy", 93)
+
+    feed = await asyncio.wait_for(poll, timeout=3)
+    assert [item["payload"]["name"] for item in feed["items"]] == ["Endoscopy"]
+
+
+@pytest.mark.anyio
+async def test_compaction_bounds_the_log_and_expires_old_cursors(client: AsyncClient) -> None:
+    for index in range(5):
+        await create_department(client, f"Ward {index}", 94)
+    entries = (await _changes(client))["items"]
+
+    async for session in app.dependency_overrides[get_db]():
+        deleted = await ChangeLogService(session).compact(
+            retention_seconds=3600,
+            max_entries=2,
+            batch_size=2,
+        )
+        assert deleted == 3
+        # Age-based: everything but the newest entry is older than a zero-second retention.
+        await asyncio.sleep(1.1)
+        assert await ChangeLogService(session).compact(retention_seconds=0, max_entries=10) == 1
+
+    kept = await _changes(client)
+    assert [item["id"] for item in kept["items"]] == [entries[-1]["id"]]
+
+    resumed = await _changes(client, since=encode_cursor({"id": entries[3]["id"]}))
+    assert len(resumed["items"]) == 1
+    expired = await client.get(
+        api_path("/changes"),
+        params={"since": encode_cursor({"id": entries[2]["id"]})},
+    )
+    assert expired.status_code == 410
@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.core.database import create_engines
+
+
+@pytest.mark.anyio
+async def test_tuned_sqlite_reads_proceed_while_write_is_open(tmp_path) -> None:
+    writer, reader = create_engines(f"sqlite+aiosqlite:///{tmp_path / 'tuned.db'}", True)
+    try:
+        async with writer.begin() as conn:
+            assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+            assert (await conn.execute(text("PRAGMA synchronous"))).scalar() == 1
+            await conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+            await conn.execute(text("INSERT INTO items (id) VALUES (1)"))
+
+        async with writer.begin() as write_conn:
+            await write_conn.execute(text("INSERT INTO items (id) VALUES (2)"))
+            async with reader.connect() as read_conn:
+                count = await asyncio.wait_for(
+                    read_conn.execute(text("SELECT count(*) FROM items")),
+                    timeout=1,
+                )
+                assert count.scalar() == 1
+                with pytest.raises(OperationalError, match="readonly"):
+                    await read_conn.execute(text("INSERT INTO items (id) VALUES (3)"))
+
+        async with reader.connect() as read_conn:
+            assert (await read_conn.execute(text("SELECT count(*) FROM items"))).scalar() == 2
+        assert writer.pool.size() == 1
+    finally:
+        await writer.dispose()
+        await reader.dispose()
+
+
+def test_untuned_or_memory_sqlite_uses_one_engine() -> None:
+    writer, reader = create_engines("sqlite+aiosqlite:///:memory:", True)
+    assert writer is reader
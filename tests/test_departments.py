@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+
+from tests.helpers import api_path
+
+
+async def _department_cache_stats(client: AsyncClient) -> dict:
+    response = await client.get(api_path("/admin/cache-stats"))
+    return response.json()["data"]["departments"]
+
+
+@pytest.mark.anyio
+async def test_department_list_is_cached_and_invalidated_on_create(client: AsyncClient) -> None:
+    await client.post(api_path("/departments"), json={"name": "Oncology", "organization_id": 80})
+
+    first = await client.get(api_path("/departments"), params={"organization_id": 80})
+    second = await client.get(api_path("/departments"), params={"organization_id": 80})
+    assert first.json() == second.json()
+    stats = await _department_cache_stats(client)
+    assert (stats["by_organization"]["hits"], stats["by_organization"]["misses"]) == (1, 1)
+
+    await client.post(api_path("/departments"), json={"name": "Pediatrics", "organization_id": 80})
+    third = await client.get(api_path("/departments"), params={"organization_id": 80})
+
+    assert [item["name"] for item in third.json()["data"]] == ["Oncology", "Pediatrics"]
+
+
+@pytest.mark.anyio
+async def test_equipment_writes_reuse_cached_department(client: AsyncClient) -> None:
+    department = await client.post(
+        api_path("/departments"),
+        json={"name": "Neurology", "organization_id": 81},
+    )
+    department_id = department.json()["data"]["id"]
+
+    for name in ("EEG-1", "EEG-2", "EEG-3"):
+        response = await client.post(
+            api_path("/equipment"),
+            json={
+                "name": name,
+                "manufacturer": "Natus",
+                "model_number": "N-1",
+                "category": "Diagnostics",
+                "status": "available",
+                "department_id": department_id,
+            },
+        )
+        assert response.status_code == 201
+
+    stats = await _department_cache_stats(client)
+    assert (stats["by_id"]["hits"], stats["by_id"]["misses"]) == (2, 1)
+
+
+@pytest.mark.anyio
+async def test_concurrent_duplicate_departments_conflict(client: AsyncClient) -> None:
+    responses = await asyncio.gather(
+        *(
+            client.post(api_path("/departments"), json={"name": name, "organization_id": 82})
+            for name in ("Geriatrics", "geriatrics ", "GERIATRICS")
+        )
+    )
+
+    assert sorted(response.status_code for response in responses) == [201, 409, 409]
+    listed = await client.get(api_path("/departments"), params={"organization_id": 82})
+    assert len(listed.json()["data"]) == 1
+
+
+@pytest.mark.anyio
+async def test_update_onto_existing_equipment_identity_conflicts(client: AsyncClient) -> None:
+    icu = await client.post(api_path("/departments"), json={"name": "ICU", "organization_id": 84})
+    ward = await client.post(api_path("/departments"), json={"name": "Ward", "organization_id": 84})
+    icu_id, ward_id = icu.json()["data"]["id"], ward.json()["data"]["id"]
+    body = {
+        "name": "Defibrillator",
+        "manufacturer": "Philips",
+        "model_number": "HeartStart",
+        "category": "Cardiac",
+        "status": "available",
+    }
+    await client.post(api_path("/equipment"), json={**body, "department_id": icu_id})
+    other = await client.post(
+        api_path("/equipment"), json={**body, "name": "Monitor", "department_id": icu_id}
+    )
+    moving = await client.post(api_path("/equipment"), json={**body, "department_id": ward_id})
+
+    renamed = await client.put(
+        api_path(f"/equipment/{other.json()['data']['id']}"),
+        json={**body, "name": "DEFIBRILLATOR ", "department_id": icu_id},
+    )
+    moved = await client.put(
+        api_path(f"/equipment/{moving.json()['data']['id']}"),
+        json={**body, "department_id": icu_id},
+    )
+
+    assert (renamed.status_code, moved.status_code) == (409, 409)
+    assert moved.json()["message"] == "Equipment already exists in this department"
+    listed = await client.get(api_path("/equipment"), params={"department_id": icu_id})
+    assert listed.json()["data"]["pagination"]["total_items"] == 2
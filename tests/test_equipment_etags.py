@@ -0,0 +1,101 @@
+import pytest
+from httpx import AsyncClient
+
+from app.core.instrumentation import count_queries
+from tests.helpers import api_path, equipment_body
+
+
+async def _create(client: AsyncClient) -> tuple[int, dict]:
+    department = await client.post(
+        api_path("/departments"),
+        json={"name": "Obstetrics", "organization_id": 99},
+    )
+    department_id = department.json()["data"]["id"]
+    created = await client.post(api_path("/equipment"), json=equipment_body(department_id))
+    return department_id, created.json()["data"]
+
+
+@pytest.mark.anyio
+async def test_conditional_get_returns_304_until_equipment_changes(client: AsyncClient) -> None:
+    department_id, equipment = await _create(client)
+    item_path = api_path(f"/equipment/{equipment['id']}")
+
+    first = await client.get(item_path)
+    etag = first.headers["etag"]
+    with count_queries() as queries:
+        cached = await client.get(item_path, headers={"If-None-Match": etag})
+
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert cached.content == b""
+    assert queries.count == 1
+    assert "updated_at" in queries.statements[0] and "equipment.name" not in queries.statements[0]
+
+    await client.put(item_path, json=equipment_body(department_id, name="Infusion Pump 2"))
+    changed = await client.get(item_path, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["data"]["name"] == "Infusion Pump 2"
+
+
+@pytest.mark.anyio
+async def test_list_etag_tracks_collection_writes(client: AsyncClient) -> None:
+    department_id, equipment = await _create(client)
+    params = {"department_id": department_id, "status": "available"}
+
+    first = await client.get(api_path("/equipment"), params=params)
+    etag = first.headers["etag"]
+    unchanged = await client.get(
+        api_path("/equipment"),
+        params=params,
+        headers={"If-None-Match": etag},
+    )
+    other_page = await client.get(
+        api_path("/equipment"),
+        params={**params, "page_size": 5},
+        headers={"If-None-Match": etag},
+    )
+    assert (unchanged.status_code, other_page.status_code) == (304, 200)
+
+    # A rename keeps status and department, but must still invalidate the list.
+    await client.put(
+        api_path(f"/equipment/{equipment['id']}"),
+        json=equipment_body(department_id, name="Renamed"),
+    )
+    renamed = await client.get(
+        api_path("/equipment"),
+        params=params,
+        headers={"If-None-Match": etag},
+    )
+    assert renamed.status_code == 200
+    assert renamed.json()["data"]["items"][0]["name"] == "Renamed"
+    assert renamed.json()["data"]["pagination"]["total_items"] == 1
+
+
+@pytest.mark.anyio
+async def test_put_honours_if_match(client: AsyncClient) -> None:
+    department_id, equipment = await _create(client)
+    item_path = api_path(f"/equipment/{equipment['id']}")
+    etag = (await client.get(item_path)).headers["etag"]
+
+    updated = await client.put(
+        item_path,
+        json=equipment_body(department_id, status="maintenance"),
+        headers={"If-Match": etag},
+    )
+    assert updated.status_code == 200
+
+    stale = await client.put(
+        item_path,
+        json=equipment_body(department_id, status="in_use"),
+        headers={"If-Match": etag},
+    )
+    assert stale.status_code == 412
+    assert (await client.get(item_path)).json()["data"]["status"] == "maintenance"
+
+    current = await client.put(
+        item_path,
+        json=equipment_body(department_id, status="in_use"),
+        headers={"If-Match": updated.headers["etag"]},
+    )
+    assert current.status_code == 200
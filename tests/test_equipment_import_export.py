@@ -0,0 +1,89 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+
+from tests.helpers import api_path, create_department, equipment_body
+
+
+@pytest.mark.anyio
+async def test_bulk_import_reports_each_row(client: AsyncClient) -> None:
+    department_id = await create_department(client, "Cardiology", 50)
+    existing = await client.post(
+        api_path("/equipment"), json=equipment_body(department_id, name="Monitor-A")
+    )
+    assert existing.status_code == 201
+
+    response = await client.post(
+        api_path("/equipment/bulk"),
+        json=[
+            equipment_body(department_id, name="Monitor-B"),
+            equipment_body(department_id, name="monitor-a"),
+            equipment_body(department_id, name="Monitor-B"),
+            equipment_body(999, name="Monitor-C"),
+            {"name": "x"},
+        ],
+    )
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["created"] == 1
+    assert data["failed"] == 4
+    assert [row["status"] for row in data["results"]] == [
+        "created",
+        "conflict",
+        "conflict",
+        "not_found",
+        "invalid",
+    ]
+
+    listing = await client.get(api_path("/equipment"), params={"department_id": department_id})
+    assert listing.json()["data"]["pagination"]["total_items"] == 2
+
+
+@pytest.mark.anyio
+async def test_bulk_import_accepts_ndjson(client: AsyncClient) -> None:
+    department_id = await create_department(client, "Cardiology", 50)
+    body = (
+        "\n".join(
+            json.dumps(equipment_body(department_id, name=f"Pump-{index}")) for index in range(3)
+        )
+        + "\nnot json\n"
+    )
+
+    response = await client.post(
+        api_path("/equipment/bulk"),
+        content=body,
+        headers={"content-type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    statuses = [row["status"] for row in response.json()["data"]["results"]]
+    assert statuses == ["created", "created", "created", "invalid"]
+
+
+@pytest.mark.anyio
+async def test_export_streams_organization_inventory(client: AsyncClient) -> None:
+    department_id = await create_department(client, "Cardiology", 50)
+    response = await client.post(
+        api_path("/equipment/bulk"),
+        json=[equipment_body(department_id, name=f"Monitor-{index}") for index in range(3)],
+    )
+    assert response.json()["data"]["created"] == 3
+
+    ndjson = await client.get(api_path("/equipment/export"), params={"organization_id": 50})
+    assert ndjson.status_code == 200
+    assert ndjson.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert [row["name"] for row in rows] == ["Monitor-0", "Monitor-1", "Monitor-2"]
+
+    csv_export = await client.get(
+        api_path("/equipment/export"),
+        params={"organization_id": 50, "format": "csv"},
+    )
+    lines = csv_export.text.splitlines()
+    assert lines[0].split(",")[0] == "name"
+    assert len(lines) == 4
+
+    other = await client.get(api_path("/equipment/export"), params={"organization_id": 51})
+    assert other.text == ""
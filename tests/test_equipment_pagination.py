@@ -0,0 +1,148 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.database import get_db
+from app.core.instrumentation import count_queries
+from app.main import app
+from app.repositories.enums import CounterResource, EquipmentStatus
+from app.services.inventory_counter_service import InventoryCounterService
+from tests.helpers import api_path
+
+
+async def _seed_equipment(client: AsyncClient, count: int) -> int:
+    response = await client.post(
+        api_path("/departments"),
+        json={"name": "Radiology", "organization_id": 30},
+    )
+    assert response.status_code == 201
+    department_id = response.json()["data"]["id"]
+
+    for index in range(count):
+        response = await client.post(
+            api_path("/equipment"),
+            json={
+                "name": f"Scanner-{index}",
+                "manufacturer": "Siemens",
+                "model_number": f"S-{index}",
+                "category": "Imaging",
+                "status": "available",
+                "department_id": department_id,
+            },
+        )
+        assert response.status_code == 201
+    return department_id
+
+
+@pytest.mark.anyio
+async def test_cursor_pagination_walks_all_items_in_id_order(client: AsyncClient) -> None:
+    department_id = await _seed_equipment(client, 5)
+
+    first = await client.get(
+        api_path("/equipment"),
+        params={"department_id": department_id, "page_size": 2},
+    )
+    assert first.status_code == 200
+    pagination = first.json()["data"]["pagination"]
+    assert pagination["total_items"] == 5
+    seen = [item["id"] for item in first.json()["data"]["items"]]
+
+    cursor = pagination["next_cursor"]
+    while cursor:
+        response = await client.get(
+            api_path("/equipment"),
+            params={"department_id": department_id, "page_size": 2, "cursor": cursor},
+        )
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert "total_items" not in data["pagination"]
+        seen.extend(item["id"] for item in data["items"])
+        cursor = data["pagination"]["next_cursor"]
+
+    assert len(seen) == 5
+    assert seen == sorted(seen, reverse=True)
+
+
+@pytest.mark.anyio
+async def test_invalid_cursor_is_rejected(client: AsyncClient) -> None:
+    response = await client.get(api_path("/equipment"), params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+    assert response.json()["message"] == "Invalid cursor"
+
+
+@pytest.mark.anyio
+async def test_total_items_follow_status_changes(client: AsyncClient) -> None:
+    department_id = await _seed_equipment(client, 3)
+    listing = await client.get(api_path("/equipment"), params={"department_id": department_id})
+    item = listing.json()["data"]["items"][0]
+
+    update = await client.put(
+        api_path(f"/equipment/{item['id']}"),
+        json={
+            "name": item["name"],
+            "manufacturer": item["manufacturer"],
+            "model_number": item["model_number"],
+            "category": item["category"],
+            "status": "maintenance",
+            "department_id": department_id,
+        },
+    )
+    assert update.status_code == 200
+
+    available = await client.get(
+        api_path("/equipment"),
+        params={"department_id": department_id, "status": "available"},
+    )
+    maintenance = await client.get(
+        api_path("/equipment"),
+        params={"department_id": department_id, "status": "maintenance"},
+    )
+    assert available.json()["data"]["pagination"]["total_items"] == 2
+    assert maintenance.json()["data"]["pagination"]["total_items"] == 1
+
+
+@pytest.mark.anyio
+async def test_include_total_false_skips_totals(client: AsyncClient) -> None:
+    department_id = await _seed_equipment(client, 3)
+
+    with count_queries() as queries:
+        response = await client.get(
+            api_path("/equipment"),
+            params={"department_id": department_id, "page_size": 2, "include_total": "false"},
+        )
+
+    assert queries.count == 1
+    assert "ETag" not in response.headers
+    pagination = response.json()["data"]["pagination"]
+    assert pagination["total_items"] is None
+    assert pagination["total_pages"] is None
+    assert pagination["next_cursor"] is not None
+
+
+@pytest.mark.anyio
+async def test_counter_upserts_run_in_key_order(client: AsyncClient) -> None:
+    """Opposite moves must lock the same counter rows in the same order (no deadlock)."""
+    async for session in app.dependency_overrides[get_db]():
+        counters = InventoryCounterService(session)
+        session.execute = AsyncMock(wraps=session.execute)
+        available = (CounterResource.EQUIPMENT, 30, 1, EquipmentStatus.AVAILABLE)
+        in_use = (CounterResource.EQUIPMENT, 30, 1, EquipmentStatus.IN_USE)
+        await counters.adjust_many({available: -1, in_use: 1})
+        await counters.adjust_many({in_use: -1, available: 1})
+        await counters.adjust_pending_many({(30, 4): 1, (30, 2): -1, (29, 5): 1})
+        executed = [
+            call.args[1]
+            for call in session.execute.call_args_list
+            if len(call.args) > 1 and isinstance(call.args[1], list)
+        ]
+        await session.rollback()
+
+    statuses = [[row["status"] for row in rows] for rows in executed[:2]]
+    assert statuses == [["available", "in_use"], ["available", "in_use"]]
+    assert [(row["organization_id"], row["priority"]) for row in executed[2]] == [
+        (29, 5),
+        (30, 2),
+        (30, 4),
+    ]
@@ -0,0 +1,173 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+
+from app.core.database import get_db
+from app.main import app
+from tests.helpers import api_path
+
+
+async def _seed_queue(
+    client: AsyncClient,
+    organization_id: int,
+    priorities: list[int],
+) -> list[int]:
+    department = await client.post(
+        api_path("/departments"),
+        json={"name": "Cath Lab", "organization_id": organization_id},
+    )
+    department_id = department.json()["data"]["id"]
+    request_ids = []
+    for index, priority in enumerate(priorities):
+        equipment = await client.post(
+            api_path("/equipment"),
+            json={
+                "name": f"Injector-{index}",
+                "manufacturer": "Bayer",
+                "model_number": "Mark 7",
+                "category": "Imaging",
+                "status": "available",
+                "department_id": department_id,
+            },
+        )
+        created = await client.post(
+            api_path("/equipment-requests"),
+            json={
+                "equipment_id": equipment.json()["data"]["id"],
+                "requested_by": "Dr Okafor",
+                "justification": "Scheduled procedures",
+                "priority": priority,
+                "organization_id": organization_id,
+            },
+        )
+        request_ids.append(created.json()["data"]["id"])
+    return request_ids
+
+
+async def _walk_queue(client: AsyncClient, organization_id: int, **params) -> list[int]:
+    seen: list[int] = []
+    cursor = None
+    while True:
+        query = {"organization_id": organization_id, "page_size": 2, **params}
+        if cursor:
+            query["cursor"] = cursor
+        response = await client.get(api_path("/equipment-requests/queue"), params=query)
+        assert response.status_code == 200
+        data = response.json()["data"]
+        seen += [item["id"] for item in data["items"]]
+        cursor = data["pagination"]["next_cursor"]
+        if cursor is None:
+            return seen
+
+
+@pytest.mark.anyio
+async def test_queue_pages_by_priority_then_age(client: AsyncClient) -> None:
+    ids = await _seed_queue(client, 81, [3, 1, 5, 1, 3, 1, 3])
+    await client.patch(api_path(f"/equipment-requests/{ids[4]}/approve"))
+
+    # Requests created within the same second tie on created_at; id breaks the tie, and
+    # page boundaries fall inside runs of equal priority.
+    expected = [ids[1], ids[3], ids[5], ids[0], ids[6], ids[2]]
+    assert await _walk_queue(client, 81) == expected
+
+    invalid = await client.get(
+        api_path("/equipment-requests/queue"),
+        params={"organization_id": 81, "cursor": "not-a-cursor"},
+    )
+    assert invalid.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_claims_hand_out_disjoint_requests_in_queue_order(client: AsyncClient) -> None:
+    ids = await _seed_queue(client, 82, [2, 1, 4, 1, 2, 5])
+
+    first = await client.post(
+        api_path("/equipment-requests/queue/claim"),
+        json={"organization_id": 82, "claimed_by": "Approver A", "limit": 2},
+    )
+    assert first.status_code == 200
+    assert [item["id"] for item in first.json()["data"]] == [ids[1], ids[3]]
+    assert {item["claimed_by"] for item in first.json()["data"]} == {"Approver A"}
+
+    claims = await asyncio.gather(
+        *(
+            client.post(
+                api_path("/equipment-requests/queue/claim"),
+                json={"organization_id": 82, "claimed_by": f"Approver {name}", "limit": 2},
+            )
+            for name in ("B", "C")
+        )
+    )
+    claimed = [item["id"] for response in claims for item in response.json()["data"]]
+    assert sorted(claimed) == sorted([ids[0], ids[4], ids[2], ids[5]])
+
+    assert await _walk_queue(client, 82, unclaimed_only=True) == []
+    assert len(await _walk_queue(client, 82)) == 6
+
+    empty = await client.post(
+        api_path("/equipment-requests/queue/claim"),
+        json={"organization_id": 82, "claimed_by": "Approver D"},
+    )
+    assert empty.json()["data"] == []
+
+
+@pytest.mark.anyio
+async def test_queue_page_is_served_from_the_queue_index(client: AsyncClient) -> None:
+    await _seed_queue(client, 83, [1, 2])
+
+    async for session in app.dependency_overrides[get_db]():
+        plan = await session.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT id FROM equipment_requests "
+                "WHERE organization_id = 83 AND status = 'PENDING' "
+                "AND (priority, created_at, id) > (1, '2000-01-01 00:00:00', 0) "
+                "ORDER BY priority, created_at, id LIMIT 21"
+            )
+        )
+        details = " ".join(row[-1] for row in plan)
+
+    assert "ix_equipment_requests_queue" in details
+    assert "TEMP B-TREE" not in details
+
+
+@pytest.mark.anyio
+async def test_request_list_cursor_walks_newest_first(client: AsyncClient) -> None:
+    ids = await _seed_queue(client, 84, [1, 2, 3, 4, 5])
+
+    first = await client.get(
+        api_path("/equipment-requests"),
+        params={"organization_id": 84, "page_size": 2},
+    )
+    pagination = first.json()["data"]["pagination"]
+    seen = [item["id"] for item in first.json()["data"]["items"]]
+    cursor = pagination["next_cursor"]
+    for _ in range(5):
+        if cursor is None:
+            break
+        response = await client.get(
+            api_path("/equipment-requests"),
+            params={"organization_id": 84, "page_size": 2, "cursor": cursor},
+        )
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert "total_items" not in data["pagination"]
+        seen += [item["id"] for item in data["items"]]
+        cursor = data["pagination"]["next_cursor"]
+
+    # Same-second created_at values fall back to id for a stable newest-first order.
+    assert seen == list(reversed(ids))
+
+    async for session in app.dependency_overrides[get_db]():
+        plan = await session.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT id FROM equipment_requests "
+                "WHERE organization_id = 84 AND (created_at, id) < ('2100-01-01 00:00:00', 0) "
+                "ORDER BY created_at DESC, id DESC LIMIT 21"
+            )
+        )
+        details = " ".join(row[-1] for row in plan)
+
+    assert "ix_equipment_requests_organization_created" in details
+    assert "TEMP B-TREE" not in details
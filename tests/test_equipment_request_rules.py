@@ -1,21 +1,7 @@
 import pytest
 from httpx import AsyncClient
 
-from app.core.config import settings
-
-
-def _path(path: str) -> str:
-    prefix = settings.api_prefix.rstrip("/")
-    return f"{prefix}{path}" if prefix else path
-
-
-async def _create_department(client: AsyncClient, name: str, organization_id: int) -> dict:
-    response = await client.post(
-        _path("/departments"),
-        json={"name": name, "organization_id": organization_id},
-    )
-    assert response.status_code == 201
-    return response.json()["data"]
+from tests.helpers import api_path, create_department
 
 
 async def _create_equipment(
@@ -26,7 +12,7 @@ async def _create_equipment(
     name: str,
 ) -> dict:
     response = await client.post(
-        _path("/equipment"),
+        api_path("/equipment"),
         json={
             "name": name,
             "manufacturer": "GE",
@@ -42,16 +28,16 @@ async def _create_equipment(
 
 @pytest.mark.anyio
 async def test_decommissioned_equipment_cannot_be_requested(client: AsyncClient) -> None:
-    department = await _create_department(client, "ICU", 10)
+    department_id = await create_department(client, "ICU", 10)
     equipment = await _create_equipment(
         client,
-        department_id=department["id"],
+        department_id=department_id,
         status="decommissioned",
         name="Ventilator-X",
     )
 
     response = await client.post(
-        _path("/equipment-requests"),
+        api_path("/equipment-requests"),
         json={
             "equipment_id": equipment["id"],
             "requested_by": "Dr Arun",
@@ -69,16 +55,16 @@ async def test_decommissioned_equipment_cannot_be_requested(client: AsyncClient)
 
 @pytest.mark.anyio
 async def test_only_pending_request_can_be_approved_once(client: AsyncClient) -> None:
-    department = await _create_department(client, "ER", 20)
+    department_id = await create_department(client, "ER", 20)
     equipment = await _create_equipment(
         client,
-        department_id=department["id"],
+        department_id=department_id,
         status="available",
         name="Defibrillator-Z",
     )
 
     create_request = await client.post(
-        _path("/equipment-requests"),
+        api_path("/equipment-requests"),
         json={
             "equipment_id": equipment["id"],
             "requested_by": "Nurse Mia",
@@ -91,10 +77,128 @@ async def test_only_pending_request_can_be_approved_once(client: AsyncClient) ->
 
     request_id = create_request.json()["data"]["id"]
 
-    first_approve = await client.patch(_path(f"/equipment-requests/{request_id}/approve"))
+    first_approve = await client.patch(api_path(f"/equipment-requests/{request_id}/approve"))
     assert first_approve.status_code == 200
     assert first_approve.json()["data"]["status"] == "approved"
 
-    second_approve = await client.patch(_path(f"/equipment-requests/{request_id}/approve"))
+    second_approve = await client.patch(api_path(f"/equipment-requests/{request_id}/approve"))
     assert second_approve.status_code == 400
     assert second_approve.json()["message"] == "Only pending requests can be approved"
+
+
+@pytest.mark.anyio
+async def test_request_totals_are_scoped_to_organization(client: AsyncClient) -> None:
+    department_id = await create_department(client, "Ward", 40)
+    equipment = await _create_equipment(
+        client,
+        department_id=department_id,
+        status="available",
+        name="Infusion-Pump",
+    )
+
+    for requester in ("Dr Lee", "Dr Ray"):
+        response = await client.post(
+            api_path("/equipment-requests"),
+            json={
+                "equipment_id": equipment["id"],
+                "requested_by": requester,
+                "justification": "Additional ward capacity",
+                "priority": 1,
+                "organization_id": 40,
+            },
+        )
+        assert response.status_code == 201
+
+    own = await client.get(api_path("/equipment-requests"), params={"organization_id": 40})
+    other = await client.get(api_path("/equipment-requests"), params={"organization_id": 41})
+
+    assert own.json()["data"]["pagination"]["total_items"] == 2
+    assert other.json()["data"]["pagination"]["total_items"] == 0
+
+
+@pytest.mark.anyio
+async def test_duplicate_pending_request_is_rejected_case_insensitively(
+    client: AsyncClient,
+) -> None:
+    department_id = await create_department(client, "Theatre", 60)
+    equipment = await _create_equipment(
+        client,
+        department_id=department_id,
+        status="available",
+        name="Anesthesia-Unit",
+    )
+    body = {
+        "equipment_id": equipment["id"],
+        "requested_by": "Dr Ana",
+        "justification": "Scheduled surgery block",
+        "priority": 2,
+        "organization_id": 60,
+    }
+
+    first = await client.post(api_path("/equipment-requests"), json=body)
+    assert first.status_code == 201
+    assert first.json()["data"]["status"] == "pending"
+
+    second = await client.post(
+        api_path("/equipment-requests"),
+        json={**body, "requested_by": "  dr ana "},
+    )
+    assert second.status_code == 409
+    assert second.json()["message"] == "Pending request already exists for this equipment"
+
+
+@pytest.mark.anyio
+async def test_bulk_approve_and_reject_report_changed_and_skipped_ids(
+    client: AsyncClient,
+) -> None:
+    department_id = await create_department(client, "Recovery", 70)
+    request_ids = []
+    for index in range(4):
+        equipment = await _create_equipment(
+            client,
+            department_id=department_id,
+            status="available",
+            name=f"Pump-{index}",
+        )
+        created = await client.post(
+            api_path("/equipment-requests"),
+            json={
+                "equipment_id": equipment["id"],
+                "requested_by": "Nurse Lee",
+                "justification": "Post-op monitoring",
+                "priority": 4,
+                "organization_id": 70,
+            },
+        )
+        request_ids.append(created.json()["data"]["id"])
+
+    approved = await client.patch(
+        api_path("/equipment-requests/approve"),
+        json={"ids": [request_ids[0], request_ids[1], request_ids[0], 999_999]},
+    )
+    assert approved.status_code == 200
+    data = approved.json()["data"]
+    assert [item["id"] for item in data["changed"]] == request_ids[:2]
+    assert {item["status"] for item in data["changed"]} == {"approved"}
+    assert data["skipped_ids"] == [999_999]
+
+    rejected = await client.patch(
+        api_path("/equipment-requests/reject"),
+        json={"ids": request_ids},
+    )
+    data = rejected.json()["data"]
+    assert [item["id"] for item in data["changed"]] == request_ids[2:]
+    assert {item["status"] for item in data["changed"]} == {"rejected"}
+    assert data["skipped_ids"] == request_ids[:2]
+
+    single = await client.patch(api_path(f"/equipment-requests/{request_ids[2]}/reject"))
+    assert single.status_code == 400
+    assert single.json()["message"] == "Only pending requests can be rejected"
+    missing = await client.patch(api_path("/equipment-requests/999999/approve"))
+    assert missing.status_code == 404
+
+    summary = await client.get(api_path("/organizations/70/summary"))
+    assert summary.json()["data"]["pending_requests"]["total"] == 0
+
+    empty = await client.patch(api_path("/equipment-requests/approve"), json={"ids": []})
+    assert empty.status_code == 422
@@ -0,0 +1,112 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from app.repositories.equipment import Equipment, equipment_search_document
+from tests.helpers import api_path, create_department
+
+
+async def _equipment(
+    client: AsyncClient,
+    department_id: int,
+    name: str,
+    manufacturer: str = "Philips",
+    model_number: str = "IntelliVue MX450",
+) -> dict:
+    response = await client.post(
+        api_path("/equipment"),
+        json={
+            "name": name,
+            "manufacturer": manufacturer,
+            "model_number": model_number,
+            "category": "Monitor",
+            "status": "available",
+            "department_id": department_id,
+        },
+    )
+    return response.json()["data"]
+
+
+async def _search(client: AsyncClient, q: str, organization_id: int, **params) -> list[str]:
+    response = await client.get(
+        api_path("/equipment/search"),
+        params={"q": q, "organization_id": organization_id, **params},
+    )
+    assert response.status_code == 200
+    return [item["name"] for item in response.json()["data"]["items"]]
+
+
+@pytest.mark.anyio
+async def test_search_matches_substrings_and_ranks_name_prefix_first(client: AsyncClient) -> None:
+    icu = await create_department(client, "ICU", 41)
+    await _equipment(client, icu, "Bedside Monitor")
+    await _equipment(client, icu, "Monitor Stand", manufacturer="Ergotron", model_number="MS-1")
+    await _equipment(client, icu, "Ventilator", manufacturer="Draeger", model_number="V500")
+
+    assert await _search(client, "MONITOR", 41) == ["Monitor Stand", "Bedside Monitor"]
+    assert await _search(client, "draeg", 41) == ["Ventilator"]
+    assert await _search(client, "mx450 philips", 41) == ["Bedside Monitor"]
+    assert await _search(client, "nothing-like-this", 41) == []
+
+
+@pytest.mark.anyio
+async def test_search_is_scoped_to_organization_and_department(client: AsyncClient) -> None:
+    icu = await create_department(client, "ICU", 42)
+    er = await create_department(client, "ER", 42)
+    other = await create_department(client, "ICU", 43)
+    await _equipment(client, icu, "ICU Monitor")
+    await _equipment(client, er, "ER Monitor")
+    await _equipment(client, other, "Foreign Monitor")
+
+    assert sorted(await _search(client, "monitor", 42)) == ["ER Monitor", "ICU Monitor"]
+    assert await _search(client, "monitor", 42, department_id=er) == ["ER Monitor"]
+    assert await _search(client, "monitor", 43) == ["Foreign Monitor"]
+
+
+@pytest.mark.anyio
+async def test_search_index_follows_updates(client: AsyncClient) -> None:
+    department_id = await create_department(client, "Radiology", 44)
+    equipment = await _equipment(client, department_id, "Portable X-Ray")
+
+    await client.put(
+        api_path(f"/equipment/{equipment['id']}"),
+        json={
+            "name": "Mobile C-Arm",
+            "manufacturer": "Siemens",
+            "model_number": "Cios Alpha",
+            "category": "Imaging",
+            "status": "available",
+            "department_id": department_id,
+        },
+    )
+
+    assert await _search(client, "x-ray", 44) == []
+    assert await _search(client, "c-arm", 44) == ["Mobile C-Arm"]
+    assert await _search(client, "cios", 44) == ["Mobile C-Arm"]
+
+
+@pytest.mark.anyio
+async def test_search_requires_a_term_long_enough_for_the_index(client: AsyncClient) -> None:
+    response = await client.get(
+        api_path("/equipment/search"),
+        params={"q": "ab cd", "organization_id": 45},
+    )
+    assert response.status_code == 400
+
+    too_short = await client.get(
+        api_path("/equipment/search"),
+        params={"q": "ab", "organization_id": 45},
+    )
+    assert too_short.status_code == 422
+
+
+def test_search_expression_compiles_to_the_indexed_expression() -> None:
+    """Postgres only uses an expression index when the query repeats its text exactly."""
+    dialect = postgresql.asyncpg.dialect()
+    (index,) = [i for i in Equipment.__table__.indexes if i.name == "ix_equipment_search_trgm"]
+    index_sql = str(CreateIndex(index).compile(dialect=dialect))
+    query_sql = str(equipment_search_document.compile(dialect=dialect))
+
+    assert query_sql.replace("equipment.", "") in index_sql
+    assert "$" not in query_sql
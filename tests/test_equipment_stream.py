@@ -0,0 +1,129 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+
+from app.api.v1.departments import _event_stream
+from app.core.instrumentation import count_queries
+from app.core.pubsub import PubSubHub, equipment_hub, format_sse
+from tests.helpers import api_path, create_department, equipment_body
+
+
+def _event_data(message: bytes) -> dict:
+    event, data = message.decode().strip().split("\n")
+    assert event == "event: equipment.updated"
+    return json.loads(data.removeprefix("data: "))
+
+
+@pytest.mark.anyio
+async def test_hub_fans_out_and_evicts_slow_subscribers() -> None:
+    hub = PubSubHub(queue_size=2)
+    fast = hub.subscribe(1)
+    slow = hub.subscribe(1)
+    other = hub.subscribe(2)
+
+    assert hub.publish(1, b"a") == 2
+    assert await fast.get(timeout=0) == b"a"
+    assert hub.publish(1, b"b") == 2
+    assert hub.publish(1, b"c") == 1
+
+    assert slow.evicted and not fast.evicted
+    assert hub.subscriber_count(1) == 1
+    with pytest.raises(StopAsyncIteration):
+        await slow.get(timeout=0)
+    assert [await fast.get(timeout=0), await fast.get(timeout=0)] == [b"b", b"c"]
+    assert await fast.get(timeout=0) is None
+    assert other.queue.empty()
+
+    fast.close()
+    other.close()
+    assert hub.stats() == {
+        "topics": 0,
+        "subscribers": 0,
+        "published": 3,
+        "delivered": 5,
+        "evicted": 1,
+    }
+
+
+@pytest.mark.anyio
+async def test_event_stream_ends_on_eviction_and_unsubscribes() -> None:
+    hub = PubSubHub(queue_size=1)
+    subscription = hub.subscribe(7)
+    hub.publish(7, b"event: x\ndata: {}\n\n")
+
+    stream = _event_stream(subscription)
+    assert await anext(stream) == b": connected\n\n"
+    assert await anext(stream) == b"event: x\ndata: {}\n\n"
+    hub.publish(7, b"first")
+    hub.publish(7, b"overflow")
+    with pytest.raises(StopAsyncIteration):
+        await anext(stream)
+    assert hub.subscriber_count() == 0
+
+
+@pytest.mark.anyio
+async def test_status_and_department_changes_are_published(client: AsyncClient) -> None:
+    ward = await create_department(client, "Ward 3", 71)
+    icu = await create_department(client, "ICU", 71)
+    created = await client.post(api_path("/equipment"), json=equipment_body(ward))
+    equipment_id = created.json()["data"]["id"]
+
+    ward_stream = equipment_hub.subscribe(ward)
+    icu_stream = equipment_hub.subscribe(icu)
+    try:
+        # Name-only edits are not status changes and are not pushed.
+        renamed = equipment_body(ward, name="Infusion Pump 2")
+        await client.put(api_path(f"/equipment/{equipment_id}"), json=renamed)
+        assert await ward_stream.get(timeout=0) is None
+
+        await client.put(
+            api_path(f"/equipment/{equipment_id}"),
+            json=equipment_body(ward, status="maintenance"),
+        )
+        event = _event_data(await ward_stream.get(timeout=0))
+        assert event["previous_status"] == "available"
+        assert event["equipment"]["status"] == "maintenance"
+        assert await icu_stream.get(timeout=0) is None
+
+        await client.put(
+            api_path(f"/equipment/{equipment_id}"),
+            json=equipment_body(icu, status="maintenance"),
+        )
+        moved_out = _event_data(await ward_stream.get(timeout=0))
+        moved_in = _event_data(await icu_stream.get(timeout=0))
+        assert moved_out == moved_in
+        assert moved_in["previous_department_id"] == ward
+        assert moved_in["equipment"]["department_id"] == icu
+    finally:
+        ward_stream.close()
+        icu_stream.close()
+
+
+@pytest.mark.anyio
+async def test_publishing_adds_no_queries(client: AsyncClient) -> None:
+    department_id = await create_department(client, "Ward 4", 72)
+    created = await client.post(api_path("/equipment"), json=equipment_body(department_id))
+    equipment_id = created.json()["data"]["id"]
+    body = equipment_body(department_id, status="maintenance")
+
+    with count_queries() as without_subscribers:
+        await client.put(api_path(f"/equipment/{equipment_id}"), json=body)
+    subscriptions = [equipment_hub.subscribe(department_id) for _ in range(50)]
+    try:
+        body["status"] = "available"
+        with count_queries() as with_subscribers:
+            await client.put(api_path(f"/equipment/{equipment_id}"), json=body)
+        assert with_subscribers.count == without_subscribers.count
+        for subscription in subscriptions:
+            assert await subscription.get(timeout=0) is not None
+    finally:
+        for subscription in subscriptions:
+            subscription.close()
+
+
+@pytest.mark.anyio
+async def test_stream_rejects_unknown_department(client: AsyncClient) -> None:
+    response = await client.get(api_path("/departments/999/equipment/stream"))
+    assert response.status_code == 404
+    assert format_sse("ping", {"a": 1}) == b'event: ping\ndata: {"a":1}\n\n'
@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.api.idempotency import IdempotencyStore
+from app.api.middleware import IdempotencyMiddleware
+from app.core.instrumentation import count_queries, metrics_registry
+from tests.helpers import api_path, create_department, equipment_body
+
+
+@pytest.mark.anyio
+async def test_retry_is_replayed_without_touching_the_database(client: AsyncClient) -> None:
+    metrics_registry.clear()
+    department_id = await create_department(client, "Ward 5", 81)
+    created = await client.post(api_path("/equipment"), json=equipment_body(department_id))
+    body = {
+        "equipment_id": created.json()["data"]["id"],
+        "requested_by": "Nurse Okafor",
+        "justification": "Second pump for the night shift",
+        "priority": 2,
+        "organization_id": 81,
+    }
+    headers = {"Idempotency-Key": "request-7f3a"}
+
+    first = await client.post(api_path("/equipment-requests"), json=body, headers=headers)
+    with count_queries() as queries:
+        retry = await client.post(api_path("/equipment-requests"), json=body, headers=headers)
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.json() == first.json()
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert "Idempotent-Replayed" not in first.headers
+    assert queries.count == 0
+    assert len(retry.headers.get_list("server-timing")) == 1
+    assert retry.headers["server-timing"] != first.headers["server-timing"]
+
+    listed = await client.get(api_path("/equipment-requests"), params={"organization_id": 81})
+    assert listed.json()["data"]["pagination"]["total_items"] == 1
+    route = api_path("/equipment-requests")
+    rendered = metrics_registry.render()
+    assert f'http_requests_total{{method="POST",route="{route}",status="201"}} 2' in rendered
+    assert 'route="unmatched"' not in rendered
+
+
+@pytest.mark.anyio
+async def test_key_reused_for_a_different_request_is_rejected(client: AsyncClient) -> None:
+    department_id = await create_department(client, "Ward 6", 82)
+    headers = {"Idempotency-Key": "equipment-1"}
+    await client.post(api_path("/equipment"), json=equipment_body(department_id), headers=headers)
+
+    response = await client.post(
+        api_path("/equipment"),
+        json=equipment_body(department_id, name="Syringe Pump"),
+        headers=headers,
+    )
+    assert response.status_code == 422
+    assert response.json()["success"] is False
+
+    too_long = await client.post(
+        api_path("/equipment"),
+        json=equipment_body(department_id),
+        headers={"Idempotency-Key": "k" * 256},
+    )
+    assert too_long.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_concurrent_duplicates_wait_for_the_original(client: AsyncClient) -> None:
+    department_id = await create_department(client, "Ward 7", 83)
+    headers = {"Idempotency-Key": "burst-1"}
+
+    responses = await asyncio.gather(
+        *(
+            client.post(api_path("/equipment"), json=equipment_body(department_id), headers=headers)
+            for _ in range(3)
+        )
+    )
+
+    assert {response.status_code for response in responses} == {201}
+    assert len({response.json()["data"]["id"] for response in responses}) == 1
+    assert sum("Idempotent-Replayed" in response.headers for response in responses) == 2
+    listed = await client.get(api_path("/equipment"), params={"department_id": department_id})
+    assert listed.json()["data"]["pagination"]["total_items"] == 1
+
+
+@pytest.mark.anyio
+async def test_server_errors_are_not_stored() -> None:
+    calls = 0
+
+    async def flaky_app(scope, receive, send) -> None:
+        nonlocal calls
+        calls += 1
+        await receive()
+        status = 503 if calls == 1 else 201
+        await send({"type": "http.response.start", "status": status, "headers": []})
+        await send({"type": "http.response.body", "body": str(calls).encode()})
+
+    store = IdempotencyStore(max_entries=10, ttl_seconds=60, max_body_bytes=1024)
+    transport = ASGITransport(app=IdempotencyMiddleware(flaky_app, store=store))
+    async with AsyncClient(transport=transport, base_url="http://test") as test_client:
+        headers = {"Idempotency-Key": "retry-after-503"}
+        responses = [await test_client.post("/", json={}, headers=headers) for _ in range(3)]
+
+    assert [response.status_code for response in responses] == [503, 201, 201]
+    assert [response.text for response in responses] == ["1", "2", "2"]
+    assert calls == 2
+    assert store.stats()["replayed"] == 1
+
+
+@pytest.mark.anyio
+async def test_oversized_responses_are_not_stored() -> None:
+    calls = 0
+
+    async def large_app(scope, receive, send) -> None:
+        nonlocal calls
+        calls += 1
+        await receive()
+        await send({"type": "http.response.start", "status": 201, "headers": []})
+        await send({"type": "http.response.body", "body": b"x" * 600, "more_body": True})
+        await send({"type": "http.response.body", "body": b"x" * 600})
+
+    store = IdempotencyStore(max_entries=10, ttl_seconds=60, max_body_bytes=1024)
+    transport = ASGITransport(app=IdempotencyMiddleware(large_app, store=store))
+    async with AsyncClient(transport=transport, base_url="http://test") as test_client:
+        headers = {"Idempotency-Key": "large"}
+        responses = [await test_client.post("/", json={}, headers=headers) for _ in range(2)]
+
+    assert [len(response.content) for response in responses] == [1200, 1200]
+    assert calls == 2
+    assert len(store.responses) == 0
@@ -0,0 +1,87 @@
+import re
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.api.middleware import RequestMetricsMiddleware
+from app.core.instrumentation import metrics_registry, query_guard
+from tests.helpers import api_path
+
+
+@pytest.mark.anyio
+async def test_server_timing_reports_queries_and_serialization(client: AsyncClient) -> None:
+    created = await client.post(
+        api_path("/departments"),
+        json={"name": "Urology", "organization_id": 90},
+    )
+    department_id = created.json()["data"]["id"]
+
+    created = await client.post(
+        api_path("/equipment"),
+        json={
+            "name": "Cystoscope",
+            "manufacturer": "Olympus",
+            "model_number": "CYF-5",
+            "category": "Endoscopy",
+            "status": "available",
+            "department_id": department_id,
+        },
+    )
+
+    response = await client.get(api_path(f"/equipment/{created.json()['data']['id']}"))
+
+    timing = response.headers["server-timing"]
+    statements = int(re.search(r'db;dur=[\d.]+;desc="(\d+) queries"', timing).group(1))
+    assert statements >= 1
+    assert "serialization;dur=" in timing
+    assert "total;dur=" in timing
+
+
+@pytest.mark.anyio
+async def test_metrics_endpoint_exposes_route_histograms(client: AsyncClient) -> None:
+    metrics_registry.clear()
+    await client.get(api_path("/equipment/999999"))
+    await client.get(api_path("/equipment/999999"))
+
+    response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    route = api_path("/equipment/{equipment_id}")
+    body = response.text
+    assert f'http_request_duration_seconds_count{{method="GET",route="{route}"}} 2' in body
+    assert f'http_request_duration_seconds_bucket{{method="GET",route="{route}",le="+Inf"}} 2' in (
+        body
+    )
+    assert f'http_requests_total{{method="GET",route="{route}",status="404"}} 2' in body
+    assert "server-timing" not in response.headers
+
+
+@pytest.mark.anyio
+async def test_queries_run_while_streaming_the_body_are_recorded(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'stream.db'}")
+
+    async def streaming_app(scope, receive, send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        async with engine.connect() as conn:
+            for _ in range(3):
+                await conn.execute(text("SELECT 1"))
+                await send({"type": "http.response.body", "body": b"row\n", "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+    monkeypatch.setattr(query_guard, "enabled", True)
+    monkeypatch.setattr(query_guard, "budget", 2)
+    query_guard.clear()
+    metrics_registry.clear()
+    transport = ASGITransport(app=RequestMetricsMiddleware(streaming_app))
+    async with AsyncClient(transport=transport, base_url="http://test") as test_client:
+        response = await test_client.get("/export")
+    await engine.dispose()
+
+    assert response.text == "row\n" * 3
+    assert 'db_statements_total{method="GET",route="unmatched"} 3' in metrics_registry.render()
+    assert [entry["statements"] for entry in query_guard.over_budget] == [3]
@@ -0,0 +1,120 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.repositories.enums import EquipmentStatus
+from app.schemas.ai import AIAssessmentInput
+from app.services import llm_provider_service
+from app.services.ai_assessment_service import AIAssessmentService
+from app.services.llm_provider_service import (
+    HTTPLLMProvider,
+    LLMConfigurationError,
+    LLMProviderError,
+    get_llm_provider,
+)
+from app.services.llm_stub_server import create_stub_app
+
+EQUIPMENT = SimpleNamespace(
+    id=1,
+    name="Infusion Pump",
+    manufacturer="Baxter",
+    model_number="B-1",
+    category="Pump",
+    status=EquipmentStatus.IN_USE,
+)
+PAYLOAD = AIAssessmentInput(environment="Ward", usage_pattern="Daily", internet_connected=True)
+
+
+def _provider(stub, **kwargs) -> HTTPLLMProvider:
+    return HTTPLLMProvider(
+        base_url="http://llm-stub",
+        model="stub-model",
+        transport=httpx.ASGITransport(app=stub),
+        backoff_seconds=0.001,
+        **kwargs,
+    )
+
+
+@pytest.mark.anyio
+async def test_provider_matches_mock_scoring() -> None:
+    provider = _provider(create_stub_app())
+
+    assessment = await provider.assess(EQUIPMENT, PAYLOAD, organization_id=1, coalesce_key="k")
+
+    assert assessment == AIAssessmentService().generate(EQUIPMENT, PAYLOAD)
+    await provider.aclose()
+
+
+@pytest.mark.anyio
+async def test_identical_concurrent_assessments_share_one_upstream_call() -> None:
+    stub = create_stub_app(latency_seconds=0.05)
+    provider = _provider(stub)
+
+    results = await asyncio.gather(
+        *(provider.assess(EQUIPMENT, PAYLOAD, 1, coalesce_key="same") for _ in range(5))
+    )
+
+    assert len({result.model_dump_json() for result in results}) == 1
+    assert stub.state.calls == 1
+    assert provider.stats()["coalesced_calls"] == 4
+    await provider.aclose()
+
+
+@pytest.mark.anyio
+async def test_retries_with_backoff_then_gives_up() -> None:
+    recovering = create_stub_app(fail_first=2)
+    provider = _provider(recovering, max_retries=3)
+    await provider.assess(EQUIPMENT, PAYLOAD, 1, coalesce_key="a")
+    assert recovering.state.calls == 3
+    await provider.aclose()
+
+    failing = create_stub_app(fail_first=100)
+    provider = _provider(failing, max_retries=2)
+    with pytest.raises(LLMProviderError):
+        await provider.assess(EQUIPMENT, PAYLOAD, 1, coalesce_key="b")
+    assert failing.state.calls == 3
+    await provider.aclose()
+
+
+@pytest.mark.anyio
+async def test_per_organization_limit_bounds_concurrency() -> None:
+    stub = create_stub_app(latency_seconds=0.02)
+    provider = _provider(stub, max_concurrency_per_org=2)
+
+    await asyncio.gather(
+        *(provider.assess(EQUIPMENT, PAYLOAD, 7, coalesce_key=str(index)) for index in range(6))
+    )
+
+    assert stub.state.calls == 6
+    assert stub.state.peak_in_flight == 2
+    await provider.aclose()
+
+
+@pytest.mark.anyio
+async def test_cancelled_leader_releases_coalesced_followers() -> None:
+    stub = create_stub_app(latency_seconds=1.0)
+    provider = _provider(stub)
+
+    leader = asyncio.create_task(provider.assess(EQUIPMENT, PAYLOAD, 1, coalesce_key="c"))
+    await asyncio.sleep(0.01)
+    follower = asyncio.create_task(provider.assess(EQUIPMENT, PAYLOAD, 1, coalesce_key="c"))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    with pytest.raises(LLMProviderError):
+        await asyncio.wait_for(follower, timeout=1)
+    assert leader.cancelled()
+    assert provider.stats()["in_flight"] == 0
+    await provider.aclose()
+
+
+def test_http_provider_requires_a_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "llm_provider", "http")
+    monkeypatch.setattr(settings, "llm_model", None)
+    monkeypatch.setattr(llm_provider_service, "_provider", None)
+
+    with pytest.raises(LLMConfigurationError, match="LLM_MODEL"):
+        get_llm_provider()
@@ -0,0 +1,145 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+
+from app.core.database import get_db
+from app.main import app
+from app.repositories.inventory_counter import InventoryCounter
+from app.repositories.pending_request_counter import PendingRequestCounter
+from app.services.organization_summary_service import OrganizationSummaryService
+from tests.helpers import api_path, create_department, equipment_body
+
+
+async def _equipment(client: AsyncClient, department_id: int, name: str, status: str) -> int:
+    response = await client.post(
+        api_path("/equipment"),
+        json=equipment_body(department_id, name=name, status=status),
+    )
+    return response.json()["data"]["id"]
+
+
+async def _request(client: AsyncClient, equipment_id: int, priority: int) -> int:
+    response = await client.post(
+        api_path("/equipment-requests"),
+        json={
+            "equipment_id": equipment_id,
+            "requested_by": f"Nurse {priority}",
+            "justification": "Night shift coverage",
+            "priority": priority,
+            "organization_id": 61,
+        },
+    )
+    return response.json()["data"]["id"]
+
+
+async def _summary(client: AsyncClient, organization_id: int = 61) -> dict:
+    response = await client.get(api_path(f"/organizations/{organization_id}/summary"))
+    assert response.status_code == 200
+    return response.json()["data"]
+
+
+async def _seed(client: AsyncClient) -> tuple[int, int, list[int], list[int]]:
+    icu = await create_department(client, "ICU", 61)
+    er = await create_department(client, "ER", 61)
+    equipment_ids = [
+        await _equipment(client, icu, "Monitor A", "available"),
+        await _equipment(client, icu, "Monitor B", "in_use"),
+        await _equipment(client, er, "Monitor C", "available"),
+    ]
+    request_ids = [
+        await _request(client, equipment_ids[0], 1),
+        await _request(client, equipment_ids[1], 3),
+        await _request(client, equipment_ids[2], 3),
+    ]
+    return icu, er, equipment_ids, request_ids
+
+
+@pytest.mark.anyio
+async def test_summary_follows_equipment_and_request_writes(client: AsyncClient) -> None:
+    icu, er, equipment_ids, request_ids = await _seed(client)
+    await create_department(client, "Empty ward", 61)
+    await create_department(client, "ICU", 62)
+
+    summary = await _summary(client)
+    assert summary["equipment"]["total"] == 3
+    assert summary["equipment"]["by_status"] == {
+        "available": 2,
+        "in_use": 1,
+        "maintenance": 0,
+        "decommissioned": 0,
+    }
+    departments = {item["department_name"]: item for item in summary["equipment"]["departments"]}
+    assert set(departments) == {"ICU", "ER", "Empty ward"}
+    assert departments["ICU"]["total"] == 2
+    assert departments["Empty ward"]["total"] == 0
+    assert summary["pending_requests"] == {
+        "total": 3,
+        "by_priority": {"1": 1, "2": 0, "3": 2, "4": 0, "5": 0},
+    }
+
+    # Moving equipment to another department and status shifts both buckets.
+    await client.put(
+        api_path(f"/equipment/{equipment_ids[0]}"),
+        json=equipment_body(er, name="Monitor A", status="maintenance"),
+    )
+    await client.patch(api_path(f"/equipment-requests/{request_ids[1]}/approve"))
+
+    summary = await _summary(client)
+    departments = {item["department_name"]: item for item in summary["equipment"]["departments"]}
+    assert departments["ICU"]["by_status"] == {
+        "available": 0,
+        "in_use": 1,
+        "maintenance": 0,
+        "decommissioned": 0,
+    }
+    assert departments["ER"]["by_status"]["maintenance"] == 1
+    assert summary["equipment"]["total"] == 3
+    assert summary["pending_requests"]["by_priority"]["3"] == 1
+    assert summary["pending_requests"]["total"] == 2
+
+    other = await _summary(client, organization_id=62)
+    assert other["equipment"]["total"] == 0
+    assert other["pending_requests"]["total"] == 0
+
+
+@pytest.mark.anyio
+async def test_rebuild_repairs_drift(client: AsyncClient) -> None:
+    await _seed(client)
+    expected = await _summary(client)
+
+    async for session in app.dependency_overrides[get_db]():
+        await session.execute(update(InventoryCounter).values(count=InventoryCounter.count + 7))
+        await session.execute(update(PendingRequestCounter).values(count=0))
+        await session.commit()
+        assert (await _summary(client)) != expected
+
+        corrected = await OrganizationSummaryService(session).rebuild()
+        assert corrected["inventory_counters"] > 0
+        assert corrected["pending_request_counters"] == 2
+        assert await OrganizationSummaryService(session).rebuild() == {
+            "inventory_counters": 0,
+            "pending_request_counters": 0,
+        }
+
+    assert await _summary(client) == expected
+
+
+@pytest.mark.anyio
+async def test_moving_equipment_carries_its_request_counters(client: AsyncClient) -> None:
+    icu, er, equipment_ids, request_ids = await _seed(client)
+    await client.patch(api_path(f"/equipment-requests/{request_ids[1]}/approve"))
+
+    for equipment_id, name in ((equipment_ids[0], "Monitor A"), (equipment_ids[1], "Monitor B")):
+        response = await client.put(
+            api_path(f"/equipment/{equipment_id}"),
+            json=equipment_body(er, name=name),
+        )
+        assert response.status_code == 200
+    # Resolved against the equipment's new department.
+    await client.patch(api_path(f"/equipment-requests/{request_ids[0]}/reject"))
+
+    async for session in app.dependency_overrides[get_db]():
+        assert await OrganizationSummaryService(session).rebuild() == {
+            "inventory_counters": 0,
+            "pending_request_counters": 0,
+        }
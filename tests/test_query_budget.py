@@ -0,0 +1,103 @@
+import pytest
+from httpx import AsyncClient
+
+from app.core.instrumentation import count_queries, query_guard
+from tests.helpers import api_path
+
+
+async def _seed(client: AsyncClient, equipment_count: int = 5) -> tuple[int, list[int]]:
+    department = await client.post(
+        api_path("/departments"),
+        json={"name": "Nephrology", "organization_id": 95},
+    )
+    department_id = department.json()["data"]["id"]
+    equipment_ids = []
+    for index in range(equipment_count):
+        created = await client.post(
+            api_path("/equipment"),
+            json={
+                "name": f"Dialysis Machine {index}",
+                "manufacturer": "Fresenius",
+                "model_number": f"5008-{index}",
+                "category": "Dialysis",
+                "status": "available",
+                "department_id": department_id,
+            },
+        )
+        equipment_ids.append(created.json()["data"]["id"])
+    return department_id, equipment_ids
+
+
+def _request_body(equipment_id: int, requested_by: str = "Nurse Ito") -> dict:
+    return {
+        "equipment_id": equipment_id,
+        "requested_by": requested_by,
+        "justification": "Additional night shift capacity",
+        "priority": 2,
+        "organization_id": 95,
+    }
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("page_size", [2, 20])
+async def test_equipment_list_query_count_does_not_grow_with_page_size(
+    client: AsyncClient,
+    page_size: int,
+) -> None:
+    department_id, _ = await _seed(client)
+
+    with count_queries() as queries:
+        response = await client.get(
+            api_path("/equipment"),
+            params={"department_id": department_id, "page_size": page_size},
+        )
+
+    assert response.status_code == 200
+    assert queries.count <= 2, queries.statements
+
+
+@pytest.mark.anyio
+async def test_write_endpoints_stay_within_budget(client: AsyncClient) -> None:
+    _, equipment_ids = await _seed(client, 1)
+
+    with count_queries() as create_queries:
+        created = await client.post(
+            api_path("/equipment-requests"),
+            json=_request_body(equipment_ids[0]),
+        )
+    with count_queries() as approve_queries:
+        approved = await client.patch(
+            api_path(f"/equipment-requests/{created.json()['data']['id']}/approve")
+        )
+    with count_queries() as list_queries:
+        listed = await client.get(api_path("/equipment-requests"), params={"organization_id": 95})
+
+    assert (created.status_code, approved.status_code, listed.status_code) == (201, 200, 200)
+    # Validate, insert, status counter, pending-by-priority counter, change log.
+    assert create_queries.count <= 5, create_queries.statements
+    # One conditional UPDATE ... RETURNING, the two counter upserts and the change log.
+    assert approve_queries.count <= 4, approve_queries.statements
+    assert list_queries.count <= 2, list_queries.statements
+
+
+@pytest.mark.anyio
+async def test_guard_captures_slow_statements_and_over_budget_requests(
+    client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _, equipment_ids = await _seed(client, 1)
+    monkeypatch.setattr(query_guard, "enabled", True)
+    monkeypatch.setattr(query_guard, "slow_query_ms", 0.0)
+    monkeypatch.setattr(query_guard, "budget", 0)
+    query_guard.clear()
+
+    await client.get(api_path(f"/equipment/{equipment_ids[0]}"))
+    monkeypatch.setattr(query_guard, "enabled", False)
+    response = await client.get(api_path("/admin/slow-queries"))
+
+    data = response.json()["data"]
+    slow = data["slow_queries"][0]
+    assert slow["path"] == api_path(f"/equipment/{equipment_ids[0]}")
+    assert "FROM equipment" in slow["statement"]
+    assert isinstance(slow["plan"], list) and slow["plan"]
+    assert data["over_budget_requests"][0]["route"] == api_path("/equipment/{equipment_id}")
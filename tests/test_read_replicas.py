@@ -0,0 +1,94 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core import database
+from app.core.database import Base, ReplicaRouter, get_read_db
+from app.main import app
+from tests.helpers import api_path
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.anyio
+async def test_router_skips_unreachable_replicas_until_cooldown(tmp_path) -> None:
+    clock = FakeClock()
+    reachable = f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}"
+    unreachable = f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica.db'}"
+    only_unreachable = ReplicaRouter([unreachable], retry_seconds=30, clock=clock)
+    assert await only_unreachable.open_session() is None
+    await only_unreachable.dispose()
+
+    router = ReplicaRouter([unreachable, reachable], retry_seconds=30, clock=clock)
+    try:
+        for _ in range(3):
+            session = await router.open_session()
+            assert session is not None
+            assert session.get_bind() is router.engines[1].sync_engine
+            await session.close()
+        assert router._down_until[0] == 30
+
+        clock.now = 31
+        (tmp_path / "missing").mkdir()
+        bound = set()
+        for _ in range(2):
+            session = await router.open_session()
+            bound.add(session.get_bind())
+            await session.close()
+        assert bound == {replica.sync_engine for replica in router.engines}
+    finally:
+        await router.dispose()
+
+
+@pytest.mark.anyio
+async def test_reads_stick_to_primary_after_a_write(
+    client: AsyncClient,
+    tmp_path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # The replica has the schema but lags: it never receives the primary's rows.
+    router = ReplicaRouter([f"sqlite+aiosqlite:///{tmp_path / 'lagging.db'}"], 30)
+    async with router.engines[0].begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    monkeypatch.setattr(database, "replica_router", router)
+    monkeypatch.setattr("app.api.middleware.replica_router", router)
+    monkeypatch.setattr(
+        database,
+        "AsyncReadSessionLocal",
+        async_sessionmaker(bind=primary, expire_on_commit=False),
+    )
+    app.dependency_overrides.pop(get_read_db)
+
+    try:
+        department = await client.post(
+            api_path("/departments"),
+            json={"name": "Hematology", "organization_id": 97},
+        )
+        created = await client.post(
+            api_path("/equipment"),
+            json={
+                "name": "Centrifuge",
+                "manufacturer": "Eppendorf",
+                "model_number": "5810R",
+                "category": "Laboratory",
+                "status": "available",
+                "department_id": department.json()["data"]["id"],
+            },
+        )
+        assert database.PRIMARY_STICKY_COOKIE in created.headers["set-cookie"]
+        equipment_path = api_path(f"/equipment/{created.json()['data']['id']}")
+
+        assert (await client.get(equipment_path)).status_code == 200
+
+        client.cookies.clear()
+        assert (await client.get(equipment_path)).status_code == 404
+    finally:
+        await router.dispose()
+        await primary.dispose()
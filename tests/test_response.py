@@ -0,0 +1,53 @@
+import json
+from datetime import UTC, datetime
+
+from app.api.response import envelope_response, to_schema
+from app.repositories.enums import EquipmentStatus
+from app.repositories.equipment import Equipment
+from app.schemas.equipment import EquipmentRead
+
+
+def test_single_pass_envelope_matches_the_documented_shape() -> None:
+    created_at = datetime(2024, 3, 1, 8, 30, tzinfo=UTC)
+    rows = [
+        Equipment(
+            id=index,
+            name=f"Monitor-{index}",
+            manufacturer="Philips",
+            model_number=f"MX-{index}",
+            category="Patient Monitor",
+            status=EquipmentStatus.AVAILABLE,
+            department_id=1,
+            created_at=created_at,
+            updated_at=created_at,
+        )
+        for index in range(2)
+    ]
+    pagination = {"page": 1, "page_size": 2, "total_items": 2, "total_pages": 1}
+
+    response = envelope_response(
+        "Equipment list fetched successfully",
+        {"items": to_schema(EquipmentRead, rows), "pagination": pagination},
+    )
+
+    assert json.loads(response.body) == {
+        "success": True,
+        "message": "Equipment list fetched successfully",
+        "data": {
+            "items": [
+                {
+                    "id": index,
+                    "name": f"Monitor-{index}",
+                    "manufacturer": "Philips",
+                    "model_number": f"MX-{index}",
+                    "category": "Patient Monitor",
+                    "status": "available",
+                    "department_id": 1,
+                    "created_at": "2024-03-01T08:30:00Z",
+                    "updated_at": "2024-03-01T08:30:00Z",
+                }
+                for index in range(2)
+            ],
+            "pagination": pagination,
+        },
+    }